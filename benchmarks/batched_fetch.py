@@ -0,0 +1,70 @@
+"""
+Swizzled reads on proxies with per-call latency, batched versus per part.
+
+Run with `python benchmarks/batched_fetch.py`. Every backend call sleeps for
+LATENCY seconds to simulate a round trip. Batched proxies define
+`__swizzle_get_many__` and fetch all parts of a name in one call.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle  # noqa: E402
+
+LATENCY = 0.0005
+NUMBER = 100
+NAMES = ["xy", "zyx", "wzyx", "xyzwxy"]
+
+
+class Backend:
+    def __init__(self):
+        self.data = {"x": 1, "y": 2, "z": 3, "w": 4}
+
+    def get(self, name):
+        time.sleep(LATENCY)
+        return self.data[name]
+
+    def get_many(self, names):
+        time.sleep(LATENCY)
+        return [self.data[name] for name in names]
+
+
+@swizzle(only_attrs=["x", "y", "z", "w"])
+class PerPart:
+    def __init__(self, backend):
+        self._backend = backend
+
+    def __getattr__(self, name):
+        try:
+            return self._backend.get(name)
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+@swizzle(only_attrs=["x", "y", "z", "w"])
+class Batched(PerPart):
+    def __swizzle_get_many__(self, names):
+        return self._backend.get_many(names)
+
+
+def measure(obj, name):
+    start = time.perf_counter()
+    for _ in range(NUMBER):
+        getattr(obj, name)
+    return (time.perf_counter() - start) / NUMBER
+
+
+def main():
+    backend = Backend()
+    per_part, batched = PerPart(backend), Batched(backend)
+    print(f"latency {LATENCY * 1e3:.1f}ms per call")
+    print(f"{'name':<8} {'per part':>10} {'batched':>10} {'speedup':>8}")
+    for name in NAMES:
+        a, b = measure(per_part, name), measure(batched, name)
+        print(f"{name:<8} {a * 1e3:>8.2f}ms {b * 1e3:>8.2f}ms {a / b:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
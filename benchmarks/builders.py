@@ -0,0 +1,44 @@
+"""
+Per-access cost of building swizzled results for different `type=` arguments.
+
+Run with `python benchmarks/builders.py`. Each class swizzles `zyx` from three
+plain instance attributes; only the result type differs.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle  # noqa: E402
+
+NUMBER = 100_000
+
+
+class Vec3(tuple):
+    @classmethod
+    def __swizzle_build__(cls, names, values):
+        return tuple.__new__(cls, values)
+
+
+def make_class(result_type):
+    @swizzle(type=result_type)
+    class Vector:
+        def __init__(self, x, y, z):
+            self.x = x
+            self.y = y
+            self.z = z
+
+    return Vector
+
+
+def main():
+    print(f"{'type':<16} {'ns/access':>10}")
+    for result_type in (swizzle.swizzledtuple, tuple, list, Vec3):
+        v = make_class(result_type)(1, 2, 3)
+        best = min(timeit.repeat(lambda: v.zyx, number=NUMBER, repeat=5))
+        print(f"{result_type.__name__:<16} {best / NUMBER * 1e9:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
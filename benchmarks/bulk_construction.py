@@ -0,0 +1,35 @@
+"""
+Compare bulk swizzledtuple construction with per-row `_make` calls.
+
+Run with `python benchmarks/bulk_construction.py`.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+from swizzle import swizzledtuple  # noqa: E402
+
+N = 200_000
+
+
+def main():
+    for arrange in ("x y z w", "w z y x x"):
+        Vec = swizzledtuple("Vec", "x y z w", arrange_names=arrange)
+        rows = [(i, i + 1, i + 2, i + 3) for i in range(N)]
+        columns = dict(zip(Vec._fields, zip(*rows)))
+        cases = {
+            "[Cls._make(r) for r in rows]": lambda: [Vec._make(r) for r in rows],
+            "[Cls(*r) for r in rows]": lambda: [Vec(*r) for r in rows],
+            "Cls._make_many(rows)": lambda: Vec._make_many(rows),
+            "Cls._from_columns(**columns)": lambda: Vec._from_columns(**columns),
+        }
+        print(f"arrange_names={arrange!r}, {N} rows")
+        for label, func in cases.items():
+            best = min(timeit.repeat(func, number=1, repeat=5))
+            print(f"  {label:<32} {best * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Swizzled assignment through `__setattr__` per part versus one bulk update.
+
+Run with `python benchmarks/bulk_setters.py`. The observable model validates
+and notifies listeners on every `__setattr__` call; `__swizzle_set__` does
+both once per swizzled assignment. The slots class compares the default
+per-part `object.__setattr__` path with the built-in member descriptor setter.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle  # noqa: E402
+from swizzle import get_bulk_setter, swizzle_attributes_retriever  # noqa: E402
+
+NUMBER = 100_000
+
+
+class Model:
+    __slots__ = ("x", "y", "z", "w", "listeners", "version")
+
+    def __init__(self):
+        object.__setattr__(self, "listeners", [lambda changes: None] * 3)
+        object.__setattr__(self, "version", 0)
+        for name in "xyzw":
+            object.__setattr__(self, name, 0.0)
+
+    def __setattr__(self, name, value):
+        self.__swizzle_set__({name: value})
+
+    def __swizzle_set__(self, values):
+        for value in values.values():
+            if not isinstance(value, (int, float)):
+                raise TypeError("Model fields must be numbers")
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "version", self.version + 1)
+        for listener in self.listeners:
+            listener(values)
+
+
+class Slots:
+    __slots__ = ("x", "y", "z", "w")
+
+
+def decorate(cls, bulk):
+    getter = cls.__getattribute__
+    setter = object.__setattr__ if cls is Slots else cls.__setattr__
+    new_getter, new_setter = swizzle_attributes_retriever(
+        getter,
+        only_attrs=["x", "y", "z", "w"],
+        setter=setter,
+        bulk_setter=get_bulk_setter(cls, setter) if bulk else None,
+    )
+    return type(cls.__name__, (cls,), {"__slots__": (), "__setattr__": new_setter})
+
+
+def bench(cls, bulk):
+    obj = decorate(cls, bulk)()
+    if cls is Slots:
+        obj.x = obj.y = obj.z = obj.w = 0.0
+    value = (1.0, 2.0, 3.0, 4.0)
+
+    def run():
+        obj.wzyx = value
+
+    return min(timeit.repeat(run, number=NUMBER, repeat=5)) / NUMBER * 1e9
+
+
+def main():
+    print(f"{'class':<10} {'per part':>10} {'bulk':>10}")
+    for cls in (Model, Slots):
+        per_part, bulk = bench(cls, False), bench(cls, True)
+        print(f"{cls.__name__:<10} {per_part:>8.0f}ns {bulk:>8.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Chained swizzles versus composed `swizzle.expr` chains.
+
+Run with `python benchmarks/chained_swizzles.py`. Chained access builds an
+intermediate result per step; the composed expression gathers the final
+attributes from the original object once.
+"""
+
+import os
+import sys
+import timeit
+from enum import IntEnum
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle  # noqa: E402
+from swizzle import swizzledtuple  # noqa: E402
+
+NUMBER = 100_000
+
+
+@swizzle
+class Vector:
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+@swizzle(only_attrs=["x", "y", "z"])
+class Restricted:
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+@swizzle(meta=True)
+class Axis(IntEnum):
+    X = 1
+    Y = 2
+    Z = 3
+
+
+def cases():
+    t = swizzledtuple("T", "x y z")(1, 2, 3)
+    v, r = Vector(1, 2, 3), Restricted(1, 2, 3)
+    two, three = swizzle.expr("yzx", "xxzyzz"), swizzle.expr("yzx", "xxzyzz", "zyx")
+    upper = swizzle.expr("YXZ", "ZZ")
+    return [
+        ("swizzledtuple 2 steps", lambda: t.yzx.xxzyzz, lambda: two(t)),
+        ("swizzledtuple 3 steps", lambda: t.yzx.xxzyzz.zyx, lambda: three(t)),
+        ("class 2 steps", lambda: v.yzx.xxzyzz, lambda: two(v)),
+        ("class 3 steps", lambda: v.yzx.xxzyzz.zyx, lambda: three(v)),
+        ("only_attrs 3 steps", lambda: r.yzx.xxzyzz.zyx, lambda: three(r)),
+        ("meta enum 2 steps", lambda: Axis.YXZ.ZZ, lambda: upper(Axis)),
+    ]
+
+
+def main():
+    print(f"{'case':<24} {'chained':>10} {'expr':>10} {'speedup':>8}")
+    for label, chained, composed in cases():
+        assert chained() == composed()
+        a = min(timeit.repeat(chained, number=NUMBER, repeat=5)) / NUMBER
+        b = min(timeit.repeat(composed, number=NUMBER, repeat=5)) / NUMBER
+        print(f"{label:<24} {a * 1e9:>8.0f}ns {b * 1e9:>8.0f}ns {a / b:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
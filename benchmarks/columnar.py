@@ -0,0 +1,84 @@
+"""
+Projection cost of swizzle.io column files against reading whole rows.
+
+Run with `python benchmarks/columnar.py`. A file of ROWS rows with fifty
+float columns is written once; reading three columns through a swizzle
+projection is compared with reading all of them, and with a CSV file of the
+same rows.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+from swizzle import swizzledtuple  # noqa: E402
+from swizzle.io import read_columns, read_csv, write_columns, write_csv  # noqa: E402
+
+ROWS = 200_000
+FIELDS = ["x", "y", "z"] + [f"c{i}" for i in range(47)]
+
+
+def best(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    Row = swizzledtuple("Row", FIELDS, sep="_")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "rows.swzc")
+        csv_path = os.path.join(tmp, "rows.csv")
+
+        def rows():
+            return (
+                Row(*(i + j * 0.5 for j in range(len(FIELDS)))) for i in range(ROWS)
+            )
+
+        generate = best(lambda: sum(1 for _ in rows()), repeat=1)
+        write = best(lambda: write_columns(path, rows()), repeat=1)
+        print(f"write {ROWS} x {len(FIELDS)}   {(write - generate) * 1e3:>8.0f}ms")
+        write_csv(csv_path, (Row(*range(i, i + len(FIELDS))) for i in range(ROWS)))
+
+        def columns_3():
+            with read_columns(path) as ds:
+                columns = ds.z_y_x
+                sum(columns.x), sum(columns.y), sum(columns.z)
+                del columns
+
+        def columns_all():
+            with read_columns(path) as ds:
+                for name in FIELDS:
+                    sum(ds.column(name))
+
+        def rows_3():
+            with read_columns(path) as ds:
+                for row in ds.rows("z_y_x"):
+                    pass
+
+        def rows_all():
+            with read_columns(path) as ds:
+                for row in ds:
+                    pass
+
+        def csv_3():
+            for row in read_csv(csv_path, fields="z_y_x", sep="_"):
+                pass
+
+        for label, func in (
+            ("columns, 3 of 50", columns_3),
+            ("columns, all 50", columns_all),
+            ("rows, 3 of 50", rows_3),
+            ("rows, all 50", rows_all),
+            ("read_csv, 3 of 50", csv_3),
+        ):
+            print(f"{label:<20} {best(func) * 1e3:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
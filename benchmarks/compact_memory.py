@@ -0,0 +1,52 @@
+"""
+Per-instance memory of regular and compact swizzledtuples.
+
+Run with `python benchmarks/compact_memory.py`. Sizes are `sys.getsizeof`
+of one instance; the values themselves are shared and not counted.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+from swizzle import swizzledtuple  # noqa: E402
+
+ARRANGEMENTS = [
+    ("x y z", "x y z"),
+    ("x y z", "x x z y z z"),
+    ("x y", "x x x y y y"),
+    ("r g b a", " ".join("rgba" * 4)),
+    ("x", " ".join("x" * 64)),
+]
+
+
+def main():
+    print(f"{'arrangement':<36} {'regular':>8} {'compact':>8} {'saved':>6}")
+    for fields, arrange in ARRANGEMENTS:
+        values = range(len(fields.split()))
+        regular = swizzledtuple("T", fields, arrange_names=arrange)(*values)
+        compact = swizzledtuple("T", fields, arrange_names=arrange, compact=True)(
+            *values
+        )
+        a, b = sys.getsizeof(regular), sys.getsizeof(compact)
+        label = arrange if len(arrange) < 36 else arrange[:32] + " ..."
+        print(f"{label:<36} {a:>8} {b:>8} {1 - b / a:>6.0%}")
+
+    print()
+    v = swizzledtuple("V", "x y z")(1, 2, 3)
+    c = swizzledtuple("V", "x y z", compact=True)(1, 2, 3)
+    r, rc = v.xxzyzz, c.xxzyzz
+    number = 200_000
+    for label, func in [
+        ("regular r[3]", lambda: r[3]),
+        ("compact r[3]", lambda: rc[3]),
+        ("regular tuple(r)", lambda: tuple(r)),
+        ("compact tuple(r)", lambda: tuple(rc)),
+    ]:
+        best = min(timeit.repeat(func, number=number, repeat=5))
+        print(f"{label:<20} {best / number * 1e9:8.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
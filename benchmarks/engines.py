@@ -0,0 +1,54 @@
+"""
+Swizzled access time per `engine=` choice, and the cost of `verify=True`.
+
+Run with `python benchmarks/engines.py`. Every engine that supports the
+options of a row is timed on the same swizzle name.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle  # noqa: E402
+
+NUMBER = 50_000
+
+ROWS = [
+    ("single letters", ["x", "y", "z", "w"], None, "wzyx"),
+    ("separated", ["pos", "vel", "acc"], "_", "acc_vel_pos"),
+    ("mixed lengths", ["x", "y", "zw", "uvw"], None, "uvwzwxy"),
+]
+
+
+def make(only_attrs, sep, **options):
+    @swizzle(only_attrs=only_attrs, sep=sep, **options)
+    class Obj:
+        def __init__(self):
+            for i, name in enumerate(only_attrs):
+                setattr(self, name, i)
+
+    return Obj()
+
+
+def main():
+    header = "".join(f"{e:>11}" for e in swizzle.ENGINES + ("verify",))
+    print(f"{'attributes':<16}{header}")
+    for label, only_attrs, sep, name in ROWS:
+        cells = []
+        for engine in swizzle.ENGINES:
+            try:
+                obj = make(only_attrs, sep, engine=engine)
+            except ValueError:
+                cells.append(f"{'-':>11}")
+                continue
+            t = min(timeit.repeat(lambda: getattr(obj, name), number=NUMBER, repeat=5))
+            cells.append(f"{t / NUMBER * 1e9:>9.0f}ns")
+        obj = make(only_attrs, sep, verify=True)
+        t = min(timeit.repeat(lambda: getattr(obj, name), number=NUMBER, repeat=5))
+        cells.append(f"{t / NUMBER * 1e9:>9.0f}ns")
+        print(f"{label:<16}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
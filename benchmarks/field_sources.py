@@ -0,0 +1,78 @@
+"""
+Swizzled reads on slots, dataclass and NamedTuple classes per `only_attrs` source.
+
+Run with `python benchmarks/field_sources.py`. With an `AttrSource` the field
+set is known when decorating and parts are read directly; with an explicit
+list of the same names every part goes through the generic lookup.
+"""
+
+import os
+import sys
+import timeit
+from dataclasses import dataclass
+from typing import NamedTuple
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle  # noqa: E402
+from swizzle import AttrSource  # noqa: E402
+
+NUMBER = 50_000
+NAMES = ["x", "y", "z", "w"]
+
+
+def slots(only_attrs):
+    @swizzle(only_attrs=only_attrs)
+    class Slots:
+        __slots__ = ("x", "y", "z", "w")
+
+        def __init__(self):
+            self.x, self.y, self.z, self.w = 1, 2, 3, 4
+
+    return Slots()
+
+
+def fields(only_attrs, slots=False):
+    @swizzle(only_attrs=only_attrs)
+    @dataclass(slots=slots)
+    class Fields:
+        x: int = 1
+        y: int = 2
+        z: int = 3
+        w: int = 4
+
+    return Fields()
+
+
+def named_tuple(only_attrs):
+    @swizzle(only_attrs=only_attrs)
+    class Tuple(NamedTuple):
+        x: int = 1
+        y: int = 2
+        z: int = 3
+        w: int = 4
+
+    return Tuple()
+
+
+CASES = [
+    ("__slots__", slots, AttrSource.SLOTS),
+    ("dataclass", fields, AttrSource.FIELDS),
+    ("dataclass(slots)", lambda a: fields(a, slots=True), AttrSource.FIELDS),
+    ("NamedTuple", named_tuple, AttrSource.FIELDS),
+]
+
+
+def main():
+    print(f"{'class':<18} {'list':>10} {'AttrSource':>11} {'speedup':>8}")
+    for label, make, source in CASES:
+        times = []
+        for obj in (make(NAMES), make(source)):
+            assert obj.wzyx == (4, 3, 2, 1)
+            t = min(timeit.repeat(lambda: obj.wzyx, number=NUMBER, repeat=5))
+            times.append(t / NUMBER)
+        a, b = times
+        print(f"{label:<18} {a * 1e9:>8.0f}ns {b * 1e9:>9.0f}ns {a / b:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
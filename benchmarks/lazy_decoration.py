@@ -0,0 +1,53 @@
+"""
+Decoration cost of many swizzled classes, with and without `swizzle.prepare`.
+
+Run with `python benchmarks/lazy_decoration.py`. Simulates the import of a
+module defining CLASSES decorated classes, then times the first swizzled
+access on each of them.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle  # noqa: E402
+
+CLASSES = 500
+
+
+def define(index):
+    only_attrs = ["x", "y", f"z{index}", f"uv{index}"]
+
+    class Obj:
+        def __init__(self):
+            for i, name in enumerate(only_attrs):
+                setattr(self, name, i)
+
+    return swizzle(Obj, only_attrs=only_attrs), "yx" + only_attrs[2]
+
+
+def main():
+    start = time.perf_counter()
+    defined = [define(i) for i in range(CLASSES)]
+    decorate = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for cls, _ in defined:
+        swizzle.prepare(cls)
+    prepare = time.perf_counter() - start
+
+    fresh = [define(i) for i in range(CLASSES)]
+    start = time.perf_counter()
+    for cls, name in fresh:
+        getattr(cls(), name)
+    first = time.perf_counter() - start
+
+    print(f"{CLASSES} classes")
+    print(f"decorate      {decorate * 1e3:>8.1f}ms")
+    print(f"prepare       {prepare * 1e3:>8.1f}ms")
+    print(f"first access  {first * 1e3:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
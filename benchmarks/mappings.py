@@ -0,0 +1,44 @@
+"""
+Compare swizzled mapping access with hand-written itemgetter code.
+
+Run with `python benchmarks/mappings.py`. Every variant extracts
+`name, age, city` from the same dict.
+"""
+
+import os
+import sys
+import timeit
+from operator import itemgetter
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle  # noqa: E402
+
+NUMBER = 500_000
+KEYS = ["name", "age", "city", "country", "email"]
+
+data = {"name": "Jane", "age": 30, "city": "Berlin", "country": "DE", "email": "-"}
+getter = itemgetter("name", "age", "city")
+restricted = swizzle.mapping(data, sep="_", only_keys=KEYS)
+restricted_tuple = swizzle.mapping(data, sep="_", only_keys=KEYS, type=tuple)
+unrestricted = swizzle.mapping(data, sep="_")
+
+CASES = {
+    "itemgetter": lambda: getter(data),
+    "subscripts": lambda: (data["name"], data["age"], data["city"]),
+    "mapping (only_keys)": lambda: restricted.name_age_city,
+    "mapping (only_keys, tuple)": lambda: restricted_tuple.name_age_city,
+    "mapping (any key)": lambda: unrestricted.name_age_city,
+    "wrap + access": lambda: (
+        swizzle.mapping(data, sep="_", only_keys=KEYS).name_age_city
+    ),
+}
+
+
+def main():
+    for label, func in CASES.items():
+        best = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f"{label:<28} {best / NUMBER * 1e9:8.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Startup cost of decorating at import time versus loading exported accessors.
+
+Run with `python benchmarks/precompiled_import.py`. Each measurement is a
+fresh interpreter that imports a module with one decorated class and reads
+every hot swizzle name once, so the runtime path pays for parsing and
+result class generation while the precompiled path imports a module
+written by `python -m swizzle.compile`. `import swizzle` itself is excluded.
+"""
+
+import itertools
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.realpath(os.path.dirname(__file__) + "/..")
+sys.path.insert(0, ROOT)
+
+MODEL = """\
+import swizzle
+
+@swizzle(only_attrs=["x", "y", "z", "w"], precompiled={precompiled!r})
+class Vector:
+    def __init__(self, x, y, z, w):
+        self.x, self.y, self.z, self.w = x, y, z, w
+"""
+
+RUN = """\
+import sys, time
+import swizzle
+start = time.perf_counter()
+import {module}
+v = {module}.Vector(1, 2, 3, 4)
+for name in {names!r}:
+    getattr(v, name)
+print(time.perf_counter() - start)
+"""
+
+
+def measure(tmp, module, names, repeat=7):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, tmp]))
+    code = RUN.format(module=module, names=names)
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(repeat)
+    )
+
+
+def main():
+    print(f"{'names':>6} {'runtime':>10} {'precompiled':>12} {'speedup':>8}")
+    for count in (10, 50, 200):
+        names = [
+            "".join(p) for p in itertools.islice(itertools.product("xyzw", repeat=4), count)
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "runtime_models.py"), "w") as f:
+                f.write(MODEL.format(precompiled=None))
+            with open(os.path.join(tmp, "aot_models.py"), "w") as f:
+                f.write(MODEL.format(precompiled="_aot_vector"))
+            env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, tmp]))
+            subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "swizzle.compile",
+                    "runtime_models:Vector",
+                    "--names",
+                    *names,
+                    "-o",
+                    os.path.join(tmp, "_aot_vector.py"),
+                ],
+                env=env,
+                check=True,
+            )
+            # Compile to bytecode once, as an installed package would be.
+            subprocess.run(
+                [sys.executable, "-m", "compileall", "-q", tmp], env=env, check=True
+            )
+            runtime = measure(tmp, "runtime_models", names)
+            precompiled = measure(tmp, "aot_models", names)
+        print(
+            f"{count:>6} {runtime * 1e3:>8.2f}ms {precompiled * 1e3:>10.2f}ms "
+            f"{runtime / precompiled:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
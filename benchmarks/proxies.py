@@ -0,0 +1,45 @@
+"""
+Cost of swizzle.wrap proxies and accessors against hand-written attrgetter code.
+
+Run with `python benchmarks/proxies.py`. Reads `year_month_day` of a
+`datetime`, which cannot be decorated.
+"""
+
+import datetime
+import os
+import sys
+import timeit
+from operator import attrgetter
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle  # noqa: E402
+
+NUMBER = 200_000
+
+
+def cases():
+    dt = datetime.datetime(2024, 5, 6, 7, 8, 9)
+    ymd = attrgetter("year", "month", "day")
+    swizzler = swizzle.register(datetime.datetime, sep="_")
+    accessor = swizzler.accessor("year_month_day")
+    wrapped = swizzle.wrap(dt)
+    wrap = swizzle.wrap
+    return [
+        ("attrgetter", lambda: ymd(dt)),
+        ("accessor", lambda: accessor(dt)),
+        ("wrap", lambda: wrap(dt)),
+        ("proxy access", lambda: wrapped.year_month_day),
+        ("wrap + access", lambda: wrap(dt).year_month_day),
+        ("wrap + single", lambda: wrap(dt).year),
+        ("dt.year", lambda: dt.year),
+    ]
+
+
+def main():
+    for label, func in cases():
+        t = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+        print(f"{label:<16} {t * 1e9:>7.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
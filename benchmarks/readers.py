@@ -0,0 +1,78 @@
+"""
+Compare swizzle.io readers with the csv module.
+
+Run with `python benchmarks/readers.py`. Each reader consumes the same generated
+CSV file with twelve columns; the projected variants keep three of them.
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+from swizzle.io import read_csv, write_csv  # noqa: E402
+
+N = 200_000
+HEADER = ["x", "y", "z"] + [f"col{i}" for i in range(9)]
+
+
+def make_file(path):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        for i in range(N):
+            writer.writerow([i, i + 1, i + 2] + [f"value{j}" for j in range(9)])
+
+
+def bench(path):
+    def dict_reader():
+        with open(path, newline="") as f:
+            for row in csv.DictReader(f):
+                pass
+
+    def plain_reader():
+        with open(path, newline="") as f:
+            for row in csv.reader(f):
+                pass
+
+    def swizzle_reader():
+        for row in read_csv(path):
+            pass
+
+    def dict_reader_projected():
+        with open(path, newline="") as f:
+            for row in csv.DictReader(f):
+                (float(row["z"]), float(row["y"]), float(row["x"]))
+
+    def swizzle_reader_projected():
+        converters = dict.fromkeys("xyz", float)
+        for row in read_csv(path, fields="zyx", converters=converters):
+            pass
+
+    def swizzle_roundtrip():
+        write_csv(os.devnull, read_csv(path))
+
+    return (
+        dict_reader,
+        plain_reader,
+        swizzle_reader,
+        dict_reader_projected,
+        swizzle_reader_projected,
+        swizzle_roundtrip,
+    )
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "rows.csv")
+        make_file(path)
+        print(f"{N} rows x {len(HEADER)} columns")
+        for func in bench(path):
+            best = min(timeit.repeat(func, number=1, repeat=3))
+            print(f"{func.__name__:<26} {best * 1e3:8.1f} ms {N / best:12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Compare swizzle.sqlite row factories with plain tuples and sqlite3.Row.
+
+Run with `python benchmarks/sqlite_rows.py [rows]`. Each variant fetches all
+rows of an in-memory table with ten columns and reads two of them by name
+(by index for plain tuples); the projected variants only return those two.
+"""
+
+import os
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+from swizzle.sqlite import make_row_factory, query, row_factory  # noqa: E402
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+COLUMNS = ["id", "lon", "lat", "name"] + [f"v{i}" for i in range(6)]
+
+
+def make_db():
+    connection = sqlite3.connect(":memory:")
+    connection.execute(f"CREATE TABLE places ({', '.join(COLUMNS)})")
+    connection.executemany(
+        f"INSERT INTO places VALUES ({', '.join('?' * len(COLUMNS))})",
+        ((i, i * 0.5, i * 0.25, f"place{i}", *range(i, i + 6)) for i in range(N)),
+    )
+    return connection
+
+
+def variants(connection):
+    def cursor(factory):
+        cursor = connection.cursor()
+        cursor.row_factory = factory
+        return cursor
+
+    def plain():
+        for row in connection.execute("SELECT * FROM places"):
+            row[1], row[2]
+
+    def sqlite_row():
+        for row in cursor(sqlite3.Row).execute("SELECT * FROM places"):
+            row["lon"], row["lat"]
+
+    def swizzled():
+        for row in cursor(row_factory).execute("SELECT * FROM places"):
+            row.lon, row.lat
+
+    def plain_projected():
+        for row in connection.execute("SELECT lon, lat FROM places"):
+            row[0], row[1]
+
+    def swizzled_filtered():
+        factory = make_row_factory(fields="lon_lat", sep="_")
+        for row in cursor(factory).execute("SELECT * FROM places"):
+            row.lon, row.lat
+
+    def swizzled_query():
+        for row in query(connection, "SELECT * FROM places", fields="lon_lat", sep="_"):
+            row.lon, row.lat
+
+    return [
+        ("tuple", plain),
+        ("sqlite3.Row", sqlite_row),
+        ("row_factory", swizzled),
+        ("tuple, 2 cols", plain_projected),
+        ("row_factory fields=", swizzled_filtered),
+        ("query fields=", swizzled_query),
+    ]
+
+
+def main():
+    connection = make_db()
+    print(f"{N} rows")
+    for label, func in variants(connection):
+        times = []
+        for _ in range(3):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        print(f"{label:<20} {min(times) * 1e3:>8.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
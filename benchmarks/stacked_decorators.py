@@ -0,0 +1,53 @@
+"""
+Swizzled access on hierarchies where every level is decorated.
+
+Run with `python benchmarks/stacked_decorators.py`. Level n is a chain of n
+classes each decorated with `swizzle`; the access time of the most-derived
+class should not grow with n.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle  # noqa: E402
+
+NUMBER = 50_000
+
+
+def hierarchy(levels, **options):
+    @swizzle(**options)
+    class Base:
+        X, Y, Z = 1, 2, 3
+
+        def __init__(self):
+            self.x, self.y, self.z = 1, 2, 3
+
+    cls = Base
+    for _ in range(levels - 1):
+        cls = swizzle(type("Level", (cls,), {}), **options)
+    return cls
+
+
+def main():
+    print(f"{'levels':>6} {'instance':>10} {'miss':>10} {'meta':>10}")
+    for levels in range(1, 6):
+        obj = hierarchy(levels, only_attrs=["x", "y", "z"])()
+        meta = hierarchy(levels, meta=True)
+
+        def miss():
+            try:
+                obj.xw
+            except AttributeError:
+                pass
+
+        cells = []
+        for func in (lambda: obj.zyx, miss, lambda: meta.ZYX):
+            t = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+            cells.append(f"{t * 1e9:>8.0f}ns")
+        print(f"{levels:>6} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
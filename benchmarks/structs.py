@@ -0,0 +1,52 @@
+"""
+Compare swizzled record views with decoding whole records first.
+
+Run with `python benchmarks/structs.py`. Every variant reads `zyx` from each
+record of the same buffer.
+"""
+
+import os
+import struct
+import sys
+import timeit
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+from swizzle import swizzledstruct, swizzledtuple  # noqa: E402
+
+N = 100_000
+LAYOUT = "x:f y:f z:f w:f " + " ".join(f"pad{i}:d" for i in range(12))
+
+Rec = swizzledstruct("Rec", LAYOUT)
+Full = swizzledtuple("Rec", Rec._fields)
+buffer = bytearray(Rec.size * N)
+full = struct.Struct(Rec.format)
+
+
+def decode_then_swizzle():
+    for values in full.iter_unpack(buffer):
+        Full(*values).zyx
+
+
+def plain_struct():
+    for values in full.iter_unpack(buffer):
+        (values[2], values[1], values[0])
+
+
+def record_views():
+    for rec in Rec.view(buffer):
+        rec.zyx
+
+
+def column_extraction():
+    Rec.view(buffer).zyx
+
+
+def main():
+    print(f"{N} records of {Rec.size} bytes")
+    for func in (decode_then_swizzle, plain_struct, record_views, column_extraction):
+        best = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{func.__name__:<20} {best * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Cost of creating swizzledtuple classes: time and memory per class.
+
+Run with `python benchmarks/swizzledtuple_classes.py`. Classes are created
+with the same field set under different type names (as result classes of
+swizzled reads are), and with a new field set each. Memory is the traced
+allocation per class, kept alive until measured.
+"""
+
+import gc
+import os
+import sys
+import time
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+from swizzle import swizzledtuple  # noqa: E402
+
+CLASSES = 1000
+
+
+def create(same_fields):
+    classes = []
+    for i in range(CLASSES):
+        fields = "x y z w" if same_fields else f"x{i} y{i} z{i} w{i}"
+        classes.append(swizzledtuple(f"T{i}", fields))
+    return classes
+
+
+def measure(same_fields):
+    gc.collect()
+    start = time.perf_counter()
+    create(same_fields)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    classes = create(same_fields)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del classes
+    return elapsed / CLASSES, size / CLASSES
+
+
+def main():
+    print(f"{'fields':<14} {'create':>10} {'memory':>12}")
+    for label, same_fields in (("shared set", True), ("distinct sets", False)):
+        t, size = measure(same_fields)
+        print(f"{label:<14} {t * 1e6:>8.1f}us {size / 1024:>9.1f}KiB")
+    v = swizzledtuple("V", "x y z")(1, 2, 3)
+    t = min(timeit.repeat(lambda: v.zyx, number=100_000, repeat=5)) / 100_000
+    print(f"\nswizzled read v.zyx {t * 1e9:.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
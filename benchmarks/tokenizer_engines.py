@@ -0,0 +1,71 @@
+"""
+Compare the trie and regex tokenizers used for `only_attrs` vocabularies.
+
+Run with `python benchmarks/tokenizer_engines.py`. For every vocabulary size
+the same swizzle names are split by both engines; the faster engine is marked.
+The crossover point is what `swizzle` uses to select an engine automatically.
+"""
+
+import os
+import random
+import string
+import sys
+import timeit
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+from swizzle.regex import RegexSplitter  # noqa: E402
+from swizzle.trie import Trie  # noqa: E402
+
+SIZES = (2, 4, 8, 16, 32, 64, 128, 256, 512)
+NUMBER = 2000
+
+
+def make_vocabulary(size, rng):
+    words = set()
+    while len(words) < size:
+        length = rng.randint(1, 6)
+        words.add("".join(rng.choice(string.ascii_lowercase) for _ in range(length)))
+    return sorted(words)
+
+
+def make_queries(words, sep, rng, count=50, parts=4):
+    # Keep only names that greedy longest-prefix splitting accepts.
+    trie = Trie(words, sep)
+    queries = []
+    while len(queries) < count:
+        query = sep.join(rng.choice(words) for _ in range(parts))
+        try:
+            list(trie.split_longest_prefix(query))
+        except AttributeError:
+            continue
+        queries.append(query)
+    return queries
+
+
+def bench(splitter, queries):
+    def run():
+        for query in queries:
+            for _ in splitter.split_longest_prefix(query):
+                pass
+
+    return min(timeit.repeat(run, number=NUMBER // len(queries), repeat=5))
+
+
+def main():
+    rng = random.Random(0)
+    for sep in ("", "_"):
+        print(f"sep={sep!r}")
+        print(f"{'vocab':>6} {'trie (us)':>10} {'regex (us)':>11}  winner")
+        for size in SIZES:
+            words = make_vocabulary(size, rng)
+            queries = make_queries(words, sep, rng)
+            calls = (NUMBER // len(queries)) * len(queries)
+            trie = bench(Trie(words, sep), queries) / calls * 1e6
+            regex = bench(RegexSplitter(words, sep), queries) / calls * 1e6
+            winner = "regex" if regex < trie else "trie"
+            print(f"{size:>6} {trie:>10.2f} {regex:>11.2f}  {winner}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Memory and time of `swizzle.typed` results against swizzledtuple results.
+
+Run with `python benchmarks/typed_results.py`. Memory is traced per result
+kept alive after its source object is gone, so boxed floats are owned by the
+tuple results, as they are for computed or since-updated attributes.
+"""
+
+import gc
+import os
+import sys
+import timeit
+import tracemalloc
+from array import array
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle  # noqa: E402
+
+RESULTS = 100_000
+f64 = swizzle.typed("d")
+
+
+def vector(result_type):
+    @swizzle(type=result_type, only_attrs=["x", "y", "z", "w"])
+    class Vector:
+        def __init__(self, x, y, z, w):
+            self.x = x
+            self.y = y
+            self.z = z
+            self.w = w
+
+    return Vector
+
+
+def retained(cls, name):
+    gc.collect()
+    tracemalloc.start()
+    results = [
+        getattr(cls(i * 0.5, i + 0.25, i + 0.75, i + 1.5), name) for i in range(RESULTS)
+    ]
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del results
+    return size / RESULTS
+
+
+def main():
+    print(f"{'result':<14} {'name':<6} {'access':>9} {'retained':>10}")
+    for label, result_type in (("swizzledtuple", swizzle.t), ("typed('d')", f64)):
+        cls = vector(result_type)
+        v = cls(1.0, 2.0, 3.0, 4.0)
+        for name in ("zyx", "wzyx"):
+            getattr(v, name)
+            t = min(timeit.repeat(lambda: getattr(v, name), number=100_000, repeat=5))
+            size = retained(cls, name)
+            print(f"{label:<14} {name:<6} {t * 1e4:>7.0f}ns {size:>9.0f}B")
+    cls = vector(f64)
+    v = cls(1.0, 2.0, 3.0, 4.0)
+    out = array("d", bytes(8 * 4))
+    t = min(timeit.repeat(lambda: f64.read(v, "wzyx", out), number=100_000, repeat=5))
+    print(f"{'read(out=)':<14} {'wzyx':<6} {t * 1e4:>7.0f}ns {0:>9.0f}B")
+
+
+if __name__ == "__main__":
+    main()
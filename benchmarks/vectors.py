@@ -0,0 +1,81 @@
+"""
+Scalar and batched throughput of `swizzle.vec3` against plain tuples and NumPy.
+
+Run with `python benchmarks/vectors.py`. Batched rows are skipped for NumPy
+when it is not installed.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle  # noqa: E402
+from swizzle import vec3  # noqa: E402
+
+NUMBER = 200_000
+BATCH = 100_000
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def scalar_cases():
+    t = (1.0, 2.0, 3.0)
+    st = swizzle.t("V", "x y z")(1.0, 2.0, 3.0)
+    v = vec3(1.0, 2.0, 3.0)
+    return [
+        ("swizzle zyx", lambda: (t[2], t[1], t[0]), lambda: st.zyx, lambda: v.zyx),
+        ("scale * 2", lambda: tuple(c * 2 for c in t), None, lambda: v * 2),
+        (
+            "add",
+            lambda: (t[0] + t[0], t[1] + t[1], t[2] + t[2]),
+            None,
+            lambda: v + v,
+        ),
+        ("zyx * 2", lambda: (t[2] * 2, t[1] * 2, t[0] * 2), None, lambda: v.zyx * 2),
+    ]
+
+
+def batch_cases():
+    rows = [(float(i), i + 1.0, i + 2.0) for i in range(BATCH)]
+    cases = [
+        (
+            "tuples",
+            lambda: [(z * 2, y * 2, x * 2) for x, y, z in rows],
+        ),
+        ("vec3.array(array)", _batched(vec3.array(rows, backend="array"))),
+    ]
+    if np is not None:
+        block = np.array(rows)
+        cases.append(("vec3.array(numpy)", _batched(vec3.array(rows, backend="numpy"))))
+        cases.append(("numpy (n, 3)", lambda: block[:, ::-1] * 2))
+    return cases
+
+
+def _batched(positions):
+    return lambda: positions.zyx * 2
+
+
+def best(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main():
+    print(f"{'scalar':<14} {'tuple':>9} {'swizzledtuple':>14} {'vec3':>9}")
+    for label, *funcs in scalar_cases():
+        cells = [
+            f"{best(f, NUMBER) * 1e9:>7.0f}ns" if f is not None else f"{'-':>9}"
+            for f in funcs
+        ]
+        print(f"{label:<14} {cells[0]} {cells[1]:>14} {cells[2]}")
+    print()
+    print(f"positions.zyx * 2 over {BATCH} vectors")
+    for label, func in batch_cases():
+        print(f"{label:<20} {best(func, 5) * 1e3:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Class creation time and memory of swizzledtuples with many fields.
+
+Run with `python benchmarks/wide_tuples.py`. Memory is what `tracemalloc`
+still sees allocated after creating the class (`kept`) and the peak during
+creation (`peak`). Instance construction is timed positionally.
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.realpath(os.path.dirname(__file__) + "/.."))
+from swizzle import swizzledtuple  # noqa: E402
+
+WIDTHS = (10, 100, 1_000, 5_000)
+
+
+def main():
+    print(
+        f"{'fields':>7} {'create':>10} {'per field':>10} {'kept':>9} {'peak':>9} {'new':>10}"
+    )
+    for width in WIDTHS:
+        names = [f"col{i}" for i in range(width)]
+        number = max(1, 2_000 // width)
+        create = min(
+            timeit.repeat(lambda: swizzledtuple("Row", names), number=number, repeat=5)
+        )
+        create /= number
+        tracemalloc.start()
+        Row = swizzledtuple("Row", names)
+        kept, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        values = list(range(width))
+        new = min(timeit.repeat(lambda: Row(*values), number=1_000, repeat=5)) / 1_000
+        print(
+            f"{width:>7} {create * 1e3:>8.2f}ms {create / width * 1e6:>8.2f}us "
+            f"{kept / 1024:>7.0f}KB {peak / 1024:>7.0f}KB {new * 1e6:>8.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
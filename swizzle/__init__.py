@@ -1,20 +1,29 @@
+import atexit
 import builtins
+import importlib
+import os
 import sys as _sys
 import types
+import warnings
 from collections.abc import Iterable
 from dataclasses import fields as dataclass_fields
 from dataclasses import is_dataclass
 from enum import Enum, EnumMeta
-from functools import wraps
+from functools import lru_cache, wraps
+from functools import partial as _partial
 from importlib.metadata import version as get_version
+from itertools import repeat as _repeat
 from keyword import iskeyword as _iskeyword
 from operator import itemgetter as _itemgetter
 
+from .profile import Profile
+from .regex import RegexSplitter
 from .trie import Trie
 from .utils import (
     get_getattr_methods,
     get_setattr_method,
     is_valid_sep,
+    make_splitter,
     split_attr_name,
 )
 
@@ -39,15 +48,75 @@ except PackageNotFoundError:
 
 __all__ = [
     "swizzledtuple",
+    "swizzledstruct",
+    "mapping",
+    "expr",
+    "typed",
+    "vec2",
+    "vec3",
+    "vec4",
     "t",
     "AttrSource",
     "swizzle",
     "swizzle_attributes_retriever",
+    "register_builder",
+    "prepare",
+    "explain",
+    "wrap",
+    "register",
+    "start_profiling",
+    "stop_profiling",
+    "warmup",
+    "Profile",
 ]
 
 _type = builtins.type
+_tuple = builtins.tuple
+_tuple_new = _tuple.__new__
+_object_getattribute = object.__getattribute__
+_TUPLEGETTER = _type(_tuplegetter(0, None))
 MISSING = object()
 
+# Upper bound on cached name splits per decorated class.
+PARSE_CACHE_SIZE = 4096
+
+# Name splitting strategies selectable with `engine=`. "reference" is the
+# greedy substring scan every other engine must agree with.
+ENGINES = ("auto", "reference", "sep", "fixed", "trie", "regex")
+
+# Wider swizzledtuples get a generic `__new__` instead of one compiled with
+# a parameter per field.
+MAX_EVAL_FIELDS = 255
+
+# Names a swizzledtuple field must not shadow.
+_RESERVED_NAMES = frozenset(
+    dir(_tuple)
+    + [
+        "__match_args__",
+        "__module__",
+        "__slots__",
+        "_arrange",
+        "_arrange_indices",
+        "_arrange_names",
+        "_asdict",
+        "_compact",
+        "_field_defaults",
+        "_fields",
+        "_from_arranged",
+        "_from_columns",
+        "_make",
+        "_make_many",
+        "_repr_fmt",
+        "_replace",
+        "_sep",
+        "_store",
+        "_swizzle_plans",
+    ]
+)
+
+_profile = None
+_pending_warmup = {}
+
 
 class AttrSource(str, Enum):
     """Enum for specifying how to retrieve attributes from a class."""
@@ -65,6 +134,7 @@ def swizzledtuple(
     defaults=None,
     module=None,
     sep=None,
+    compact=False,
 ):
     """
     Creates a custom named tuple class with *swizzled attributes*, allowing for rearranged field names
@@ -89,6 +159,13 @@ def swizzledtuple(
             Can include duplicates.
         sep (str, optional): Separator string used to construct compound attribute names.
             If `sep = '_'` provided, attributes like `v.x_y` become accessible. Defaults to None.
+        compact (bool, optional): If True, instances store each field value once and
+            expand to the arrangement on access, which saves memory for arrangements
+            with many duplicates. Swizzled results with duplicates are compact as well.
+            Indexing, iteration, `len`, comparisons and hashing behave exactly like
+            the arranged tuple, at the cost of slower element access. C code that reads
+            the tuple storage directly, such as `%` formatting, sees the stored field
+            values instead, so pass `tuple(t)` there. Defaults to False.
     Returns:
         Type: A new subclass of `tuple` with named fields and custom swizzle behavior.
 
@@ -118,16 +195,7 @@ def swizzledtuple(
 
     typename = _sys.intern(str(typename))
 
-    _dir = dir(tuple) + [
-        "__match_args__",
-        "__module__",
-        "__slots__",
-        "_asdict",
-        "_field_defaults",
-        "_fields",
-        "_make",
-        "_replace",
-    ]
+    _dir = _RESERVED_NAMES
     if rename:
         seen = set()
         name_newname = {}
@@ -166,14 +234,23 @@ def swizzledtuple(
             raise ValueError(f"Encountered duplicate field name: {name!r}")
         seen.add(name)
 
-    arrange_indices = [field_names.index(name) for name in arrange_names]
+    field_index = {name: index for index, name in enumerate(field_names)}
+    arrange_indices = _tuple(field_index[name] for name in arrange_names)
+
+    # Rearranging runs in C: one itemgetter call picks the arranged values.
+    if len(arrange_indices) == 0:
 
-    def tuple_new(cls, iterable):
-        new = []
-        _iterable = list(iterable)
-        for index in arrange_indices:
-            new.append(_iterable[index])
-        return tuple.__new__(cls, new)
+        def arrange(row):
+            return ()
+
+    elif len(arrange_indices) == 1:
+        _only_index = arrange_indices[0]
+
+        def arrange(row):
+            return (row[_only_index],)
+
+    else:
+        arrange = _itemgetter(*arrange_indices)
 
     field_defaults = {}
     if defaults is not None:
@@ -187,39 +264,249 @@ def swizzledtuple(
     field_names = tuple(map(_sys.intern, field_names))
     arrange_names = tuple(map(_sys.intern, arrange_names))
     num_fields = len(field_names)
-    num_arrange_fields = len(arrange_names)
     arg_list = ", ".join(field_names)
     if num_fields == 1:
         arg_list += ","
-    repr_fmt = "(" + ", ".join(f"{name}=%r" for name in arrange_names) + ")"
-    _dict, _tuple, _len, _zip = dict, tuple, len, zip
 
+    if num_fields <= MAX_EVAL_FIELDS:
+        # Instances of compact classes and of classes in field order store
+        # the arguments as they are.
+        arranged = not compact and arrange_indices != _tuple(range(num_fields))
+        template = _swizzledtuple_new(arg_list, arranged)
+        __new__ = types.FunctionType(
+            template.__code__, template.__globals__, "__new__", defaults
+        )
+    else:
+        bind = _arguments_binder(typename, field_names, field_index, field_defaults)
+
+        def __new__(_cls, *args, **kwargs):
+            if kwargs or len(args) != num_fields:
+                args = bind(args, kwargs)
+            return _swizzledtuple_store(_cls, args)
+
+    __new__.__doc__ = f"Create new instance of {typename}({arg_list})"
+    __new__.__qualname__ = f"{typename}.__new__"
+
+    if compact:
+        # Compact instances store the field values in field order only.
+        if num_fields > 1:
+            store = _itemgetter(*range(num_fields))
+        else:
+
+            def store(row):
+                return (row[0],)
+
+    else:
+        store = arrange
+
+    # Methods are shared by all swizzledtuple classes and read the per-class
+    # data below; `__getattribute__` and its name splitter are shared by all
+    # classes with the same field set.
+    class_namespace = {
+        "__doc__": f"{typename}({arg_list})",
+        "__slots__": (),
+        "_fields": field_names,
+        "_arrange_names": arrange_names,
+        "_field_defaults": field_defaults,
+        "_arrange_indices": arrange_indices,
+        "_arrange": staticmethod(arrange),
+        "_store": staticmethod(store),
+        "_compact": compact,
+        "_sep": sep,
+        "_repr_fmt": "(" + ", ".join(f"{name}=%r" for name in arrange_names) + ")",
+        "_swizzle_plans": {},
+        "__new__": __new__,
+        "__getattribute__": _swizzledtuple_getattribute(field_names, sep, compact),
+        **_SWIZZLEDTUPLE_METHODS,
+    }
+    if compact:
+        class_namespace.update(_COMPACT_METHODS)
+        first = {}
+        for i, index in enumerate(arrange_indices):
+            first.setdefault(index, i)
+        if len(first) > 1:
+            class_namespace["_from_arranged"] = staticmethod(
+                _itemgetter(*first.values())
+            )
+        else:
+            class_namespace["_from_arranged"] = staticmethod(_first_value)
+        for index, name in enumerate(field_names):
+            doc = _sys.intern(f"Alias for field number {index}")
+            class_namespace[name] = _tuplegetter(index, doc)
+    else:
+        class_namespace["_from_arranged"] = _tuple
+        seen = set()
+        for index, name in enumerate(arrange_names):
+            if name in seen:
+                continue
+            doc = _sys.intern(f"Alias for field number {index}")
+            class_namespace[name] = _tuplegetter(index, doc)
+            seen.add(name)
+
+    result = type(typename, (tuple,), class_namespace)
+
+    if module is None:
+        try:
+            module = _sys._getframemodulename(1) or "__main__"
+        except AttributeError:
+            try:
+                module = _sys._getframe(1).f_globals.get("__name__", "__main__")
+            except (AttributeError, ValueError):
+                pass
+    if module is not None:
+        result.__module__ = module
+
+    return result
+
+
+def _arguments_binder(typename, field_names, field_index, field_defaults):
+    """
+    Binds positional and keyword arguments to field values for wide swizzledtuples.
+
+    Used instead of a compiled `__new__` signature once there are more than
+    `MAX_EVAL_FIELDS` fields; raises the same kinds of `TypeError` as a call
+    with a wrong signature.
+    """
+    num_fields = len(field_names)
+
+    def bind(args, kwargs):
+        if len(args) > num_fields:
+            raise TypeError(
+                f"{typename}() takes {num_fields} positional arguments "
+                f"but {len(args)} were given"
+            )
+        values = list(args) + [MISSING] * (num_fields - len(args))
+        for name, value in kwargs.items():
+            index = field_index.get(name)
+            if index is None:
+                raise TypeError(
+                    f"{typename}() got an unexpected keyword argument {name!r}"
+                )
+            if values[index] is not MISSING:
+                raise TypeError(
+                    f"{typename}() got multiple values for argument {name!r}"
+                )
+            values[index] = value
+        for index in range(len(args), num_fields):
+            if values[index] is MISSING:
+                name = field_names[index]
+                if name not in field_defaults:
+                    raise TypeError(f"{typename}() missing required argument: {name!r}")
+                values[index] = field_defaults[name]
+        return values
+
+    return bind
+
+
+@lru_cache(maxsize=1024)
+def _swizzledtuple_new(arg_list, arranged):
+    # Compiled once per signature; classes get copies with their defaults.
     namespace = {
-        "_tuple_new": tuple_new,
+        "_tuple_new": _tuple_new,
         "__builtins__": {},
-        "__name__": f"swizzledtuple_{typename}",
+        "__name__": "swizzledtuple",
     }
-    code = f"lambda _cls, {arg_list}: _tuple_new(_cls, ({arg_list}))"
-    __new__ = eval(code, namespace)
-    __new__.__name__ = "__new__"
-    __new__.__doc__ = f"Create new instance of {typename}({arg_list})"
-    if defaults is not None:
-        __new__.__defaults__ = defaults
+    values = f"({arg_list})"
+    if arranged:
+        values = f"_cls._arrange({values})"
+    return eval(f"lambda _cls, {arg_list}: _tuple_new(_cls, {values})", namespace)
+
+
+_SEQUENCE_ROWS = frozenset((_tuple, list))
+
+
+def _swizzledtuple_store(cls, iterable):
+    # Builds an instance from field values in field order.
+    if cls._compact:
+        return _tuple_new(cls, iterable)
+    if _type(iterable) is not _tuple:
+        iterable = list(iterable)
+    return _tuple_new(cls, cls._arrange(iterable))
+
+
+def _expand(self):
+    "Return the arranged values of a compact instance as a plain tuple."
+    return _type(self)._arrange(_tuple(_tuple.__iter__(self)))
+
+
+def _first_value(values):
+    return (values[0],)
+
+
+class _SwizzledTupleMethods:
+    # Methods shared by all swizzledtuple classes; they read the per-class
+    # data (`_fields`, `_arrange`, `_repr_fmt`, ...) from the class.
 
     @classmethod
     def _make(cls, iterable):
-        result = tuple_new(cls, iterable)
-        if _len(result) != num_arrange_fields:
+        "Make a new object from a sequence or iterable in field order"
+        result = _swizzledtuple_store(cls, iterable)
+        num_fields = len(cls._fields)
+        if cls._compact and _tuple.__len__(result) != num_fields:
+            raise ValueError(f"Expected {num_fields} arguments, got {len(result)}")
+        if len(result) != len(cls._arrange_names):
             raise ValueError(
-                f"Expected {num_arrange_fields} arguments, got {len(result)}"
+                f"Expected {len(cls._arrange_names)} arguments, got {len(result)}"
             )
         return result
 
-    _make.__func__.__doc__ = f"Make a new {typename} object from a sequence or iterable"
+    @classmethod
+    def _make_many(cls, rows, *, lazy=False):
+        """
+        Make objects from an iterable of iterables in field order.
+        Returns a list, or an iterator if lazy is true.
+        Raises ValueError for rows with the wrong number of values.
+        """
+        # Bulk construction rearranges each row with the same itemgetter and
+        # skips the argument binding of __new__.
+        num_fields, store = len(cls._fields), cls._store
+        if not lazy and _type(rows) is list:
+            # Rows that are all tuples or lists of the right width are
+            # checked in two C passes and built in one C pipeline.
+            sequences = set(map(_type, rows)) <= _SEQUENCE_ROWS
+            if sequences and set(map(len, rows)) <= {num_fields}:
+                return list(map(_partial(_tuple_new, cls), map(store, rows)))
+
+        def make(row):
+            if _type(row) is not _tuple and _type(row) is not list:
+                row = _tuple(row)
+            if len(row) != num_fields:
+                raise ValueError(f"Expected {num_fields} arguments, got {len(row)}")
+            return _tuple_new(cls, store(row))
+
+        result = map(make, rows)
+        return result if lazy else list(result)
+
+    @classmethod
+    def _from_columns(cls, *, lazy=False, **columns):
+        """
+        Make objects from one iterable per field, passed by name.
+        Fields with defaults may be omitted.
+        """
+        if not columns:
+            raise TypeError("At least one column is required")
+        field_names, field_defaults = cls._fields, cls._field_defaults
+        unknown = columns.keys() - set(field_names)
+        if unknown:
+            raise TypeError(f"Got unexpected field names: {sorted(unknown)!r}")
+        ordered = []
+        for name in field_names:
+            if name in columns:
+                ordered.append(columns[name])
+            elif name in field_defaults:
+                ordered.append(_repeat(field_defaults[name]))
+            else:
+                raise TypeError(f"Missing column for field {name!r}")
+        lengths = {len(c) for c in ordered if hasattr(c, "__len__")}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+        return cls._make_many(zip(*ordered), lazy=lazy)
 
     def _replace(self, /, **kwds):
+        "Return a new object replacing specified fields with new values"
+
         def generator():
-            for name in field_names:
+            for name in _type(self)._fields:
                 if name in kwds:
                     yield kwds.pop(name)
                 else:
@@ -230,103 +517,376 @@ def swizzledtuple(
             raise ValueError(f"Got unexpected field names: {list(kwds)!r}")
         return result
 
-    _replace.__doc__ = (
-        f"Return a new {typename} object replacing specified fields with new values"
-    )
-
     def __repr__(self):
         "Return a nicely formatted representation string"
-        return self.__class__.__name__ + repr_fmt % self
+        cls = _type(self)
+        values = _expand(self) if cls._compact else self
+        return cls.__name__ + cls._repr_fmt % values
 
     def _asdict(self):
         "Return a new dict which maps field names to their values."
-        return _dict(_zip(arrange_names, self))
+        return dict(zip(_type(self)._arrange_names, self))
 
     def __getnewargs__(self):
-        "Return self as a plain tuple.  Used by copy and pickle."
-        return _tuple(self)
-
-    @swizzle_attributes_retriever(sep=sep, type=swizzledtuple, only_attrs=field_names)
-    def __getattribute__(self, attr_name):
-        return super(_tuple, self).__getattribute__(attr_name)
+        "Return the field values as a plain tuple.  Used by copy and pickle."
+        # __new__ takes the fields, which differ from the arranged values when
+        # the arrangement reorders or repeats them.
+        return _tuple([getattr(self, name) for name in _type(self)._fields])
 
     def __getitem__(self, index):
+        cls = _type(self)
         if not isinstance(index, slice):
+            if cls._compact:
+                return _tuple.__getitem__(self, cls._arrange_indices[index])
             return _tuple.__getitem__(self, index)
+        arranged = _tuple(cls._arrange_names[index])
+        values = (_expand(self) if cls._compact else _tuple(self))[index]
+        result_cls = _swizzledtuple_class(
+            cls.__name__, arranged, cls._sep or "", cls._compact
+        )
+        return _tuple_new(result_cls, result_cls._from_arranged(values))
 
-        selected_indices = arrange_indices[index]
-        selected_values = _tuple.__getitem__(self, index)
 
-        seen = set()
-        filtered = [
-            (i, v, field_names[i])
-            for i, v in zip(selected_indices, selected_values)
-            if not (i in seen or seen.add(i))
-        ]
-
-        if filtered:
-            _, filtered_values, filtered_names = zip(*filtered)
-        else:
-            filtered_values, filtered_names = (), ()
-
-        return swizzledtuple(
-            typename,
-            filtered_names,
-            rename=rename,
-            defaults=filtered_values,
-            module=module,
-            arrange_names=arrange_names[index],
-            sep=sep,
-        )()
-
-    for method in (
-        __new__,
-        _make.__func__,
-        _replace,
-        __repr__,
-        _asdict,
-        __getnewargs__,
-        __getattribute__,
-        __getitem__,
-    ):
-        method.__qualname__ = f"{typename}.{method.__name__}"
+class _CompactMethods:
+    # Sequence methods for compact swizzledtuples. Compact instances keep one
+    # value per field as their tuple storage, so every operation that would
+    # see that storage is redirected through `_expand`.
 
-    class_namespace = {
-        "__doc__": f"{typename}({arg_list})",
-        "__slots__": (),
-        "_fields": field_names,
-        "_field_defaults": field_defaults,
-        "__new__": __new__,
-        "_make": _make,
-        "_replace": _replace,
-        "__repr__": __repr__,
-        "_asdict": _asdict,
-        "__getnewargs__": __getnewargs__,
-        "__getattribute__": __getattribute__,
-        "__getitem__": __getitem__,
-    }
-    seen = set()
-    for index, name in enumerate(arrange_names):
-        if name in seen:
-            continue
-        doc = _sys.intern(f"Alias for field number {index}")
-        class_namespace[name] = _tuplegetter(index, doc)
-        seen.add(name)
+    def __len__(self):
+        return len(_type(self)._arrange_names)
 
-    result = type(typename, (tuple,), class_namespace)
+    def __iter__(self):
+        return iter(_expand(self))
 
-    if module is None:
+    def __reversed__(self):
+        return reversed(_expand(self))
+
+    def __hash__(self):
+        return hash(_expand(self))
+
+    def __eq__(self, other):
+        return _expand(self) == other
+
+    def __ne__(self, other):
+        return _expand(self) != other
+
+    def __lt__(self, other):
+        return _expand(self) < other
+
+    def __le__(self, other):
+        return _expand(self) <= other
+
+    def __gt__(self, other):
+        return _expand(self) > other
+
+    def __ge__(self, other):
+        return _expand(self) >= other
+
+    def __add__(self, other):
+        return _expand(self) + other
+
+    def __radd__(self, other):
+        return other + _expand(self)
+
+    def __mul__(self, n):
+        return _expand(self) * n
+
+    __rmul__ = __mul__
+
+    def count(self, value):
+        return _expand(self).count(value)
+
+    def index(self, value, *args):
+        return _expand(self).index(value, *args)
+
+    def __getnewargs__(self):
+        "Return the field values as a plain tuple.  Used by copy and pickle."
+        return _tuple(_tuple.__iter__(self))
+
+
+def _shared_methods(holder):
+    methods = {}
+    for name, method in vars(holder).items():
+        func = getattr(method, "__func__", method)
+        if isinstance(func, types.FunctionType):
+            func.__qualname__ = f"swizzledtuple.{func.__name__}"
+            methods[name] = method
+    return methods
+
+
+_SWIZZLEDTUPLE_METHODS = _shared_methods(_SwizzledTupleMethods)
+_COMPACT_METHODS = _shared_methods(_CompactMethods)
+
+
+@lru_cache(maxsize=1024)
+def _swizzledtuple_getattribute(field_names, sep, compact):
+    """
+    Returns the `__getattribute__` shared by swizzledtuple classes with `field_names`.
+
+    Swizzled names are resolved by the generic retriever once per class and
+    name; after that, a per-class plan gathers the values by position in one
+    itemgetter call and builds the cached result class directly.
+    """
+
+    @swizzle_attributes_retriever(
+        sep=sep, type=swizzledtuple, only_attrs=field_names, compact=compact
+    )
+    def retrieve(self, attr_name):
+        return _object_getattribute(self, attr_name)
+
+    parse = retrieve._swizzle_parse
+    result_sep = sep or ""
+
+    @wraps(retrieve)
+    def __getattribute__(self, attr_name):
         try:
-            module = _sys._getframemodulename(1) or "__main__"
+            return _object_getattribute(self, attr_name)
         except AttributeError:
-            try:
-                module = _sys._getframe(1).f_globals.get("__name__", "__main__")
-            except (AttributeError, ValueError):
-                pass
-    if module is not None:
-        result.__module__ = module
+            pass
+        cls = _type(self)
+        plan = cls._swizzle_plans.get(attr_name)
+        if plan is not None and plan[0] is cls and _profile is None:
+            return plan[1](self)
+        result = retrieve(self, attr_name)
+        plans = cls.__dict__.get("_swizzle_plans")
+        if plans is not None and len(plans) < PARSE_CACHE_SIZE:
+            names = _tuple(parse(attr_name))
+            if len(names) > 1:
+                plans[attr_name] = (cls, _swizzledtuple_reader(cls, names, result_sep))
+        return result
 
-    return result
+    def explain(obj, attr_name, access=None):
+        plan = None
+        if obj is not None and _profile is None:
+            plan = _type(obj)._swizzle_plans.get(attr_name)
+            if plan is not None and plan[0] is not _type(obj):
+                plan = None
+        report = retrieve._swizzle_explain(obj, attr_name, access)
+        report["cached"]["plan"] = plan is not None
+        if plan is not None and report["strategy"] != "exact":
+            # Only the exact lookup missed before the plan read the values.
+            report.update(strategy="plan", probes=1, misses=1)
+        return report
+
+    __getattribute__._swizzle_explain = explain
+    __getattribute__.__qualname__ = "swizzledtuple.__getattribute__"
+    return __getattribute__
+
+
+def _swizzledtuple_reader(cls, names, sep):
+    # Gathers `names` from the storage of a `cls` instance by position,
+    # bypassing the Python-level `__getitem__` and `__iter__`.
+    if cls._compact:
+        positions = {name: i for i, name in enumerate(cls._fields)}
+    else:
+        positions = {}
+        for i, name in enumerate(cls._arrange_names):
+            positions.setdefault(name, i)
+    gather = _itemgetter(*[positions[name] for name in names])
+    result = _swizzledtuple_class(cls.__name__, names, sep, cls._compact)
+    from_arranged = result._from_arranged
+    if cls._compact:
+        if from_arranged is _tuple:
+            return lambda obj: _tuple_new(result, gather(_tuple(_tuple.__iter__(obj))))
+        return lambda obj: _tuple_new(
+            result, from_arranged(gather(_tuple(_tuple.__iter__(obj))))
+        )
+    if from_arranged is _tuple:
+        return lambda obj: _tuple_new(result, gather(_tuple(obj)))
+    return lambda obj: _tuple_new(result, from_arranged(gather(_tuple(obj))))
+
+
+_builders = {}
+
+
+def register_builder(type, builder):
+    """
+    Registers how swizzled results of `type` are built.
+
+    Builders are looked up once, when a class is decorated with `type=type`, so
+    the per-access cost is a single call. A type can alternatively define a
+    classmethod `__swizzle_build__(names, values)`; registered builders take
+    precedence.
+
+    Args:
+        type (type): Result type passed as `type=` to `swizzle`.
+        builder (callable): Called as `builder(names, values)` with the list of
+            swizzled attribute names and the list of their values, in access order.
+            Must return the result object.
+
+    Example:
+        ```python
+        import numpy as np
+
+        swizzle.register_builder(np.ndarray, lambda names, values: np.array(values))
+
+        @swizzle(type=np.ndarray)
+        class Vector: ...
+        ```
+    """
+    _builders[type] = builder
+
+
+@lru_cache(maxsize=1024)
+def _swizzledtuple_class(name, arranged_names, sep, compact=False):
+    field_names = list(dict.fromkeys(arranged_names))
+    return swizzledtuple(
+        name,
+        field_names,
+        arrange_names=arranged_names,
+        sep=sep,
+        compact=compact and len(field_names) < len(arranged_names),
+    )
+
+
+def get_builder(type, sep="", compact=False):
+    """Returns the `build(obj, names, values)` function for results of `type`."""
+    builder = _builders.get(type)
+    if builder is None:
+        builder = getattr(type, "__swizzle_build__", None)
+    if builder is not None:
+        return lambda obj, names, values: builder(names, values)
+    if type is swizzledtuple:
+        # Values already are in arranged order, which is how swizzledtuples
+        # store them, so one cached class and tuple.__new__ are all it takes.
+        def build(obj, names, values):
+            # issubclass avoids isinstance's fallback lookup of a swizzled
+            # obj.__class__.
+            if issubclass(_type(obj), _type):
+                name = obj.__name__
+            else:
+                name = _type(obj).__name__
+            cls = _swizzledtuple_class(name, _tuple(names), sep, compact)
+            if compact:
+                return _tuple_new(cls, cls._from_arranged(values))
+            return _tuple_new(cls, values)
+
+        return build
+    if type is list:
+        return lambda obj, names, values: values
+    if isinstance(type, Typed):
+        return type.builder()
+    return lambda obj, names, values: type(values)
+
+
+def get_bulk_setter(cls, setter):
+    """
+    Returns `set_many(obj, values)` assigning all parts of a swizzled write at once.
+
+    A class can define `__swizzle_set__(self, values)` to receive the dict of
+    attribute names to values of one swizzled assignment in a single call.
+    Otherwise, if `setter` is `object.__setattr__`, slots and plain dataclass
+    fields are written through precomputed member descriptors and the
+    instance dict, and all other names go through `setter`. The strategy is
+    resolved per concrete type of `obj`, so undecorated subclasses of `cls`
+    can add or override `__swizzle_set__`.
+    """
+    strategies = {}
+
+    def set_many(obj, values):
+        owner = _type(obj)
+        strategy = strategies.get(owner)
+        if strategy is None:
+            strategy = _bulk_setter_of(owner, setter)
+            if len(strategies) < PARSE_CACHE_SIZE:
+                strategies[owner] = strategy
+        return strategy(obj, values)
+
+    return set_many
+
+
+def _bulk_setter_of(cls, setter):
+    bulk = getattr(cls, "__swizzle_set__", None)
+    if bulk is not None:
+        return bulk
+    slot_setters = {}
+    plain = frozenset()
+    if setter is object.__setattr__:
+        for klass in reversed(cls.__mro__):
+            for name, attr in vars(klass).items():
+                if isinstance(attr, types.MemberDescriptorType):
+                    slot_setters[name] = attr.__set__
+                else:
+                    slot_setters.pop(name, None)
+        if is_dataclass(cls):
+            plain = frozenset(
+                f.name
+                for f in dataclass_fields(cls)
+                if f.name not in slot_setters
+                and not hasattr(_type(getattr(cls, f.name, None)), "__set__")
+            )
+
+    def set_many(obj, values):
+        for name, value in values.items():
+            slot_set = slot_setters.get(name)
+            if slot_set is not None:
+                slot_set(obj, value)
+            elif name in plain:
+                obj.__dict__[name] = value
+            else:
+                setter(obj, name, value)
+
+    return set_many
+
+
+def get_field_plan(cls, names):
+    """
+    Returns `plan(parts)` compiling direct reads of the `names` fields of `cls`.
+
+    `plan(parts)` returns `fetch(obj)` giving the values of `parts` for an
+    instance of exactly `cls` (stored as `plan.owner`), or None if a part is
+    not a known field. NamedTuple fields are gathered by index with one
+    itemgetter, slots through their member descriptors, and plain dataclass
+    fields from the instance dict, bypassing the generic attribute lookup.
+    `fetch` raises `AttributeError` or `KeyError` for unset fields. Returns
+    None if `cls` customizes attribute lookup.
+    """
+    getattribute = _unwrap_swizzled([cls.__getattribute__])[0]
+    if not isinstance(getattribute, types.WrapperDescriptorType):
+        return None
+    descriptors = {}
+    for klass in reversed(cls.__mro__):
+        descriptors.update(vars(klass))
+    index = {}
+    getters = {}
+    if issubclass(cls, _tuple) and hasattr(cls, "_fields"):
+        index = {
+            name: i
+            for i, name in enumerate(cls._fields)
+            if name in names and _type(descriptors.get(name)) is _TUPLEGETTER
+        }
+    for name in names:
+        attr = descriptors.get(name)
+        if isinstance(attr, types.MemberDescriptorType):
+            getters[name] = attr.__get__
+    plain = frozenset()
+    instance_dict = descriptors.get("__dict__")
+    if is_dataclass(cls) and isinstance(instance_dict, types.GetSetDescriptorType):
+        instance_dict = instance_dict.__get__
+        plain = frozenset(
+            f.name
+            for f in dataclass_fields(cls)
+            if f.name in names
+            and not hasattr(_type(descriptors.get(f.name)), "__get__")
+        )
+    if not (index or getters or plain):
+        return None
+
+    def plan(parts):
+        if all(part in index for part in parts):
+            get = _itemgetter(*(index[part] for part in parts))
+        elif all(part in plain for part in parts):
+            get = _itemgetter(*parts)
+            return lambda obj: list(get(instance_dict(obj)))
+        elif all(part in getters for part in parts):
+            slot_getters = [getters[part] for part in parts]
+            return lambda obj: [get(obj) for get in slot_getters]
+        else:
+            return None
+        return lambda obj: list(get(obj))
+
+    plan.owner = cls
+    return plan
 
 
 def swizzle_attributes_retriever(
@@ -336,6 +896,12 @@ def swizzle_attributes_retriever(
     only_attrs=None,
     *,
     setter=None,
+    bulk_setter=None,
+    get_many=None,
+    field_plan=None,
+    compact=False,
+    engine="auto",
+    verify=False,
 ):
     if sep is not None and not is_valid_sep(sep):
         raise ValueError(f"Invalid value for sep: {sep!r}.")
@@ -344,20 +910,61 @@ def swizzle_attributes_retriever(
         sep = ""
 
     sep_len = len(sep)
+    build = get_builder(type, sep, compact)
 
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown swizzle engine: {engine!r}")
     split = None
+    # Splitters are compiled on the first swizzle miss (or by `prepare`), so
+    # decorating classes that are never swizzled stays cheap.
+    splitter_factory = None
     trie = None
+    parse_cache = {}
+    # Swizzle name -> (names, fetch) for names read through `field_plan`, or
+    # None for names it cannot read.
+    field_fetchers = {}
+    fixed = None
+    only_length = None
     if isinstance(only_attrs, int):
-        split = only_attrs
+        fixed = only_length = only_attrs
         only_attrs = None
     elif only_attrs:
         only_attrs = set(only_attrs)
-        if sep and not any(sep in attr for attr in only_attrs):
-            split = "by_sep"
-        elif len(set(len(attr) for attr in only_attrs)) == 1:
-            split = len(next(iter(only_attrs)))
-        if not split:
-            trie = Trie(only_attrs, sep)
+        lengths = set(map(len, only_attrs))
+        if len(lengths) == 1:
+            fixed = lengths.pop()
+    if engine == "auto":
+        if only_length is not None:
+            split = only_length
+        elif only_attrs:
+            if sep and not any(sep in attr for attr in only_attrs):
+                split = "by_sep"
+            elif fixed is not None:
+                split = fixed
+            else:
+                splitter_factory = make_splitter
+    elif engine == "sep":
+        if not sep or (only_attrs and any(sep in attr for attr in only_attrs)):
+            raise ValueError(
+                "The 'sep' engine needs a sep that no allowed attribute contains"
+            )
+        split = "by_sep"
+    elif engine == "fixed":
+        if fixed is None:
+            raise ValueError(
+                "The 'fixed' engine needs an int or equally long names for only_attrs"
+            )
+        split = fixed
+    elif engine in ("trie", "regex"):
+        if not only_attrs:
+            raise ValueError(f"The {engine!r} engine needs names for only_attrs")
+        splitter_factory = Trie if engine == "trie" else RegexSplitter
+
+    def get_trie():
+        nonlocal trie
+        if trie is None:
+            trie = splitter_factory(only_attrs, sep)
+        return trie
 
     def _swizzle_attributes_retriever(getattr_funcs):
         if not isinstance(getattr_funcs, list):
@@ -371,38 +978,112 @@ def swizzle_attributes_retriever(
                     continue
             return MISSING
 
+        batch_getters = {}
+
+        def batch_getter(obj):
+            # `__swizzle_get_many__` is looked up on the concrete type, so
+            # undecorated subclasses can add or override it.
+            if get_many is not None:
+                return get_many
+            owner = _type(obj)
+            many = batch_getters.get(owner, MISSING)
+            if many is MISSING:
+                many = getattr(owner, "__swizzle_get_many__", None)
+                if len(batch_getters) < PARSE_CACHE_SIZE:
+                    batch_getters[owner] = many
+            return many
+
+        def fetch_many(obj, names, many):
+            # One batched call for the distinct names, spread back over the
+            # arrangement.
+            unique = list(dict.fromkeys(names))
+            values = list(many(obj, unique))
+            if len(values) != len(unique):
+                raise ValueError(
+                    f"__swizzle_get_many__ returned {len(values)} values for {len(unique)} names"
+                )
+            if len(unique) == len(names):
+                return values
+            by_name = dict(zip(unique, values))
+            return [by_name[name] for name in names]
+
         def retrieve_attributes(obj, attr_name):
             # Attempt to find an exact attribute match
             attribute = get_attribute(obj, attr_name)
             if attribute is not MISSING:
                 return [attr_name], [attribute]
 
-            matched_attributes = []
-            arranged_names = []
-            # If a sep is provided, split the name accordingly
-            if split is not None:
-                attr_parts = split_attr_name(attr_name, split, sep)
-                arranged_names = attr_parts
-                for part in attr_parts:
-                    if only_attrs and part not in only_attrs:
-                        raise AttributeError(
-                            f"Attribute {part} is not part of an allowed field for swizzling"
-                        )
-                    attribute = get_attribute(obj, part)
-                    if attribute is not MISSING:
-                        matched_attributes.append(attribute)
-                    else:
-                        raise AttributeError(f"No matching attribute found for {part}")
-            elif trie:
-                for i, name in enumerate(trie.split_longest_prefix(attr_name)):
-                    attribute = get_attribute(obj, name)
-                    if attribute is not MISSING:
-                        arranged_names.append(name)
-                        matched_attributes.append(attribute)
-                    else:
-                        raise AttributeError(f"No matching attribute found for {name}")
-            else:
-                # No sep provided, attempt to match substrings
+            if field_plan is not None and _type(obj) is field_plan.owner:
+                fetcher = field_fetchers.get(attr_name, MISSING)
+                if fetcher is MISSING:
+                    # Resolve the names once the generic way, then read them
+                    # directly from then on.
+                    names, values = split_attributes(obj, attr_name)
+                    fetch = field_plan(names)
+                    if len(field_fetchers) < PARSE_CACHE_SIZE:
+                        field_fetchers[attr_name] = fetch and (names, fetch)
+                    return names, values
+                if fetcher is not None:
+                    names, fetch = fetcher
+                    try:
+                        return names, fetch(obj)
+                    except (AttributeError, KeyError):
+                        pass
+            return split_attributes(obj, attr_name)
+
+        def resolvers(get_attribute):
+            # Builds the splitting engines around `get_attribute`; `explain`
+            # runs them again with a probe-counting lookup.
+            def split_attributes(obj, attr_name):
+                matched_attributes = []
+                arranged_names = []
+                many = batch_getter(obj)
+                # If a sep is provided, split the name accordingly
+                if split is not None:
+                    attr_parts = split_attr_name(attr_name, split, sep)
+                    arranged_names = attr_parts
+                    for part in attr_parts:
+                        if only_attrs and part not in only_attrs:
+                            raise AttributeError(
+                                f"Attribute {part} is not part of an allowed field for swizzling"
+                            )
+                        if many is not None:
+                            continue
+                        attribute = get_attribute(obj, part)
+                        if attribute is not MISSING:
+                            matched_attributes.append(attribute)
+                        else:
+                            raise AttributeError(
+                                f"No matching attribute found for {part}"
+                            )
+                    if many is not None:
+                        return arranged_names, fetch_many(obj, arranged_names, many)
+                elif splitter_factory is not None:
+                    names = parse_cache.get(attr_name)
+                    if names is None:
+                        names = list(get_trie().split_longest_prefix(attr_name))
+                        if len(parse_cache) < PARSE_CACHE_SIZE:
+                            parse_cache[attr_name] = names
+                    if many is not None:
+                        return list(names), fetch_many(obj, names, many)
+                    for name in names:
+                        attribute = get_attribute(obj, name)
+                        if attribute is not MISSING:
+                            arranged_names.append(name)
+                            matched_attributes.append(attribute)
+                        else:
+                            raise AttributeError(
+                                f"No matching attribute found for {name}"
+                            )
+                else:
+                    return scan_attributes(obj, attr_name)
+                return arranged_names, matched_attributes
+
+            def scan_attributes(obj, attr_name):
+                # Reference engine: match the longest allowed substring that is
+                # an attribute, left to right.
+                matched_attributes = []
+                arranged_names = []
                 i = 0
                 attr_len = len(attr_name)
 
@@ -410,6 +1091,10 @@ def swizzle_attributes_retriever(
                     match_found = False
                     for j in range(attr_len, i, -1):
                         substring = attr_name[i:j]
+                        if (only_attrs and substring not in only_attrs) or (
+                            only_length is not None and j - i != only_length
+                        ):
+                            continue
                         attribute = get_attribute(obj, substring)
                         if attribute is not MISSING:
                             matched_attributes.append(attribute)
@@ -435,45 +1120,165 @@ def swizzle_attributes_retriever(
                         raise AttributeError(
                             f"No matching attribute found for substring: {attr_name[i:]}"
                         )
-            return arranged_names, matched_attributes
+                return arranged_names, matched_attributes
+
+            return split_attributes, scan_attributes
+
+        split_attributes, scan_attributes = resolvers(get_attribute)
+
+        if verify:
+            selected = retrieve_attributes
+
+            def retrieve_attributes(obj, attr_name):
+                # Debug mode: every name is resolved by both engines.
+                try:
+                    result, error = selected(obj, attr_name), None
+                except AttributeError as e:
+                    result, error = None, e
+                expected = get_attribute(obj, attr_name)
+                if expected is not MISSING:
+                    expected = [attr_name]
+                else:
+                    try:
+                        expected = scan_attributes(obj, attr_name)[0]
+                    except AttributeError:
+                        expected = None
+                if (result and result[0]) != expected:
+                    raise AssertionError(
+                        f"Swizzle engine {engine!r} split {attr_name!r} into "
+                        f"{result and result[0]}, the reference engine into {expected}"
+                    )
+                if error is not None:
+                    raise error
+                return result
 
         @wraps(getattr_funcs[-1])
         def get_attributes(obj, attr_name):
             arranged_names, matched_attributes = retrieve_attributes(obj, attr_name)
             if len(matched_attributes) == 1:
                 return matched_attributes[0]
-            if type == swizzledtuple:
-                seen = set()
-                field_names, field_values = zip(
-                    *[
-                        (name, matched_attributes[i])
-                        for i, name in enumerate(arranged_names)
-                        if name not in seen and not seen.add(name)
-                    ]
+            if _profile is not None:
+                _profile.record(obj, attr_name, arranged_names)
+            return build(obj, arranged_names, matched_attributes)
+
+        def warm(owner, attr_name, parts):
+            # Pre-parse the name and prebuild its result class ahead of first use.
+            if splitter_factory is not None:
+                parse_cache[attr_name] = list(
+                    get_trie().split_longest_prefix(attr_name)
                 )
+            if type is swizzledtuple:
+                _swizzledtuple_class(owner.__name__, _tuple(parts), sep, compact)
 
-                name = "swizzledtuple"
-                if hasattr(obj, "__name__"):
-                    name = obj.__name__
-                elif hasattr(obj, "__class__"):
-                    if hasattr(obj.__class__, "__name__"):
-                        name = obj.__class__.__name__
-                result = type(
-                    name,
-                    field_names,
-                    arrange_names=arranged_names,
-                    sep=sep,
-                )
-                result = result(*field_values)
-                return result
-
-            return type(matched_attributes)
+        def parse(attr_name):
+            # Splits a name without an instance, which needs a restricted
+            # attribute set; used to export accessors ahead of time.
+            if split is not None:
+                parts = split_attr_name(attr_name, split, sep)
+                for part in parts:
+                    if only_attrs and part not in only_attrs:
+                        raise AttributeError(
+                            f"Attribute {part} is not part of an allowed field for swizzling"
+                        )
+                return parts
+            if splitter_factory is not None:
+                return list(get_trie().split_longest_prefix(attr_name))
+            raise TypeError("Names can only be split ahead of time with only_attrs")
+
+        def prepare():
+            if splitter_factory is not None:
+                get_trie()
+
+        def splitter_strategy():
+            if split == "by_sep":
+                return "sep"
+            if split is not None:
+                return "fixed"
+            if splitter_factory is None:
+                return "reference"
+            return "regex" if isinstance(get_trie(), RegexSplitter) else "trie"
+
+        def explain(obj, attr_name, access=None):
+            # Reports how `attr_name` is resolved on `obj` without touching the
+            # hot path: the cache state is taken before `access` (the caller's
+            # real lookup) runs, then the name is resolved again with a lookup
+            # that counts its probes. Without `obj`, the name is only parsed.
+            fetcher = field_fetchers.get(attr_name)
+            report = {
+                "engine": engine,
+                "batched": (get_many if obj is None else batch_getter(obj)) is not None,
+                "cached": {
+                    "splitter": splitter_factory is None or trie is not None,
+                    "parse": attr_name in parse_cache,
+                    "field_plan": fetcher is not None,
+                },
+                "parts": None,
+                "probes": 0,
+                "misses": 0,
+                "error": None,
+            }
+            if obj is None:
+                report["strategy"] = splitter_strategy()
+                try:
+                    report["parts"] = parse(attr_name)
+                except TypeError:
+                    pass
+                except AttributeError as e:
+                    report["error"] = e
+                return report
+            if access is not None:
+                access()
+
+            def counting_attribute(obj, attr_name):
+                for func in getattr_funcs:
+                    report["probes"] += 1
+                    try:
+                        return func(obj, attr_name)
+                    except AttributeError:
+                        report["misses"] += 1
+                return MISSING
+
+            split_attributes = resolvers(counting_attribute)[0]
+            if counting_attribute(obj, attr_name) is not MISSING:
+                report["strategy"], report["parts"] = "exact", [attr_name]
+                return report
+            if fetcher is not None and _type(obj) is field_plan.owner:
+                try:
+                    fetcher[1](obj)
+                    report["strategy"] = "field_plan"
+                    report["parts"] = list(fetcher[0])
+                    return report
+                except (AttributeError, KeyError):
+                    pass
+            report["strategy"] = splitter_strategy()
+            try:
+                report["parts"] = split_attributes(obj, attr_name)[0]
+            except AttributeError as e:
+                report["error"] = e
+            return report
+
+        get_attributes._swizzle_warm = warm
+        get_attributes._swizzle_prepare = prepare
+        get_attributes._swizzle_wrapped = _tuple(getattr_funcs)
+        get_attributes._swizzle_parse = parse
+        get_attributes._swizzle_explain = explain
+        get_attributes._swizzle_retrieve = retrieve_attributes
+        get_attributes._swizzle_options = {
+            "sep": sep,
+            "type": type,
+            "setter": setter is not None,
+            "compact": compact,
+            "engine": engine,
+        }
 
         def set_attributes(obj, attr_name, value):
             try:
                 arranged_names, _ = retrieve_attributes(obj, attr_name)
             except AttributeError:
                 return setter(obj, attr_name, value)
+            if len(arranged_names) == 1 and arranged_names[0] == attr_name:
+                # An existing attribute is plainly reassigned.
+                return setter(obj, attr_name, value)
 
             if not isinstance(value, Iterable):
                 raise ValueError(
@@ -492,11 +1297,15 @@ def swizzle_attributes_retriever(
                     raise ValueError(
                         f"Tries to assign different values to attribute {k} in one go but only one is allowed"
                     )
+            if bulk_setter is not None:
+                return bulk_setter(obj, kv)
             for k, v in kv.items():
                 setter(obj, k, v)
 
         if setter is not None:
-            return get_attributes, wraps(setter)(set_attributes)
+            set_attributes = wraps(setter)(set_attributes)
+            set_attributes._swizzle_wrapped = (setter,)
+            return get_attributes, set_attributes
         return get_attributes
 
     if getattr_funcs is not None:
@@ -505,6 +1314,22 @@ def swizzle_attributes_retriever(
         return _swizzle_attributes_retriever
 
 
+def _unwrap_swizzled(funcs):
+    """
+    Replaces swizzle wrappers in `funcs` by the functions they wrap.
+
+    Decorating a subclass of a decorated class then installs one retriever
+    over the original lookups instead of wrapping the inherited wrapper, so
+    a lookup resolves a name once however many classes are decorated.
+    """
+    result = []
+    for func in funcs:
+        for wrapped in getattr(func, "_swizzle_wrapped", (func,)):
+            if wrapped not in result:
+                result.append(wrapped)
+    return result
+
+
 def swizzle(
     cls=None,
     meta=False,
@@ -512,6 +1337,9 @@ def swizzle(
     type=swizzledtuple,
     only_attrs=None,
     setter=False,
+    precompiled=None,
+    engine="auto",
+    verify=False,
 ):
     """
     Decorator that adds attribute swizzling capabilities to a class.
@@ -521,6 +1349,13 @@ def swizzle(
     be "swizzled." For example, if an object `p` has attributes `x` and `y`, then
     `p.x` behaves normally, but `p.yx` triggers swizzling logic and returns `(p.y, p.x)`.
 
+    A class defining `__swizzle_get_many__(self, names)` gets the distinct parts of a
+    swizzled read fetched in one call, which must return their values in order (e.g. one
+    round trip for a proxy). This applies whenever names can be split without the
+    object, i.e. with `only_attrs` or the `"sep"`, `"fixed"`, `"trie"` or `"regex"` engines.
+    The hook is looked up on the type of each instance, so undecorated subclasses can
+    add or override it.
+
     Args:
         cls (type, optional): Class to decorate. If `None`, returns a decorator function
             for later use. Defaults to `None`.
@@ -530,16 +1365,40 @@ def swizzle(
             If `None`, attributes are concatenated directly. Defaults to `None`.
         type (type, optional): Type used for the returned collection of swizzled attributes.
             Defaults to `swizzledtuple` (a tuple subclass with swizzling behavior). Can be
-            set to `tuple` or any compatible type.
+            set to `tuple` or any compatible type, or to `swizzle.typed(...)` to pack
+            numeric results into an `array.array`.
         only_attrs (iterable of str, int, or AttrSource, optional): Specifies allowed attributes
             for swizzling:
             - Iterable of strings: allowlist of attribute names.
             - Integer: restricts to attribute names of that length.
             - `AttrSource.SLOTS`: uses attributes from the class’s `__slots__`.
+            - `AttrSource.FIELDS`: uses the fields of a NamedTuple or dataclass
+              (including `dataclass(slots=True)`).
+            With `AttrSource`, swizzled reads of instances fetch the fields directly
+            (slot descriptors, tuple indices or the instance dict).
             - `None`: all attributes allowed. Defaults to `None`.
         setter (bool, optional): Enables assignment to swizzled attributes (e.g., `obj.xy = 1, 2`).
             Strongly recommended to define `__slots__` when enabled to avoid accidental new attributes.
+            A class defining `__swizzle_set__(self, values)` receives all parts of one swizzled
+            assignment as a dict in a single call instead of one `__setattr__` call per part.
             Defaults to `False`.
+
+        precompiled (str or module, optional): Module generated by `python -m swizzle.compile`
+            for this class, or its import name. Its accessors are installed on the class so
+            the exported names skip parsing and result classes are not generated at runtime.
+            Other names keep swizzling dynamically. A module name that cannot be found is
+            ignored with an `ImportWarning`, so the class can be imported to generate it.
+            Not supported together with `setter`. Defaults to `None`.
+        engine (str, optional): Strategy used to split swizzled names into attribute names:
+            - `"auto"`: picks one from `only_attrs` and `sep`, as listed below.
+            - `"reference"`: greedy longest-substring scan over the object's attributes.
+            - `"sep"`: splits at `sep`, which no allowed attribute may contain.
+            - `"fixed"`: splits into names of the single length given by `only_attrs`.
+            - `"trie"` / `"regex"`: longest-prefix match against the `only_attrs` names.
+            Engines other than `"auto"` and `"reference"` raise `ValueError` if the
+            options do not support them. Defaults to `"auto"`.
+        verify (bool, optional): Debug mode that also splits every name with the reference
+            engine and raises `AssertionError` if the results differ. Defaults to `False`.
     Returns:
         type or callable: If `cls` is provided, returns the decorated class. Otherwise, returns
         a decorator function to apply later.
@@ -572,6 +1431,7 @@ def swizzle(
     def class_decorator(cls):
         # Collect attribute retrieval functions from the class
         nonlocal only_attrs
+        field_plan = None
         if isinstance(only_attrs, str):
             if only_attrs == AttrSource.SLOTS:
                 only_attrs = cls.__slots__
@@ -592,28 +1452,56 @@ def swizzle(
                     raise ValueError(
                         f"Fields can not be empty for only_attrs = {AttrSource.FIELDS}"
                     )
+            # The exact field set is known, so swizzled reads can skip the
+            # generic lookup.
+            field_plan = get_field_plan(cls, frozenset(only_attrs))
+
+        if precompiled is not None and setter:
+            raise ValueError(
+                "Precompiled accessors cannot be combined with setter=True"
+            )
 
-        getattr_methods = get_getattr_methods(cls)
+        getattr_methods = _unwrap_swizzled(get_getattr_methods(cls))
 
         if setter:
-            setattr_method = get_setattr_method(cls)
+            setattr_method = _unwrap_swizzled([get_setattr_method(cls)])[0]
             new_getter, new_setter = swizzle_attributes_retriever(
                 getattr_methods,
                 sep,
                 type,
                 only_attrs,
                 setter=setattr_method,
+                bulk_setter=get_bulk_setter(cls, setattr_method),
+                field_plan=field_plan,
+                engine=engine,
+                verify=verify,
             )
             setattr(cls, getattr_methods[-1].__name__, new_getter)
             setattr(cls, setattr_method.__name__, new_setter)
         else:
             new_getter = swizzle_attributes_retriever(
-                getattr_methods, sep, type, only_attrs, setter=None
+                getattr_methods,
+                sep,
+                type,
+                only_attrs,
+                setter=None,
+                field_plan=field_plan,
+                engine=engine,
+                verify=verify,
             )
             setattr(cls, getattr_methods[-1].__name__, new_getter)
 
-        # Handle meta-class swizzling if requested
-        if meta:
+        # Handle meta-class swizzling if requested. A metaclass that already
+        # swizzles with the same options is reused instead of layering another.
+        meta_options = (
+            sep,
+            type,
+            only_attrs if isinstance(only_attrs, int) else frozenset(only_attrs or ()),
+            bool(setter),
+            engine,
+            verify,
+        )
+        if meta and getattr(_type(cls), "_swizzle_meta_options", None) != meta_options:
             meta_cls = _type(cls)
 
             class SwizzledMetaType(meta_cls):
@@ -640,23 +1528,39 @@ def swizzle(
             meta_cls = SwizzledMetaType
             cls = SwizzledClass
 
-            meta_funcs = get_getattr_methods(meta_cls)
+            meta_cls._swizzle_meta_options = meta_options
+            meta_funcs = _unwrap_swizzled(get_getattr_methods(meta_cls))
             if setter:
-                setattr_method = get_setattr_method(meta_cls)
+                setattr_method = _unwrap_swizzled([get_setattr_method(meta_cls)])[0]
                 new_getter, new_setter = swizzle_attributes_retriever(
                     meta_funcs,
                     sep,
                     type,
                     only_attrs,
                     setter=setattr_method,
+                    bulk_setter=get_bulk_setter(meta_cls, setattr_method),
+                    engine=engine,
+                    verify=verify,
                 )
                 setattr(meta_cls, meta_funcs[-1].__name__, new_getter)
                 setattr(meta_cls, setattr_method.__name__, new_setter)
             else:
                 new_getter = swizzle_attributes_retriever(
-                    meta_funcs, sep, type, only_attrs, setter=None
+                    meta_funcs,
+                    sep,
+                    type,
+                    only_attrs,
+                    setter=None,
+                    engine=engine,
+                    verify=verify,
                 )
                 setattr(meta_cls, meta_funcs[-1].__name__, new_getter)
+        if precompiled is not None:
+            _load_precompiled(cls, precompiled, sep, type)
+        if _pending_warmup:
+            _warm_class(
+                cls, _pending_warmup.pop((cls.__module__, cls.__qualname__), ())
+            )
         return cls
 
     if cls is None:
@@ -665,9 +1569,184 @@ def swizzle(
         return class_decorator(cls)
 
 
+def _load_precompiled(cls, module, sep, type):
+    if isinstance(module, str):
+        try:
+            module = importlib.import_module(module)
+        except ModuleNotFoundError as e:
+            if e.name != module:
+                raise
+            warnings.warn(
+                f"Precompiled swizzle module {module!r} not found, "
+                f"{cls.__qualname__} swizzles dynamically",
+                ImportWarning,
+                stacklevel=3,
+            )
+            return
+    if module.SEP != (sep or "") or module.TYPE != getattr(type, "__name__", None):
+        raise ValueError(
+            f"{module.__name__} was compiled for different swizzle options than "
+            f"{cls.__qualname__}; regenerate it with python -m swizzle.compile"
+        )
+    for name, accessor in module.ACCESSORS.items():
+        if name not in cls.__dict__:
+            setattr(cls, name, accessor)
+
+
+def prepare(cls):
+    """
+    Runs the deferred setup of a decorated class ahead of its first swizzle.
+
+    Decorating is cheap because name splitters are only compiled when a class
+    is first swizzled. Call this at startup for classes whose first swizzled
+    access must not pay that cost, e.g. in latency-sensitive request paths.
+
+    Args:
+        cls (type): Class decorated with `swizzle`, or a `swizzledtuple` class.
+    Returns:
+        type: `cls`, so it can also be used as a class decorator.
+    """
+    hooks = [_find_hook(target, "_swizzle_prepare") for target in (cls, _type(cls))]
+    if not any(hooks):
+        raise TypeError(f"{cls.__qualname__} is not decorated with swizzle")
+    for hook in hooks:
+        if hook is not None:
+            hook()
+    return cls
+
+
+def start_profiling():
+    """
+    Starts recording which swizzle names are resolved on which classes.
+
+    Recording adds a small cost to every swizzled access until
+    `stop_profiling` is called. Setting the environment variable
+    `SWIZZLE_PROFILE` to a path records from import time on and writes the
+    profile to that path at interpreter exit.
+
+    Returns:
+        Profile: The profile being recorded into.
+    """
+    global _profile
+    _profile = Profile()
+    return _profile
+
+
+def stop_profiling():
+    """
+    Stops recording and returns the recorded profile, or `None` if none was active.
+    """
+    global _profile
+    profile, _profile = _profile, None
+    return profile
+
+
+def _find_hook(target, hook="_swizzle_warm"):
+    for klass in target.__mro__:
+        for name in ("__getattr__", "__getattribute__"):
+            found = getattr(klass.__dict__.get(name), hook, None)
+            if found is not None:
+                return found
+    return None
+
+
+def _warm_class(cls, entries):
+    count = 0
+    for entry in entries:
+        target = _type(cls) if entry["meta"] else cls
+        warm = _find_hook(target)
+        if warm is None:
+            continue
+        try:
+            warm(cls, entry["name"], entry["parts"])
+        except AttributeError:
+            continue  # the profile is stale for this name
+        count += 1
+    return count
+
+
+def _resolve(module, qualname, import_modules):
+    if module not in _sys.modules:
+        if not import_modules:
+            return None
+        try:
+            __import__(module)
+        except ImportError:
+            return None
+    obj = _sys.modules[module]
+    for part in qualname.split("."):
+        obj = getattr(obj, part, None)
+        if obj is None:
+            return None
+    return obj
+
+
+def warmup(profile, *, min_count=1, import_modules=True):
+    """
+    Pre-parses profiled swizzle names and prebuilds their result classes.
+
+    Entries for classes that are already decorated are warmed immediately.
+    Entries for classes that cannot be resolved yet are kept and warmed as
+    soon as the class is decorated. Setting the environment variable
+    `SWIZZLE_WARMUP` to a profile path does this at import time without
+    importing any modules.
+
+    Args:
+        profile (Profile | str | PathLike): Profile or path of a dumped profile.
+        min_count (int, optional): Ignore names resolved fewer times. Defaults to 1.
+        import_modules (bool, optional): Import the modules of profiled classes that
+            are not imported yet. Defaults to True.
+    Returns:
+        int: Number of names warmed immediately.
+
+    Example:
+        ```python
+        profile = swizzle.start_profiling()
+        run_workload()
+        swizzle.stop_profiling().dump("swizzle-profile.json")
+
+        # in a fresh process
+        swizzle.warmup("swizzle-profile.json")
+        ```
+    """
+    if not isinstance(profile, Profile):
+        profile = Profile.load(profile)
+    by_class = {}
+    for entry in profile.entries(min_count):
+        by_class.setdefault((entry["module"], entry["qualname"]), []).append(entry)
+    count = 0
+    for key, entries in by_class.items():
+        cls = _resolve(*key, import_modules)
+        if cls is None:
+            _pending_warmup.setdefault(key, []).extend(entries)
+        else:
+            count += _warm_class(cls, entries)
+    return count
+
+
 t = swizzledtuple
 # c = swizzledclass
 
+from .typed import Typed, typed  # noqa: E402
+from . import io, sqlite  # noqa: E402
+from .explain import Explanation, explain  # noqa: E402
+from .expressions import SwizzleExpr, expr  # noqa: E402
+from .mappings import MappingSwizzler, SwizzledMapping, mapping  # noqa: E402
+from .proxies import SwizzleProxy, TypeSwizzler, register, wrap  # noqa: E402
+from .structs import StructView, swizzledstruct  # noqa: E402
+
+
+def _dump_profile_at_exit(path):
+    if _profile is not None:
+        _profile.dump(path)
+
+
+if os.environ.get("SWIZZLE_PROFILE"):
+    atexit.register(_dump_profile_at_exit, os.environ["SWIZZLE_PROFILE"])
+    start_profiling()
+if os.environ.get("SWIZZLE_WARMUP"):
+    warmup(os.environ["SWIZZLE_WARMUP"], import_modules=False)
+
 
 class Swizzle(types.ModuleType):
     def __init__(self):
@@ -682,8 +1761,24 @@ class Swizzle(types.ModuleType):
         type=swizzledtuple,
         only_attrs=None,
         setter=False,
+        precompiled=None,
+        engine="auto",
+        verify=False,
     ):
-        return swizzle(cls, meta, sep, type, only_attrs, setter)
+        return swizzle(
+            cls, meta, sep, type, only_attrs, setter, precompiled, engine, verify
+        )
+
+    def __getattr__(self, name):
+        # The vector types precompute their swizzle properties and operators,
+        # so they are only built when first used.
+        if name in ("Vector", "VectorArray", "vec2", "vec3", "vec4"):
+            from . import vectors
+
+            value = getattr(vectors, name)
+            setattr(self, name, value)
+            return value
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 _sys.modules[__name__] = Swizzle()
@@ -0,0 +1,232 @@
+import argparse
+import importlib
+import sys
+
+from . import _find_hook, swizzledtuple
+from .profile import Profile
+from .utils import make_splitter
+
+_HEADER = '''\
+# Generated by `python -m swizzle.compile {target}`. Do not edit.
+from swizzle import swizzle_attributes_retriever as _retriever
+from swizzle import swizzledtuple as _swizzledtuple
+
+try:
+    from _collections import _tuplegetter
+except ImportError:
+    from operator import itemgetter as _itemgetter
+
+    _tuplegetter = lambda index, doc: property(_itemgetter(index), doc=doc)
+
+TARGET = {target!r}
+SEP = {sep!r}
+TYPE = {type!r}
+
+_tuple = tuple
+_tuple_new = tuple.__new__
+_object_getattribute = object.__getattribute__
+'''
+
+# Exported result classes take their methods from the shared holder of
+# runtime swizzledtuples, so they cannot drift from them. Each class only
+# carries its own field data, so the generated module stays small and imports
+# quickly.
+_RESULT_BASE = '''
+
+from operator import itemgetter as _itemgetter
+
+from swizzle import _SWIZZLEDTUPLE_METHODS
+
+
+def _getattribute(fields):
+    return _retriever(_object_getattribute, SEP or None, _swizzledtuple, fields)
+
+
+def _arranger(indices):
+    if len(indices) == 1:
+        (index,) = indices
+        return staticmethod(lambda row: (row[index],))
+    return staticmethod(_itemgetter(*indices))
+
+
+class _Result(_tuple):
+    "Base of the precompiled swizzledtuple result classes below."
+
+    __slots__ = ()
+    _compact = False
+    _sep = SEP
+    _from_arranged = _tuple
+
+
+for _name, _method in _SWIZZLEDTUPLE_METHODS.items():
+    setattr(_Result, _name, _method)'''
+
+
+def _result_class(ident, typename, names):
+    fields = tuple(dict.fromkeys(names))
+    indices = tuple(fields.index(name) for name in names)
+    args = ", ".join(fields)
+    arranged = ", ".join(names) + ("," if len(names) == 1 else "")
+    repr_fmt = "(" + ", ".join(f"{name}=%r" for name in names) + ")"
+    lines = [
+        "",
+        "",
+        f"class {ident}(_Result):",
+        f"    {f'{typename}({args})'!r}",
+        "",
+        "    __slots__ = ()",
+        f"    _fields = {fields!r}",
+        f"    _arrange_names = {tuple(names)!r}",
+        f"    _arrange_indices = {indices!r}",
+        "    _field_defaults = {}",
+        f"    _repr_fmt = {repr_fmt!r}",
+        "    _arrange = _store = _arranger(_arrange_indices)",
+        "    __getattribute__ = _getattribute(_fields)",
+        "",
+        f"    def __new__(_cls, {args}):",
+        f"        {f'Create new instance of {typename}({args})'!r}",
+        f"        return _tuple_new(_cls, ({arranged}))",
+        "",
+    ]
+    for name in fields:
+        index = names.index(name)
+        lines.append(
+            f"    {name} = _tuplegetter({index}, 'Alias for field number {index}')"
+        )
+    lines += ["", "", f"{ident}.__name__ = {typename!r}"]
+    return lines
+
+
+def export(cls, names, *, attrs=None):
+    """
+    Generates the source of a module with precompiled swizzle accessors for `cls`.
+
+    For each name, the module defines a read-only property that gathers the
+    swizzled attributes directly and, for `swizzledtuple` results, a static
+    result class written out as plain Python. Load the module with
+    `swizzle(precompiled=...)` to install the properties on the class.
+
+    Args:
+        cls (type): Class decorated with `swizzle`.
+        names (Iterable[str]): Swizzle names to export, e.g. `["zyx", "xy"]`.
+        attrs (Iterable[str], optional): Attribute names used to split `names`. Required
+            only if `cls` was decorated without `only_attrs`.
+    Returns:
+        str: Source code of the generated module.
+    """
+    parse = _find_hook(cls, "_swizzle_parse")
+    options = _find_hook(cls, "_swizzle_options")
+    if parse is None:
+        raise TypeError(f"{cls.__qualname__} is not decorated with swizzle")
+    sep, type = options["sep"], options["type"]
+    if options["setter"]:
+        raise ValueError("Precompiled accessors cannot be exported for setter=True")
+    if type not in (swizzledtuple, tuple, list):
+        raise ValueError(
+            f"Only tuple, list and swizzledtuple results can be exported, not {type!r}"
+        )
+    if attrs is not None:
+        parse = make_splitter(list(attrs), sep).split_longest_prefix
+
+    typename = cls.__name__
+    target = f"{cls.__module__}:{cls.__qualname__}"
+    lines = [_HEADER.format(target=target, sep=sep, type=type.__name__)]
+    if type is swizzledtuple:
+        lines.append(_RESULT_BASE)
+    accessors = []
+    for name in dict.fromkeys(names):
+        try:
+            parts = list(parse(name))
+        except TypeError:
+            raise ValueError(
+                f"{target} has no only_attrs; pass attrs to split {name!r}"
+            ) from None
+        if len(parts) < 2:
+            raise ValueError(f"{name!r} is not a swizzle of several attributes")
+        gathered = ", ".join(f"self.{part}" for part in parts)
+        if type is swizzledtuple:
+            ident = f"{typename}_{name}"
+            lines += _result_class(ident, typename, parts)
+            body = f"_tuple_new({ident}, ({gathered}))"
+        elif type is tuple:
+            body = f"({gathered})"
+        else:
+            body = f"[{gathered}]"
+        doc = f"Swizzle of {', '.join(parts)}"
+        lines += [
+            "",
+            "",
+            f"def _get_{name}(self):",
+            f"    {doc!r}",
+            f"    return {body}",
+        ]
+        accessors.append(name)
+    lines += ["", "", "ACCESSORS = {"]
+    lines += [f"    {name!r}: property(_get_{name})," for name in accessors]
+    lines += ["}", ""]
+    return "\n".join(lines)
+
+
+def _load_target(target):
+    module_name, colon, qualname = target.partition(":")
+    if not colon or not qualname:
+        raise ValueError(f"Target must look like 'module:Class', got {target!r}")
+    obj = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m swizzle.compile",
+        description="Export precompiled swizzle accessors of a decorated class "
+        "to a static module, to be loaded with swizzle(precompiled=...).",
+    )
+    parser.add_argument("target", help="decorated class as 'module:Class'")
+    parser.add_argument(
+        "--names", nargs="+", default=[], help="swizzle names to export"
+    )
+    parser.add_argument(
+        "--profile", help="also export the names recorded for the class in a profile"
+    )
+    parser.add_argument(
+        "--min-count",
+        type=int,
+        default=1,
+        help="ignore profiled names resolved fewer times (default: 1)",
+    )
+    parser.add_argument(
+        "--attrs",
+        nargs="+",
+        help="attribute names used to split names of classes without only_attrs",
+    )
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    try:
+        cls = _load_target(args.target)
+    except (ValueError, ImportError, AttributeError) as e:
+        parser.error(str(e))
+    names = [n for arg in args.names for n in arg.replace(",", " ").split()]
+    if args.profile:
+        key = (cls.__module__, cls.__qualname__)
+        for entry in Profile.load(args.profile).entries(args.min_count):
+            if (entry["module"], entry["qualname"]) == key and not entry["meta"]:
+                names.append(entry["name"])
+    if not names:
+        parser.error("no names to export; pass --names or --profile")
+    try:
+        source = export(cls, names, attrs=args.attrs)
+    except (ValueError, TypeError, AttributeError) as e:
+        parser.error(str(e))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(source)
+    else:
+        sys.stdout.write(source)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
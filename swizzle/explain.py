@@ -0,0 +1,130 @@
+import sys
+import time
+
+from . import _find_hook, _swizzledtuple_class
+
+
+class Explanation:
+    """
+    How a swizzle name is resolved on an object or class, as reported by `explain`.
+
+    `strategy` is the path the lookup takes: `"exact"` for a plain attribute,
+    `"plan"` or `"field_plan"` for names read through a compiled plan, and
+    otherwise the splitting engine (`"sep"`, `"fixed"`, `"trie"`, `"regex"` or
+    `"reference"`). `probes` counts the calls to the wrapped attribute lookups
+    and `misses` those of them that raised `AttributeError`. `cached` holds
+    the cache state from before the lookup. `seconds`, `allocated_blocks`,
+    `new_result_class` and `result_type` describe the lookup itself and are
+    None when only a class without swizzled class attributes was given.
+    """
+
+    def __init__(
+        self,
+        name,
+        owner,
+        report,
+        seconds=None,
+        allocated_blocks=None,
+        new_result_class=None,
+        result_type=None,
+    ):
+        self.name = name
+        self.owner = owner
+        self.strategy = report["strategy"]
+        self.engine = report["engine"]
+        self.parts = report["parts"]
+        self.probes = report["probes"]
+        self.misses = report["misses"]
+        self.batched = report["batched"]
+        self.cached = report["cached"]
+        self.error = report["error"]
+        self.seconds = seconds
+        self.allocated_blocks = allocated_blocks
+        self.new_result_class = new_result_class
+        self.result_type = result_type
+
+    def as_dict(self):
+        "Return the report as a dict of plain values, e.g. for a JSON debug endpoint."
+        return {
+            "name": self.name,
+            "owner": f"{self.owner.__module__}.{self.owner.__qualname__}",
+            "strategy": self.strategy,
+            "engine": self.engine,
+            "parts": self.parts,
+            "probes": self.probes,
+            "misses": self.misses,
+            "batched": self.batched,
+            "cached": dict(self.cached),
+            "error": None if self.error is None else str(self.error),
+            "seconds": self.seconds,
+            "allocated_blocks": self.allocated_blocks,
+            "new_result_class": self.new_result_class,
+            "result_type": None
+            if self.result_type is None
+            else self.result_type.__name__,
+        }
+
+    def __repr__(self):
+        return (
+            f"Explanation({self.owner.__qualname__}.{self.name}: {self.strategy} "
+            f"{self.parts}, {self.probes} probes)"
+        )
+
+
+def explain(obj, name):
+    """
+    Reports how `name` is resolved on a swizzled object, without instrumenting
+    any other lookup.
+
+    The name is looked up once for real, timed and with the allocations it
+    leaves counted, and then resolved again with counting probes. Given a
+    class, the name is looked up on the class if it swizzles its class
+    attributes (`meta=True`); otherwise it is only parsed, which needs
+    `only_attrs` for the parts to be known.
+
+    Args:
+        obj (object): Instance of a swizzled class, or the class itself.
+        name (str): The attribute name to explain.
+    Returns:
+        Explanation: The resolution report.
+
+    Example:
+        ```python
+        swizzle.explain(Point(1, 2), "yx").strategy  # "reference"
+        ```
+    """
+    if isinstance(obj, type):
+        hook = _find_hook(type(obj), "_swizzle_explain")
+        if hook is None:
+            hook = _find_hook(obj, "_swizzle_explain")
+            if hook is None:
+                raise TypeError(f"{obj.__qualname__} is not decorated with swizzle")
+            return Explanation(name, obj, hook(None, name))
+        owner = obj
+    else:
+        owner = type(obj)
+        hook = _find_hook(owner, "_swizzle_explain")
+        if hook is None:
+            raise TypeError(f"{owner.__qualname__} is not decorated with swizzle")
+
+    measured = {}
+
+    def access():
+        misses = _swizzledtuple_class.cache_info().misses
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        try:
+            result = getattr(obj, name)
+        except AttributeError:
+            result = None
+            measured["result_type"] = None
+        else:
+            measured["result_type"] = type(result)
+        measured["seconds"] = time.perf_counter() - start
+        measured["allocated_blocks"] = sys.getallocatedblocks() - blocks
+        measured["new_result_class"] = (
+            _swizzledtuple_class.cache_info().misses != misses
+        )
+        del result
+
+    return Explanation(name, owner, hook(obj, name, access), **measured)
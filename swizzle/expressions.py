@@ -0,0 +1,133 @@
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+
+from . import _find_hook, _swizzledtuple_class, get_builder, swizzledtuple
+from .utils import make_splitter
+
+_tuple = tuple
+_tuple_new = tuple.__new__
+
+
+class SwizzleExpr:
+    """
+    A chain of swizzles applied as a single gather.
+
+    `swizzle.expr("yzx").then("xxzyzz")(v)` equals `v.yzx.xxzyzz`, but the
+    steps are composed ahead of time: every step only selects attributes of
+    the previous one, so the chain reduces to the attribute names of its last
+    step. Applying it reads those attributes from `v` directly and builds one
+    result, without intermediate results or their classes.
+
+    The composition is planned once per class (or per class object for
+    `meta=True` swizzling). For classes decorated without `only_attrs`, the
+    first step is resolved once on the first object the expression is
+    applied to.
+    """
+
+    __slots__ = ("steps", "_plans")
+
+    def __init__(self, steps):
+        self.steps = steps
+        self._plans = {}
+
+    def then(self, name):
+        "Return the expression that applies `name` to the result of this one."
+        return expr(*self.steps, name)
+
+    def __call__(self, obj):
+        owner = obj if isinstance(obj, type) else type(obj)
+        plan = self._plans.get(owner)
+        if plan is None:
+            plan = self._plans[owner] = self._plan(obj)
+        return plan(obj)
+
+    def names(self, obj):
+        "Return the attribute names of `obj` the expression gathers, in result order."
+        target = type(obj)
+        parse = _find_hook(target, "_swizzle_parse")
+        options = _find_hook(target, "_swizzle_options") or {}
+        sep = options.get("sep", "")
+        first = self.steps[0]
+        parts = None
+        if parse is not None:
+            try:
+                parts = list(parse(first))
+            except TypeError:
+                pass  # unrestricted attributes, resolved on the object below
+        if parts is None:
+            parts = getattr(getattr(obj, first), "_arrange_names", None)
+            if parts is None:
+                raise TypeError(
+                    f"Cannot compose swizzles of {target.__name__!r}: {first!r} "
+                    "does not return a swizzledtuple"
+                )
+            parts = list(parts)
+        for step in self.steps[1:]:
+            if len(parts) < 2:
+                raise ValueError(
+                    f"Cannot continue a chain after a single attribute: {parts[0]!r}"
+                )
+            splitter = make_splitter(list(dict.fromkeys(parts)), sep)
+            parts = list(splitter.split_longest_prefix(step))
+        return parts
+
+    def _plan(self, obj):
+        parts = self.names(obj)
+        getter = attrgetter(*parts)
+        arranged = getattr(type(obj), "_arrange_names", None)
+        if isinstance(obj, tuple) and arranged is not None and len(parts) > 1:
+            # Swizzledtuples are gathered by position, skipping their
+            # swizzling __getattribute__ for every part.
+            first = {}
+            for i, name in enumerate(arranged):
+                first.setdefault(name, i)
+            gather = itemgetter(*[first[name] for name in parts])
+            getter = gather
+            if type(obj)._from_arranged is tuple:
+
+                def getter(obj):
+                    return gather(_tuple(obj))
+        if len(parts) == 1:
+            return getter
+        options = _find_hook(type(obj), "_swizzle_options") or {}
+        sep = options.get("sep", "")
+        type_ = options.get("type", swizzledtuple)
+        compact = options.get("compact", False)
+        if type_ is swizzledtuple and not compact:
+            name = obj.__name__ if isinstance(obj, type) else type(obj).__name__
+            cls = _swizzledtuple_class(name, tuple(parts), sep, False)
+            return lambda obj: _tuple_new(cls, getter(obj))
+        build = get_builder(type_, sep, compact)
+        return lambda obj: build(obj, parts, list(getter(obj)))
+
+    def __repr__(self):
+        first, *rest = self.steps
+        return f"swizzle.expr({first!r})" + "".join(f".then({s!r})" for s in rest)
+
+
+@lru_cache(maxsize=1024)
+def _expr(steps):
+    return SwizzleExpr(steps)
+
+
+def expr(*steps):
+    """
+    Creates a composed swizzle expression.
+
+    Expressions are cached by their chain of names, so `expr("yzx").then("xx")`
+    returns the same object, with the same per-class plans, every time.
+
+    Args:
+        *steps (str): Swizzle names applied one after another, e.g. `"yzx", "xxzyzz"`.
+    Returns:
+        SwizzleExpr: Callable that applies the chain to an object in one gather.
+
+    Example:
+        ```python
+        flip = swizzle.expr("yzx").then("xxzyzz")
+        print(flip(v))  # same as v.yzx.xxzyzz
+        ```
+    """
+    if not steps:
+        raise TypeError("expr() requires at least one swizzle name")
+    return _expr(tuple(steps))
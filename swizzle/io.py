@@ -0,0 +1,629 @@
+import csv
+import itertools
+import json
+import mmap
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from contextlib import contextmanager
+from operator import itemgetter
+
+from . import _swizzledtuple_class, swizzledtuple
+from .utils import make_splitter
+
+_tuple_new = tuple.__new__
+_object_getattribute = object.__getattribute__
+
+
+@contextmanager
+def _open(file, mode, **kwargs):
+    if hasattr(file, "read") or hasattr(file, "write"):
+        yield file
+    else:
+        with open(file, mode, encoding="utf-8", **kwargs) as f:
+            yield f
+
+
+@contextmanager
+def _open_binary(file):
+    if hasattr(file, "write"):
+        yield file
+    else:
+        with open(file, "wb") as f:
+            yield f
+
+
+def _projection(names, fields, sep):
+    """Resolve `fields` against `names` into the arranged names and their source indices."""
+    if fields is None:
+        arranged = list(names)
+    elif isinstance(fields, str):
+        arranged = list(make_splitter(names, sep or "").split_longest_prefix(fields))
+    else:
+        arranged = list(fields)
+    index = {name: i for i, name in enumerate(names)}
+    try:
+        indices = [index[name] for name in arranged]
+    except KeyError as e:
+        raise ValueError(f"Unknown field for projection: {e.args[0]!r}") from None
+    return arranged, indices
+
+
+def _row_class(typename, arranged, sep, module):
+    return swizzledtuple(
+        typename,
+        list(dict.fromkeys(arranged)),
+        arrange_names=arranged,
+        sep=sep,
+        module=module,
+    )
+
+
+def _row_factory(cls, indices, converters):
+    # Rows are stored in arranged order, so the gathered values can be handed
+    # to tuple.__new__ directly instead of going through the rearranging _make.
+    if len(indices) == 1:
+        (i,) = indices
+
+        def getter(row):
+            return (row[i],)
+
+    else:
+        getter = itemgetter(*indices)
+    if not converters:
+        return lambda row: _tuple_new(cls, getter(row))
+    return lambda row: _tuple_new(cls, [f(v) for f, v in zip(converters, getter(row))])
+
+
+def _converters(arranged, converters):
+    if not converters:
+        return None
+    funcs = [converters.get(name) for name in arranged]
+    if not any(funcs):
+        return None
+    return [f or (lambda v: v) for f in funcs]
+
+
+def read_csv(
+    file,
+    typename="Row",
+    *,
+    fields=None,
+    sep=None,
+    converters=None,
+    module=None,
+    **fmtparams,
+):
+    """
+    Lazily reads a CSV file as swizzledtuples.
+
+    The row class is created once from the header row; every data row is then
+    built through a fast path without rearranging. With `fields`, only the
+    projected columns are gathered and converted.
+
+    Args:
+        file (str | PathLike | file object): CSV file to read.
+        typename (str, optional): Name of the row class. Defaults to `"Row"`.
+        fields (str | Sequence[str], optional): Projection, either a swizzle name parsed
+            with `sep` (e.g. `"z_y_x"`) or a sequence of column names. Defaults to all columns.
+        sep (str, optional): Separator of the row class, also used to parse `fields`.
+            Defaults to None.
+        converters (dict, optional): Mapping of column name to a callable applied to
+            the raw string value. Only projected columns are converted.
+        module (str, optional): Module name of the row class.
+        **fmtparams: Formatting parameters passed to `csv.reader`.
+    Yields:
+        swizzledtuple: One instance of the row class per data row. Blank lines are skipped.
+    Raises:
+        ValueError: If a data row has a different number of fields than the header.
+
+    Example:
+        ```python
+        for row in read_csv("points.csv", "Point", fields="z_y_x", sep="_",
+                            converters={"x": float, "y": float, "z": float}):
+            print(row.x_z)
+        ```
+    """
+    with _open(file, "r", newline="") as f:
+        reader = csv.reader(f, **fmtparams)
+        header = next(reader, None)
+        if header is None:
+            return
+        names = swizzledtuple(typename, header, rename=True)._fields
+        arranged, indices = _projection(names, fields, sep)
+        cls = _row_class(typename, arranged, sep, module)
+        make = _row_factory(cls, indices, _converters(arranged, converters))
+        width = len(header)
+        for row in reader:
+            if len(row) != width:
+                # Blank lines are skipped like csv.DictReader does.
+                if not row:
+                    continue
+                raise ValueError(
+                    f"CSV line {reader.line_num} has {len(row)} fields, expected {width}"
+                )
+            yield make(row)
+
+
+def read_jsonl(
+    file,
+    typename="Row",
+    *,
+    fields=None,
+    sep=None,
+    converters=None,
+    module=None,
+):
+    """
+    Lazily reads a JSON-lines file of objects as swizzledtuples.
+
+    The row class is created once from the keys of the first object; every
+    following object must provide the same keys. Blank lines are skipped, and
+    keys that are not identifiers are renamed to positional names as in `read_csv`.
+
+    Args:
+        file (str | PathLike | file object): JSON-lines file to read.
+        typename (str, optional): Name of the row class. Defaults to `"Row"`.
+        fields (str | Sequence[str], optional): Projection, either a swizzle name parsed
+            with `sep` or a sequence of keys. Defaults to all keys of the first object.
+        sep (str, optional): Separator of the row class, also used to parse `fields`.
+            Defaults to None.
+        converters (dict, optional): Mapping of key to a callable applied to the
+            decoded value. Only projected keys are converted.
+        module (str, optional): Module name of the row class.
+    Yields:
+        swizzledtuple: One instance of the row class per object.
+    """
+    with _open(file, "r") as f:
+        lines = (line for line in f if line.strip())
+        first = next(lines, None)
+        if first is None:
+            return
+        first = json.loads(first)
+        keys = list(first)
+        names = swizzledtuple(typename, keys, rename=True)._fields
+        arranged, indices = _projection(names, fields, sep)
+        cls = _row_class(typename, arranged, sep, module)
+        make = _row_factory(
+            cls,
+            [keys[i] for i in indices],
+            _converters(arranged, converters),
+        )
+        yield make(first)
+        for line in lines:
+            yield make(json.loads(line))
+
+
+def write_csv(file, rows, *, header=True, **fmtparams):
+    """
+    Streams swizzledtuples to a CSV file.
+
+    Rows are written one at a time, so `rows` may be any iterable, including a
+    generator from `read_csv`. The header is taken from the arranged names of
+    the first row's class.
+
+    Args:
+        file (str | PathLike | file object): Destination file.
+        rows (Iterable[swizzledtuple]): Rows of a single swizzledtuple class.
+        header (bool, optional): Whether to write a header row. Defaults to True.
+        **fmtparams: Formatting parameters passed to `csv.writer`.
+    Returns:
+        int: Number of rows written.
+    """
+    count = 0
+    with _open(file, "w", newline="") as f:
+        writer = csv.writer(f, **fmtparams)
+        rows = iter(rows)
+        for row in rows:
+            if header:
+                writer.writerow(row._arrange_names)
+            writer.writerow(row)
+            count = 1
+            break
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def write_jsonl(file, rows):
+    """
+    Streams swizzledtuples to a JSON-lines file, one object per row.
+
+    Args:
+        file (str | PathLike | file object): Destination file.
+        rows (Iterable[swizzledtuple]): Rows of a single swizzledtuple class.
+    Returns:
+        int: Number of rows written.
+    """
+    count = 0
+    with _open(file, "w") as f:
+        names = None
+        dumps, write = json.dumps, f.write
+        for row in rows:
+            if names is None:
+                names = row._fields
+                first = {}
+                for i, name in enumerate(row._arrange_names):
+                    first.setdefault(name, i)
+                getter = itemgetter(*[first[n] for n in names])
+            values = getter(row) if len(names) > 1 else (row[0],)
+            write(dumps(dict(zip(names, values))))
+            write("\n")
+            count += 1
+    return count
+
+
+COLUMNS_MAGIC = b"SWZC"
+COLUMNS_VERSION = 1
+
+# Column types inferred from the values of the first row; "s" is UTF-8 text.
+# Inferred integer columns are promoted to "d" when a later value is a float.
+_COLUMN_TYPES = {int: "q", float: "d", str: "s"}
+
+
+def _align(n):
+    return (n + 7) & ~7
+
+
+class _Spool:
+    # Collects one column in a temporary file, a chunk of values at a time,
+    # so rows are streamed instead of kept.
+
+    def __init__(self, code, promote=False):
+        self.code = code
+        self.promote = promote
+        self.file = tempfile.TemporaryFile()
+        self.text = None
+        if code == "s":
+            # Text is stored as the end offsets of the values, after a leading
+            # 0, followed by their UTF-8 data.
+            self.text = tempfile.TemporaryFile()
+            self.size = 0
+            array("Q", [0]).tofile(self.file)
+
+    def write(self, values):
+        if self.text is None:
+            try:
+                chunk = array(self.code, values)
+            except TypeError:
+                if not self.promote:
+                    raise
+                self._to_float()
+                chunk = array(self.code, values)
+            chunk.tofile(self.file)
+            return
+        data = [value.encode("utf-8") for value in values]
+        ends = array("Q", itertools.accumulate(map(len, data), initial=self.size))
+        self.size = ends[-1]
+        ends[1:].tofile(self.file)
+        self.text.write(b"".join(data))
+
+    def _to_float(self):
+        # Rewrites the integers spooled so far as doubles, a block at a time.
+        floats = tempfile.TemporaryFile()
+        self.file.seek(0)
+        for block in iter(lambda: self.file.read(1 << 20), b""):
+            ints = array("q")
+            ints.frombytes(block)
+            array("d", ints).tofile(floats)
+        self.file.close()
+        self.file = floats
+        self.code = "d"
+        self.promote = False
+
+    def nbytes(self):
+        return self.file.tell() + (self.text.tell() if self.text else 0)
+
+    def copy_to(self, f):
+        "Write the column to `f`, padded to a multiple of 8 bytes."
+        for spooled in (self.file, self.text) if self.text else (self.file,):
+            spooled.seek(0)
+            shutil.copyfileobj(spooled, f)
+        nbytes = self.nbytes()
+        f.write(bytes(_align(nbytes) - nbytes))
+
+    def close(self):
+        self.file.close()
+        if self.text:
+            self.text.close()
+
+
+def write_columns(file, rows, *, types=None, chunk_rows=16384):
+    """
+    Streams swizzledtuples into a columnar file for `read_columns`.
+
+    The file has a header with the typename, field names, arrangement, sep and
+    column types, followed by one contiguous column per field. Values are
+    spooled to a temporary file per column in chunks of rows, so `rows` may
+    be larger than memory.
+
+    Args:
+        file (str | PathLike | binary file object): Destination file.
+        rows (Iterable[swizzledtuple]): Rows of a single swizzledtuple class.
+        types (dict, optional): Mapping of field name to an `array.array` type code,
+            or `"s"` for text. Other fields are typed by their value in the first row:
+            `int` as `"q"`, `float` as `"d"` and `str` as `"s"`. Integer columns that
+            later hold floats are written as `"d"`.
+        chunk_rows (int, optional): Rows buffered before they are spooled.
+            Defaults to 16384.
+    Returns:
+        int: Number of rows written.
+
+    Example:
+        ```python
+        write_columns("points.swzc", read_csv("points.csv", converters=...))
+        ds = read_columns("points.swzc")
+        print(sum(ds.x), ds.zyx.z[0])
+        ```
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        raise ValueError("Cannot write an empty column file: the row class is unknown")
+    cls = type(first)
+    names = cls._fields
+    # Field values are gathered from the stored tuple, bypassing the Python
+    # level __getitem__ of swizzledtuples.
+    if cls._compact:
+        getter = lambda row: tuple(tuple.__iter__(row))  # stored in field order
+    else:
+        positions = {}
+        for i, name in enumerate(cls._arrange_names):
+            positions.setdefault(name, i)
+        indices = [positions[name] for name in names]
+        if indices == list(range(len(cls._arrange_names))):
+            getter = None  # rows iterate over their stored values
+        elif len(indices) == 1:
+            (index,) = indices
+            getter = lambda row: (tuple(row)[index],)
+        else:
+            gather = itemgetter(*indices)
+            getter = lambda row: gather(tuple(row))
+    spools = []
+    for name, value in zip(names, getter(first) if getter else first):
+        code = (types or {}).get(name)
+        inferred = code is None
+        if inferred:
+            code = _COLUMN_TYPES.get(type(value))
+            if code is None:
+                raise TypeError(
+                    f"No column type for {name}={value!r}; pass one with types="
+                )
+        spools.append(_Spool(code, promote=inferred and code == "q"))
+    try:
+        count = 0
+        chunk = [getter(first) if getter else first]
+        while chunk:
+            # Transpose a chunk of rows into columns in one go.
+            for spool, column in zip(spools, zip(*chunk)):
+                spool.write(column)
+            count += len(chunk)
+            chunk = itertools.islice(rows, chunk_rows)
+            chunk = list(map(getter, chunk) if getter else chunk)
+
+        columns = []
+        offset = 0
+        for spool in spools:
+            columns.append([offset, spool.nbytes()])
+            offset += _align(spool.nbytes())
+        header = {
+            "version": COLUMNS_VERSION,
+            "byteorder": sys.byteorder,
+            "typename": cls.__name__,
+            "fields": list(names),
+            "arrange": list(cls._arrange_names),
+            "sep": cls._sep,
+            "types": [spool.code for spool in spools],
+            "rows": count,
+            "columns": columns,
+        }
+        encoded = json.dumps(header).encode("utf-8")
+        prefix = COLUMNS_MAGIC + struct.pack("<I", len(encoded)) + encoded
+        with _open_binary(file) as f:
+            f.write(prefix + bytes(_align(len(prefix)) - len(prefix)))
+            for spool in spools:
+                spool.copy_to(f)
+    finally:
+        for spool in spools:
+            spool.close()
+    return count
+
+
+class _TextColumn:
+    # Text column decoded on access from its end offsets and UTF-8 data.
+
+    def __init__(self, ends, data):
+        self._ends = ends
+        self._data = data
+
+    def __len__(self):
+        return len(self._ends) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("column index out of range")
+        ends = self._ends
+        return str(self._data[ends[index] : ends[index + 1]], "utf-8")
+
+    def __iter__(self):
+        data = self._data
+        start = 0
+        for end in self._ends[1:]:
+            yield str(data[start:end], "utf-8")
+            start = end
+
+    def release(self):
+        self._ends.release()
+        self._data.release()
+
+
+def _read_header(mapped, file):
+    view = memoryview(mapped)
+    try:
+        if view[:4] != COLUMNS_MAGIC:
+            raise ValueError(f"{file!r} is not a swizzle column file")
+        (length,) = struct.unpack_from("<I", view, 4)
+        header = json.loads(bytes(view[8 : 8 + length]))
+    finally:
+        view.release()
+    if header["version"] != COLUMNS_VERSION:
+        raise ValueError(f"Unsupported swizzle column file version in {file!r}")
+    if header["byteorder"] != sys.byteorder:
+        raise ValueError(f"{file!r} was written with {header['byteorder']} byte order")
+    return header, _align(8 + length)
+
+
+class ColumnFile:
+    """
+    A columnar file written by `write_columns`, mapped into memory.
+
+    Swizzled attributes select columns: `ds.x` is the column `x` and `ds.zyx`
+    is a swizzledtuple of the columns `z`, `y` and `x`. Numeric columns are
+    `memoryview`s of the mapped file, so only the pages of the columns that
+    are read are ever loaded. Text columns decode values on access. `rows`
+    and iteration lazily build swizzledtuples from the projected columns.
+
+    Column names take precedence over methods, so a column named `rows` is
+    still read as `ds.rows`; `ds["rows"]` and `ColumnFile.rows(ds)` always
+    work. The file metadata is kept in `_typename`, `_fields`, `_arrange`,
+    `_sep` and `_types`, like the metadata of swizzledtuples.
+
+    Args:
+        file (str | PathLike): Path of the file.
+    """
+
+    def __init__(self, file):
+        with open(file, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            header, start = _read_header(self._map, file)
+        except ValueError:
+            self._map.close()
+            raise
+        self._typename = header["typename"]
+        self._fields = tuple(header["fields"])
+        self._arrange = tuple(header["arrange"])
+        self._sep = header["sep"] or ""
+        self._types = dict(zip(self._fields, header["types"]))
+        self._length = header["rows"]
+        self._spans = {
+            name: (start + offset, nbytes)
+            for name, (offset, nbytes) in zip(self._fields, header["columns"])
+        }
+        self._views = {}
+        self._parsed = {}
+
+    def column(self, name):
+        "Return the column `name`, mapping it on first use."
+        column = self._views.get(name)
+        if column is None:
+            offset, nbytes = self._spans[name]
+            view = memoryview(self._map)[offset : offset + nbytes]
+            if self._types[name] == "s":
+                size = (self._length + 1) * 8
+                column = _TextColumn(view[:size].cast("Q"), view[size:])
+                view.release()
+            else:
+                column = view.cast(self._types[name])
+            self._views[name] = column
+        return column
+
+    _column = column
+
+    def _parse(self, fields):
+        if fields is None:
+            return self._arrange
+        key = fields if isinstance(fields, str) else tuple(fields)
+        names = self._parsed.get(key)
+        if names is None:
+            names = tuple(_projection(self._fields, fields, self._sep)[0])
+            self._parsed[key] = names
+        return names
+
+    def __getattribute__(self, name):
+        # Column names are tried before methods, like the keys of
+        # `swizzle.mapping`, and swizzles after them; private names are never
+        # columns.
+        if name[:1] == "_":
+            return _object_getattribute(self, name)
+        if name in _object_getattribute(self, "_spans"):
+            return self._column(name)
+        try:
+            return _object_getattribute(self, name)
+        except AttributeError:
+            pass
+        try:
+            return self[name]
+        except KeyError as e:
+            raise AttributeError(e.args[0]) from None
+
+    def __getitem__(self, name):
+        "Return the column `name`, or a swizzledtuple of the columns of a swizzle name."
+        try:
+            names = self._parse(name)
+        except ValueError as e:
+            raise KeyError(str(e)) from None
+        if len(names) == 1:
+            return self._column(names[0])
+        cls = _swizzledtuple_class(self._typename, names, self._sep, False)
+        return _tuple_new(cls, [self._column(n) for n in names])
+
+    def rows(self, fields=None):
+        """
+        Lazily yields swizzledtuples of the projected columns.
+
+        Args:
+            fields (str | Sequence[str], optional): Projection, either a swizzle name
+                parsed with the sep of the file or a sequence of field names.
+                Defaults to the arrangement the file was written with.
+        """
+        names = self._parse(fields)
+        cls = _swizzledtuple_class(self._typename, names, self._sep, False)
+        columns = [self._column(name) for name in names]
+        for values in zip(*columns):
+            yield _tuple_new(cls, values)
+
+    _rows = rows
+
+    def __iter__(self):
+        return self._rows()
+
+    def __len__(self):
+        return self._length
+
+    def close(self):
+        "Release the columns and unmap the file; columns must not be used afterwards."
+        for column in self._views.values():
+            column.release()
+        self._views.clear()
+        self._map.close()
+
+    _close = close
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._close()
+
+    def __repr__(self):
+        return f"ColumnFile({self._typename}, fields={self._fields}, rows={self._length})"
+
+
+def read_columns(file):
+    """
+    Opens a columnar file written by `write_columns`.
+
+    Reading a few columns of a wide file only touches those columns.
+
+    Args:
+        file (str | PathLike): Path of the file.
+    Returns:
+        ColumnFile: The mapped file; close it, or use it as a context manager.
+    """
+    return ColumnFile(file)
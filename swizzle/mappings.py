@@ -0,0 +1,265 @@
+from collections.abc import Iterable
+from functools import lru_cache
+from operator import itemgetter
+
+from . import _swizzledtuple_class, get_builder, swizzledtuple
+from .utils import is_valid_sep, make_splitter, split_attr_name
+
+_tuple_new = tuple.__new__
+
+
+class MappingSwizzler:
+    """
+    Resolves swizzle names against mapping keys instead of attributes.
+
+    A swizzler holds the splitting strategy and, for restricted key sets, a
+    per-name cache of compiled plans, so it should be shared by all mappings
+    with the same keys. Each plan gathers every part with a single
+    `operator.itemgetter` call.
+
+    Args:
+        sep (str, optional): Separator between keys in swizzled names. Defaults to None.
+        only_keys (iterable of str or int, optional): Allowed keys, or the fixed key length,
+            as for `only_attrs` in `swizzle`. Defaults to None (any key of the mapping).
+        type (type, optional): Type of multi-key results. Defaults to `swizzledtuple`.
+        typename (str, optional): Name of swizzledtuple result classes. Defaults to `"Mapping"`.
+    """
+
+    def __init__(
+        self, sep=None, only_keys=None, type=swizzledtuple, typename="Mapping"
+    ):
+        if sep is not None and not is_valid_sep(sep):
+            raise ValueError(f"Invalid value for sep: {sep!r}.")
+        self.sep = sep or ""
+        self.typename = typename
+        self.type = type
+        self._build = get_builder(type, self.sep)
+        self._plans = {}
+        self._fetchers = {}
+        self._split = None
+        self._splitter = None
+        self.only_keys = None
+        if isinstance(only_keys, int):
+            self._split = only_keys
+        elif only_keys:
+            self.only_keys = frozenset(only_keys)
+            if self.sep and not any(self.sep in key for key in self.only_keys):
+                self._split = "by_sep"
+            elif len(set(map(len, self.only_keys))) == 1:
+                self._split = len(next(iter(self.only_keys)))
+            else:
+                self._splitter = make_splitter(self.only_keys, self.sep)
+
+    def split(self, data, name):
+        "Return the keys of `data` that make up the swizzle `name`."
+        if self._split is not None:
+            keys = split_attr_name(name, self._split, self.sep)
+            for key in keys:
+                if self.only_keys is not None and key not in self.only_keys:
+                    raise AttributeError(
+                        f"Key {key} is not part of an allowed key for swizzling"
+                    )
+            return keys
+        if self._splitter is not None:
+            return list(self._splitter.split_longest_prefix(name))
+        return self._scan(data, name)
+
+    def _scan(self, data, name):
+        # Unrestricted keys depend on the mapping, so match substrings greedily.
+        sep, sep_len = self.sep, len(self.sep)
+        keys = []
+        i = 0
+        length = len(name)
+        while i < length:
+            for j in range(length, i, -1):
+                if name[i:j] in data:
+                    keys.append(name[i:j])
+                    break
+            else:
+                raise AttributeError(f"No matching key found for substring: {name[i:]}")
+            i = j
+            if sep_len and i < length:
+                if not name.startswith(sep, i):
+                    raise AttributeError(
+                        f"Expected separator '{sep}' at pos {i} in "
+                        f"'{name}', found '{name[i : i + sep_len]}'"
+                    )
+                i += sep_len
+                if i == length:
+                    raise AttributeError(
+                        f"Seperator can not be at the end of the string: {name}"
+                    )
+        return keys
+
+    def plan(self, data, name):
+        "Return `(keys, fetch)` for the swizzle `name`, where `fetch(data)` builds the result."
+        plan = self._plans.get(name)
+        if plan is None:
+            keys = tuple(self.split(data, name))
+            plan = (keys, self._compile(keys))
+            if self.only_keys is not None or isinstance(self._split, int):
+                self._plans[name] = plan
+                self._fetchers[name] = plan[1]
+        return plan
+
+    def _compile(self, keys):
+        if len(keys) == 1:
+            return itemgetter(keys[0])
+        getter = itemgetter(*keys)
+        if self.type is tuple:
+            return getter
+        if self.type is swizzledtuple:
+            try:
+                cls = _swizzledtuple_class(self.typename, keys, self.sep, False)
+            except ValueError:
+                # Keys such as `count` or `from` are not valid field names and
+                # are replaced with positional names.
+                cls = swizzledtuple(
+                    self.typename,
+                    list(dict.fromkeys(keys)),
+                    arrange_names=keys,
+                    sep=self.sep,
+                    rename=True,
+                )
+            return lambda data: _tuple_new(cls, getter(data))
+        build, names = self._build, list(keys)
+        return lambda data: build(data, names, list(getter(data)))
+
+    def get(self, data, name):
+        "Return the value or swizzled values of `name` in `data`."
+        if name in data:
+            return data[name]
+        plan = self._plans.get(name) or self.plan(data, name)
+        try:
+            return plan[1](data)
+        except KeyError as e:
+            raise AttributeError(f"No matching key found for {e.args[0]!r}") from None
+
+    def set(self, data, name, value):
+        "Assign `value` to `name` in `data`, distributing it over swizzled keys."
+        if name in data:
+            data[name] = value
+            return
+        try:
+            keys = self.plan(data, name)[0]
+        except AttributeError:
+            data[name] = value
+            return
+        if keys == (name,):
+            # An allowed key that is not in the mapping yet.
+            data[name] = value
+            return
+        if not isinstance(value, Iterable):
+            raise ValueError(
+                f"Expected an iterable value for swizzle attribute assignment, got {type(value)}"
+            )
+        if len(keys) != len(value):
+            raise ValueError(
+                f"Expected {len(keys)} values for swizzle attribute assignment, got {len(value)}"
+            )
+        kv = {}
+        for k, v in zip(keys, value):
+            if kv.setdefault(k, v) is not v:
+                raise ValueError(
+                    f"Tries to assign different values to key {k} in one go but only one is allowed"
+                )
+        data.update(kv)
+
+
+class SwizzledMapping:
+    """
+    Attribute-style swizzled view of a mapping.
+
+    Reads resolve through `__getitem__` of the wrapped mapping and writes go
+    back into it. Use `mapping` to create one.
+    """
+
+    __slots__ = ("_data", "_swizzler", "_fetchers")
+
+    def __init__(self, data, swizzler):
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_swizzler", swizzler)
+        object.__setattr__(self, "_fetchers", swizzler._fetchers)
+
+    def __getattribute__(self, name):
+        # Overriding __getattribute__ rather than __getattr__ avoids raising
+        # and discarding an AttributeError on every swizzled read, and keys
+        # and cached plans are tried before any attribute machinery.
+        data = _data_of(self)
+        if name in data:
+            return data[name]
+        fetch = _fetchers_of(self).get(name)
+        if fetch is not None:
+            try:
+                return fetch(data)
+            except KeyError as e:
+                raise AttributeError(
+                    f"No matching key found for {e.args[0]!r}"
+                ) from None
+        if name[:1] == "_":
+            try:
+                return _object_getattribute(self, name)
+            except AttributeError:
+                pass
+        return _swizzler_of(self).get(data, name)
+
+    def __setattr__(self, name, value):
+        self._swizzler.set(self._data, name, value)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._data!r})"
+
+
+_object_getattribute = object.__getattribute__
+_data_of = SwizzledMapping._data.__get__
+_swizzler_of = SwizzledMapping._swizzler.__get__
+_fetchers_of = SwizzledMapping._fetchers.__get__
+
+
+@lru_cache(maxsize=256)
+def _shared_swizzler(sep, only_keys, type, typename):
+    return MappingSwizzler(sep, only_keys, type, typename)
+
+
+def mapping(data, sep=None, only_keys=None, *, type=swizzledtuple, typename="Mapping"):
+    """
+    Wraps a mapping so its keys can be swizzled like attributes.
+
+    Wrappers created with the same settings share one `MappingSwizzler`, so a
+    swizzle name is parsed once no matter how many rows are wrapped.
+
+    Args:
+        data (Mapping): Mapping to wrap, e.g. a decoded JSON object or a row dict.
+        sep (str, optional): Separator between keys in swizzled names. Defaults to None.
+        only_keys (iterable of str or int, optional): Allowed keys or fixed key length.
+            Names are parsed once and cached only when this is given. Defaults to None.
+        type (type, optional): Type of multi-key results. Defaults to `swizzledtuple`.
+        typename (str, optional): Name of swizzledtuple result classes. Defaults to `"Mapping"`.
+    Returns:
+        SwizzledMapping: A view of `data` supporting swizzled reads and writes.
+
+    Example:
+        ```python
+        row = swizzle.mapping({"name": "Jane", "age": 30, "city": "Berlin"}, sep="_")
+        print(row.name_city)  # Mapping(name='Jane', city='Berlin')
+        row.age_city = 31, "Paris"
+        ```
+    """
+    if only_keys is not None and not isinstance(only_keys, int):
+        only_keys = frozenset(only_keys)
+    return SwizzledMapping(data, _shared_swizzler(sep, only_keys, type, typename))
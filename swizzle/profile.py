@@ -0,0 +1,71 @@
+import json
+
+PROFILE_VERSION = 1
+
+
+class Profile:
+    """
+    Counts which swizzle names are resolved on which classes.
+
+    Keys are `(module, qualname, meta, name)`, where `meta` is True when the
+    name was resolved on the class itself (`meta=True` swizzling) rather than
+    on an instance. Profiles are written with `dump` and read back with
+    `load`, and are consumed by `swizzle.warmup`.
+    """
+
+    def __init__(self, entries=None):
+        self.counts = {}
+        for entry in entries or ():
+            key = (entry["module"], entry["qualname"], entry["meta"], entry["name"])
+            self.counts[key] = [entry["count"], tuple(entry["parts"])]
+
+    def record(self, obj, attr_name, parts):
+        if isinstance(obj, type):
+            cls, meta = obj, True
+        else:
+            cls, meta = type(obj), False
+        key = (cls.__module__, cls.__qualname__, meta, attr_name)
+        entry = self.counts.get(key)
+        if entry is None:
+            self.counts[key] = [1, tuple(parts)]
+        else:
+            entry[0] += 1
+
+    def entries(self, min_count=1):
+        "Return the recorded entries as dicts, most frequent first."
+        result = [
+            {
+                "module": module,
+                "qualname": qualname,
+                "meta": meta,
+                "name": name,
+                "parts": list(parts),
+                "count": count,
+            }
+            for (module, qualname, meta, name), (count, parts) in self.counts.items()
+            if count >= min_count
+        ]
+        result.sort(key=lambda e: -e["count"])
+        return result
+
+    def dump(self, path, min_count=1):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": PROFILE_VERSION, "entries": self.entries(min_count)},
+                f,
+                indent=1,
+            )
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != PROFILE_VERSION:
+            raise ValueError(f"Unsupported swizzle profile version in {path!r}")
+        return cls(data["entries"])
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __repr__(self):
+        return f"Profile({len(self.counts)} entries)"
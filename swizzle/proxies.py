@@ -0,0 +1,291 @@
+import builtins
+from collections.abc import Iterable
+from operator import attrgetter
+
+from . import (
+    PARSE_CACHE_SIZE,
+    _swizzledtuple_class,
+    get_builder,
+    swizzle_attributes_retriever,
+    swizzledtuple,
+)
+from .utils import is_valid_sep
+
+_type = builtins.type
+_tuple_new = tuple.__new__
+
+
+class SwizzleProxy:
+    """
+    Base of the proxies returned by `wrap`, one subclass per swizzled type.
+
+    A proxy holds the wrapped object in its only slot and resolves swizzled
+    names through the compiled plans of its `TypeSwizzler`. Other attributes
+    are read from the wrapped object. Assignments are forwarded to the
+    wrapped object, with swizzled names distributed over their parts.
+    """
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj):
+        _set_wrapped(self, obj)
+
+    def __repr__(self):
+        return f"swizzle.wrap({self._obj!r})"
+
+
+_wrapped = SwizzleProxy._obj.__get__
+_set_wrapped = SwizzleProxy._obj.__set__
+_object_getattribute = object.__getattribute__
+
+
+def _proxy_getattribute(swizzler):
+    # Compiled names are served before the regular lookup, whose failure
+    # would cost more than the read itself.
+    plans = swizzler._plans
+    accessor = swizzler.accessor
+
+    def __getattribute__(self, name):
+        plan = plans.get(name)
+        if plan is not None:
+            return plan(_wrapped(self))
+        try:
+            return _object_getattribute(self, name)
+        except AttributeError:
+            pass
+        obj = _wrapped(self)
+        try:
+            plan = accessor(name)
+        except AttributeError:
+            return getattr(obj, name)
+        return plan(obj)
+
+    return __getattribute__
+
+
+def _proxy_setattr(swizzler):
+    set_attributes = swizzler.set
+
+    def __setattr__(self, name, value):
+        set_attributes(_wrapped(self), name, value)
+
+    return __setattr__
+
+
+def public_attributes(cls):
+    "Return the public, non-callable attribute names of `cls`, e.g. the fields of a C type."
+    return [
+        name
+        for name in dir(cls)
+        if not name.startswith("_") and not callable(getattr(cls, name, None))
+    ]
+
+
+def instance_attributes(obj):
+    "Return the public attribute names stored in the `__dict__` and slots of `obj`."
+    names = [name for name in getattr(obj, "__dict__", ()) if isinstance(name, str)]
+    for klass in _type(obj).__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        names += [slots] if isinstance(slots, str) else slots
+    return [
+        name
+        for name in dict.fromkeys(names)
+        if not name.startswith("_") and hasattr(obj, name)
+    ]
+
+
+class TypeSwizzler:
+    """
+    Swizzles the attributes of instances of a type without modifying the type.
+
+    Every swizzle name is parsed once per type and compiled into an accessor
+    that reads all its parts with a single `operator.attrgetter` call. Use
+    `accessor` for a free function, or `wrap` for proxies.
+
+    Args:
+        cls (type): The type whose instances are swizzled.
+        only_attrs (iterable of str or int, optional): Allowed attribute names, or
+            their fixed length, as for `swizzle`. Defaults to the public, non-callable
+            attributes of `cls`, which are the fields of most C types.
+        sep (str, optional): Separator between attribute names. Defaults to None.
+        type (type, optional): Type of multi-attribute results. Defaults to `swizzledtuple`.
+    """
+
+    def __init__(self, cls, only_attrs=None, sep=None, type=swizzledtuple):
+        if sep is not None and not is_valid_sep(sep):
+            raise ValueError(f"Invalid value for sep: {sep!r}.")
+        if only_attrs is None:
+            only_attrs = public_attributes(cls)
+            if not only_attrs:
+                raise ValueError(
+                    f"{cls.__qualname__} has no public attributes; pass only_attrs"
+                )
+        self.cls = cls
+        self.sep = sep or ""
+        self.type = type
+        self.only_attrs = only_attrs if isinstance(only_attrs, int) else set(only_attrs)
+        self._parse = swizzle_attributes_retriever(
+            getattr, sep, type, only_attrs
+        )._swizzle_parse
+        self._build = get_builder(type, self.sep)
+        self._plans = {}
+        self.proxy = _type(
+            f"{cls.__name__}Proxy",
+            (SwizzleProxy,),
+            {
+                "__slots__": (),
+                "__getattribute__": _proxy_getattribute(self),
+                "__setattr__": _proxy_setattr(self),
+            },
+        )
+
+    def _parts(self, name):
+        if isinstance(self.only_attrs, set) and name in self.only_attrs:
+            return [name]
+        return self._parse(name)
+
+    def accessor(self, name):
+        """
+        Returns `fetch(obj)` reading the swizzle `name` from an instance.
+
+        Raises:
+            AttributeError: If `name` cannot be split into allowed attributes.
+        """
+        plan = self._plans.get(name)
+        if plan is not None:
+            return plan
+        parts = self._parts(name)
+        if len(parts) == 1:
+            plan = attrgetter(parts[0])
+        else:
+            get = attrgetter(*parts)
+            if self.type is swizzledtuple:
+                result = _swizzledtuple_class(
+                    self.cls.__name__, tuple(parts), self.sep, False
+                )
+                plan = lambda obj: _tuple_new(result, get(obj))
+            else:
+                build = self._build
+                plan = lambda obj: build(obj, parts, list(get(obj)))
+        if len(self._plans) < PARSE_CACHE_SIZE:
+            self._plans[name] = plan
+        return plan
+
+    def get(self, obj, name):
+        "Return the swizzle `name` of `obj`."
+        return self.accessor(name)(obj)
+
+    def set(self, obj, name, value):
+        "Assign `value` to `name` of `obj`, distributing it over swizzled attributes."
+        try:
+            parts = self._parts(name)
+        except AttributeError:
+            parts = [name]
+        if len(parts) == 1:
+            setattr(obj, parts[0], value)
+            return
+        if not isinstance(value, Iterable):
+            raise ValueError(
+                f"Expected an iterable value for swizzle attribute assignment, got {_type(value)}"
+            )
+        if len(parts) != len(value):
+            raise ValueError(
+                f"Expected {len(parts)} values for swizzle attribute assignment, got {len(value)}"
+            )
+        kv = {}
+        for k, v in zip(parts, value):
+            if kv.setdefault(k, v) is not v:
+                raise ValueError(
+                    f"Tries to assign different values to attribute {k} in one go but only one is allowed"
+                )
+        for k, v in kv.items():
+            setattr(obj, k, v)
+
+    def __repr__(self):
+        return f"TypeSwizzler({self.cls.__qualname__})"
+
+
+_registry = {}
+# Type -> proxy class, including subclasses of registered types.
+_proxies = {}
+
+
+def register(cls, only_attrs=None, sep=None, *, type=swizzledtuple):
+    """
+    Registers how instances of `cls` are swizzled by `wrap`.
+
+    Use this for types that cannot be decorated, like `datetime`, `complex`,
+    `os.stat_result` or third-party classes. Registering a type again
+    replaces its settings; subclasses use the settings of the nearest
+    registered base.
+
+    Args:
+        cls (type): The type to swizzle.
+        only_attrs (iterable of str or int, optional): Allowed attribute names, or their
+            fixed length. Defaults to the public, non-callable attributes of `cls`.
+        sep (str, optional): Separator between attribute names. Defaults to None.
+        type (type, optional): Type of multi-attribute results. Defaults to `swizzledtuple`.
+    Returns:
+        TypeSwizzler: The swizzler of `cls`, whose `accessor` returns free functions.
+
+    Example:
+        ```python
+        swizzle.register(datetime.date, sep="_")
+        print(swizzle.wrap(datetime.date.today()).year_month_day)
+
+        ymd = swizzle.register(datetime.date, sep="_").accessor("year_month_day")
+        print(ymd(datetime.date.today()))
+        ```
+    """
+    swizzler = TypeSwizzler(cls, only_attrs, sep, type)
+    _registry[cls] = swizzler
+    _proxies.clear()
+    return swizzler
+
+
+def _proxy_class(cls, obj):
+    for base in cls.__mro__:
+        swizzler = _registry.get(base)
+        if swizzler is not None:
+            break
+    else:
+        # Classes keeping their data on instances have no class-level fields,
+        # so the attributes of the first wrapped instance are added.
+        only_attrs = list(
+            dict.fromkeys(public_attributes(cls) + instance_attributes(obj))
+        )
+        if not only_attrs:
+            raise TypeError(
+                f"Cannot infer the attributes of {cls.__qualname__}; call "
+                f"swizzle.register({cls.__qualname__}, only_attrs=[...]) first"
+            )
+        swizzler = register(cls, only_attrs)
+    _proxies[cls] = swizzler.proxy
+    return swizzler.proxy
+
+
+def wrap(obj):
+    """
+    Returns a proxy of `obj` whose attributes can be swizzled.
+
+    Types that were not registered with `register` are registered on first
+    use with their public, non-callable class attributes and the public
+    attributes stored on `obj`. Register types whose instances differ in
+    their attributes explicitly.
+
+    Args:
+        obj (object): The object to wrap.
+    Returns:
+        SwizzleProxy: A lightweight proxy reading swizzled names from `obj`.
+    Raises:
+        TypeError: If the attributes of an unregistered type cannot be inferred.
+
+    Example:
+        ```python
+        swizzle.wrap(3 + 4j).imagreal  # complex(imag=4.0, real=3.0)
+        ```
+    """
+    proxy = _proxies.get(_type(obj))
+    if proxy is None:
+        proxy = _proxy_class(_type(obj), obj)
+    return proxy(obj)
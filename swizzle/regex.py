@@ -0,0 +1,58 @@
+import re
+
+
+class RegexSplitter:
+    """
+    Splits swizzle names using a single compiled regular expression.
+
+    Drop-in alternative to `Trie` for restricted vocabularies: the allowed
+    names are compiled longest-first into one alternation, so validating and
+    splitting a name is a single `findall` whose parts, joined back with the
+    separator, must reproduce the name exactly. Each part is matched inside a
+    lookahead and consumed through a backreference, which makes it atomic and
+    gives the same greedy, non-backtracking longest-prefix result as
+    `Trie.split_longest_prefix`.
+    """
+
+    def __init__(self, words=None, sep=""):
+        self.sep = sep
+        self.sep_len = len(sep)
+        self.words = sorted(set(filter(None, words or ())), key=lambda w: (-len(w), w))
+        alternation = "|".join(map(re.escape, self.words)) or "(?!)"
+        self._part = re.compile(alternation)
+        self._findall = re.compile(
+            f"(?=({alternation}))\\1(?:{re.escape(sep)}|$)"
+        ).findall
+
+    def split_longest_prefix(self, query):
+        # Matches never overlap, so the parts rejoin to the query only when
+        # they tile it without gaps, i.e. when the trie would accept it too.
+        parts = self._findall(query)
+        if self.sep.join(parts) != query:
+            self._raise_error(query)
+        return parts
+
+    def _raise_error(self, query):
+        # Slow path: replay the trie walk to report the same error and position.
+        length = len(query)
+        i = 0
+        while i < length:
+            if i and self.sep_len:
+                if query.startswith(self.sep, i):
+                    i += self.sep_len
+                    if i == length:
+                        raise AttributeError(
+                            f"Seperator can not be at the end of the string: {query}"
+                        )
+                else:
+                    raise AttributeError(
+                        f"Expected separator '{self.sep}' at pos {i} in "
+                        f"'{query}', found '{query[i : i + self.sep_len]}'"
+                    )
+            match = self._part.match(query, i)
+            if match is None:
+                raise AttributeError(
+                    f"No matching attribute found for substring: {query[i:]} at pos {i}"
+                )
+            i = match.end()
+        raise AttributeError(f"No matching attribute found for {query}")
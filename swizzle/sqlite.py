@@ -0,0 +1,137 @@
+from functools import lru_cache
+from operator import itemgetter
+
+from . import swizzledtuple
+from .io import _projection, _row_class
+
+_tuple_new = tuple.__new__
+
+
+@lru_cache(maxsize=256)
+def _shape(typename, columns, fields, sep, module):
+    # One row class and constructor per result shape, shared by all queries
+    # and connections returning the same columns.
+    names = swizzledtuple(typename, columns, rename=True)._fields
+    arranged, indices = _projection(names, fields, sep)
+    cls = _row_class(typename, arranged, sep, module)
+    if indices == list(range(len(columns))):
+        return cls, None
+    if len(indices) == 1:
+        (i,) = indices
+        return cls, lambda row: (row[i],)
+    return cls, itemgetter(*indices)
+
+
+def _columns(description):
+    return tuple(column[0] for column in description)
+
+
+def make_row_factory(typename="Row", *, fields=None, sep=None, module=None):
+    """
+    Returns a sqlite3 row factory producing swizzledtuples.
+
+    The row class is created once per `cursor.description` and cached across
+    queries with the same columns; every row is then built with a single
+    `tuple.__new__` call, without rearranging. Column names that are not identifiers, such as
+    `count(*)`, are renamed to positional names.
+
+    Args:
+        typename (str, optional): Name of the row classes. Defaults to `"Row"`.
+        fields (str | Sequence[str], optional): Projection, either a swizzle name parsed
+            with `sep` (e.g. `"lon_lat"`) or a sequence of column names. SQLite still
+            returns all selected columns; use `query` to leave the others out of the
+            result set. Defaults to all columns.
+        sep (str, optional): Separator of the row classes, also used to parse `fields`.
+            Defaults to None.
+        module (str, optional): Module name of the row classes.
+    Returns:
+        callable: A factory for `Connection.row_factory` or `Cursor.row_factory`.
+    """
+    if fields is not None and not isinstance(fields, str):
+        fields = tuple(fields)
+    # The description of a cursor is only replaced by a new query, so the
+    # constructor is looked up again only when it changes.
+    state = (None, None, None)
+
+    def row_factory(cursor, row):
+        nonlocal state
+        description, cls, getter = state
+        if cursor.description is not description:
+            description = cursor.description
+            cls, getter = _shape(typename, _columns(description), fields, sep, module)
+            state = description, cls, getter
+        # Rows come in arranged order, so they are handed to tuple.__new__
+        # directly, like the rows of `swizzle.io` readers.
+        if getter is None:
+            return _tuple_new(cls, row)
+        return _tuple_new(cls, getter(row))
+
+    return row_factory
+
+
+# Row factory for `Row` swizzledtuples with all columns, e.g.
+# `connection.row_factory = swizzle.sqlite.row_factory`.
+row_factory = make_row_factory()
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def query(
+    connection,
+    sql,
+    parameters=(),
+    *,
+    typename="Row",
+    fields=None,
+    sep=None,
+    module=None,
+):
+    """
+    Executes `sql` and returns a cursor yielding swizzledtuples.
+
+    With `fields`, the query is wrapped in a `SELECT` of the projected columns
+    only, so SQLite never converts the others to Python objects. This needs
+    `sql` to be a single query that can be used as a subquery.
+
+    Args:
+        connection (sqlite3.Connection): Connection to execute on.
+        sql (str): The query.
+        parameters (Sequence | dict, optional): Query parameters. Defaults to none.
+        typename (str, optional): Name of the row classes. Defaults to `"Row"`.
+        fields (str | Sequence[str], optional): Projection, either a swizzle name parsed
+            with `sep` or a sequence of column names. Defaults to all columns.
+        sep (str, optional): Separator of the row classes, also used to parse `fields`.
+            Defaults to None.
+        module (str, optional): Module name of the row classes.
+    Returns:
+        sqlite3.Cursor: The executed cursor.
+
+    Example:
+        ```python
+        for lon, lat in swizzle.sqlite.query(connection, "SELECT * FROM places",
+                                             fields="lon_lat", sep="_"):
+            ...
+        ```
+    """
+    cursor = connection.cursor()
+    if fields is not None:
+        if not isinstance(fields, str):
+            fields = tuple(fields)
+        columns = _columns(
+            connection.execute(f"SELECT * FROM ({sql}) LIMIT 0", parameters).description
+        )
+        names = swizzledtuple(typename, columns, rename=True)._fields
+        arranged, _ = _projection(names, fields, sep)
+        selected = list(dict.fromkeys(arranged))
+        by_name = dict(zip(names, columns))
+        # Select each projected column once under its row class name; the row
+        # factory spreads duplicates over the arrangement.
+        sql = "SELECT {} FROM ({})".format(
+            ", ".join(f"{_quote(by_name[name])} AS {_quote(name)}" for name in selected), sql
+        )
+    cursor.row_factory = make_row_factory(
+        typename, fields=fields, sep=sep, module=module
+    )
+    return cursor.execute(sql, parameters)
@@ -0,0 +1,321 @@
+import struct as _struct
+import sys as _sys
+from collections.abc import Iterable
+
+from . import swizzledtuple
+from .utils import is_valid_sep, make_splitter
+
+_type = type
+_NATIVE_ORDER = "<" if _sys.byteorder == "little" else ">"
+_CASTABLE = frozenset("bBhHiIlLqQnNfd?cP")
+
+
+def swizzledstruct(
+    typename,
+    layout,
+    *,
+    byteorder="=",
+    sep=None,
+    type=swizzledtuple,
+    module=None,
+):
+    """
+    Creates a record class that overlays fixed-layout binary data with swizzled access.
+
+    Records are zero-copy views into any object supporting the buffer protocol
+    (`bytes`, `bytearray`, `memoryview`, `mmap.mmap`, `SharedMemory.buf`, ...).
+    A swizzled read such as `rec.zyx` unpacks only the fields it needs with a
+    `struct.Struct` compiled once per name, and a swizzled write such as
+    `rec.zyx = 3, 2, 1` packs the values directly into the buffer.
+
+    Args:
+        typename (str): Name of the new record type.
+        layout (Sequence[str] | str): Field specifications of the form `name:code`, where
+            `code` is a `struct` format code for a single value (e.g. `f`, `d`, `i`, `8s`).
+            A single string is split on whitespace and commas.
+        byteorder (str, optional): `struct` byte order character (`@`, `=`, `<`, `>`, `!`).
+            Defaults to `=` (native byte order, standard sizes, no alignment).
+        sep (str, optional): Separator between field names in swizzled names. Defaults to None.
+        type (type, optional): Type used for multi-field results. Defaults to `swizzledtuple`.
+        module (str, optional): Module name where the record type is defined.
+            Defaults to the caller's module.
+    Returns:
+        Type: A record class. `Cls(buffer, offset=0)` creates a single record and
+        `Cls.view(buffer)` a sequence of all records in a buffer.
+
+    Example:
+        ```python
+        Vec = swizzledstruct("Vec", "x:f y:f z:f w:f")
+        buf = bytearray(Vec.size * 2)
+        rec = Vec(buf)
+        rec.xyzw = 1, 2, 3, 4
+        print(rec.zyx)                 # Vec(z=3.0, y=2.0, x=1.0)
+        print(Vec.view(buf).x.tolist())  # [1.0, 0.0]
+        ```
+    """
+    if isinstance(layout, str):
+        layout = layout.replace(",", " ").split()
+    if byteorder not in ("@", "=", "<", ">", "!"):
+        raise ValueError(f"Invalid byte order: {byteorder!r}")
+    if sep is not None and not is_valid_sep(sep):
+        raise ValueError(f"Invalid value for sep: {sep!r}.")
+    if sep is None:
+        sep = ""
+
+    field_names = []
+    codes = []
+    for spec in layout:
+        name, colon, code = str(spec).partition(":")
+        if not colon or not name.isidentifier() or not code:
+            raise ValueError(
+                f"Field specification must look like 'name:code': {spec!r}"
+            )
+        if name.startswith("_") or name in ("size", "format", "view"):
+            raise ValueError(f"Field name would shadow a record attribute: {name!r}")
+        if name in field_names:
+            raise ValueError(f"Encountered duplicate field name: {name!r}")
+        try:
+            code_struct = _struct.Struct(byteorder + code)
+            if len(code_struct.unpack(bytes(code_struct.size))) != 1:
+                raise _struct.error
+        except _struct.error:
+            raise ValueError(f"Format code must describe exactly one value: {code!r}")
+        field_names.append(_sys.intern(name))
+        codes.append(code)
+
+    # Offsets honour alignment for "@" because they are measured on prefixes
+    # of the full format.
+    offsets = []
+    prefix = byteorder
+    for code in codes:
+        prefix += code
+        offsets.append(_struct.calcsize(prefix) - _struct.calcsize(byteorder + code))
+    full = _struct.Struct(prefix)
+    field_index = {name: i for i, name in enumerate(field_names)}
+    field_structs = [_struct.Struct(byteorder + code) for code in codes]
+    splitter = make_splitter(field_names, sep)
+    plans = {}
+
+    def compile_plan(names):
+        # One Struct that skips unused bytes and decodes the needed fields in
+        # layout order, plus the arrangement back into the requested order.
+        needed = sorted(set(names), key=field_index.__getitem__)
+        fmt = byteorder
+        pos = 0
+        for name in needed:
+            i = field_index[name]
+            if offsets[i] > pos:
+                fmt += f"{offsets[i] - pos}x"
+            fmt += codes[i]
+            pos = offsets[i] + field_structs[i].size
+        order = [needed.index(name) for name in names]
+        result_cls = None
+        if type is swizzledtuple:
+            unique = list(dict.fromkeys(names))
+            result_cls = swizzledtuple(
+                typename, unique, arrange_names=names, sep=sep or None, module=module
+            )
+            order = [needed.index(name) for name in unique]
+        return _struct.Struct(fmt), needed, order, result_cls
+
+    def get_plan(attr_name):
+        plan = plans.get(attr_name)
+        if plan is None:
+            names = list(splitter.split_longest_prefix(attr_name))
+            if len(names) < 2:
+                raise AttributeError(
+                    f"{typename!r} record has no attribute {attr_name!r}"
+                )
+            plan = plans[attr_name] = compile_plan(names)
+        return plan
+
+    def build(values, plan):
+        _, _, order, result_cls = plan
+        arranged = [values[i] for i in order]
+        if result_cls is not None:
+            return result_cls(*arranged)
+        return type(arranged)
+
+    def __init__(self, buffer, offset=0):
+        object.__setattr__(self, "_buffer", buffer)
+        object.__setattr__(self, "_offset", offset)
+
+    def __getattr__(self, attr_name):
+        plan = get_plan(attr_name)
+        return build(plan[0].unpack_from(self._buffer, self._offset), plan)
+
+    def __setattr__(self, attr_name, value):
+        if attr_name in field_index:
+            return object.__setattr__(self, attr_name, value)
+        try:
+            names = list(splitter.split_longest_prefix(attr_name))
+        except AttributeError:
+            raise AttributeError(
+                f"{typename!r} record has no attribute {attr_name!r}"
+            ) from None
+        if not isinstance(value, Iterable):
+            raise ValueError(
+                f"Expected an iterable value for swizzle attribute assignment, got {_type(value)}"
+            )
+        if len(names) != len(value):
+            raise ValueError(
+                f"Expected {len(names)} values for swizzle attribute assignment, got {len(value)}"
+            )
+        kv = {}
+        for k, v in zip(names, value):
+            if kv.setdefault(k, v) is not v:
+                raise ValueError(
+                    f"Tries to assign different values to attribute {k} in one go but only one is allowed"
+                )
+        buffer, offset = self._buffer, self._offset
+        for k, v in kv.items():
+            i = field_index[k]
+            field_structs[i].pack_into(buffer, offset + offsets[i], v)
+
+    def __repr__(self):
+        values = full.unpack_from(self._buffer, self._offset)
+        body = ", ".join(f"{n}={v!r}" for n, v in zip(field_names, values))
+        return f"{typename}({body})"
+
+    def _astuple(self):
+        "Return all fields of the record as a plain tuple."
+        return full.unpack_from(self._buffer, self._offset)
+
+    def _asdict(self):
+        "Return a new dict which maps field names to their values."
+        return dict(zip(field_names, full.unpack_from(self._buffer, self._offset)))
+
+    @classmethod
+    def view(cls, buffer):
+        "Return a sequence of all records stored back to back in `buffer`."
+        return StructView(cls, buffer)
+
+    class_namespace = {
+        "__doc__": f"{typename}({', '.join(layout)})",
+        "__slots__": ("_buffer", "_offset"),
+        "_fields": tuple(field_names),
+        "_offsets": tuple(offsets),
+        "_codes": tuple(codes),
+        "_byteorder": byteorder,
+        "_get_plan": staticmethod(get_plan),
+        "_build": staticmethod(build),
+        "size": full.size,
+        "format": full.format,
+        "__init__": __init__,
+        "__getattr__": __getattr__,
+        "__setattr__": __setattr__,
+        "__repr__": __repr__,
+        "_astuple": _astuple,
+        "_asdict": _asdict,
+        "view": view,
+    }
+    for i, name in enumerate(field_names):
+        field_struct, offset = field_structs[i], offsets[i]
+
+        def fget(self, _unpack=field_struct.unpack_from, _offset=offset):
+            return _unpack(self._buffer, self._offset + _offset)[0]
+
+        def fset(self, value, _pack=field_struct.pack_into, _offset=offset):
+            _pack(self._buffer, self._offset + _offset, value)
+
+        class_namespace[name] = property(
+            fget, fset, doc=f"Field {name!r} at byte offset {offset}"
+        )
+
+    for method in (__init__, __getattr__, __setattr__, __repr__, _astuple, _asdict):
+        method.__qualname__ = f"{typename}.{method.__name__}"
+
+    result = _type(typename, (), class_namespace)
+
+    if module is None:
+        try:
+            module = _sys._getframemodulename(1) or "__main__"
+        except AttributeError:
+            try:
+                module = _sys._getframe(1).f_globals.get("__name__", "__main__")
+            except (AttributeError, ValueError):
+                pass
+    if module is not None:
+        result.__module__ = module
+
+    return result
+
+
+class StructView:
+    """
+    Sequence of records stored back to back in a buffer.
+
+    Indexing returns record views, iterating yields them in order, and
+    attribute access returns whole columns: `view.x` is a single column and
+    `view.zyx` a swizzled collection of columns. Columns are strided
+    `memoryview`s into the buffer when the field can be cast natively, and
+    lists of decoded values otherwise.
+    """
+
+    __slots__ = ("_record", "_buffer", "_len")
+
+    def __init__(self, record, buffer):
+        self._record = record
+        self._buffer = memoryview(buffer).cast("B")
+        self._len = self._buffer.nbytes // record.size
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        size = self._record.size
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                raise ValueError("StructView only supports contiguous slices")
+            stop = max(start, stop)
+            return StructView(self._record, self._buffer[start * size : stop * size])
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("StructView index out of range")
+        return self._record(self._buffer, index * size)
+
+    def __iter__(self):
+        record, buffer = self._record, self._buffer
+        for offset in range(0, self._len * record.size, record.size):
+            yield record(buffer, offset)
+
+    def iter_unpack(self):
+        "Yield every record as a plain tuple of all its fields."
+        full = _struct.Struct(self._record.format)
+        return full.iter_unpack(self._buffer[: self._len * full.size])
+
+    def column(self, name):
+        "Return the values of field `name` across all records."
+        record = self._record
+        try:
+            i = record._fields.index(name)
+        except ValueError:
+            raise AttributeError(f"{record.__name__!r} has no field {name!r}") from None
+        code, offset, size = record._codes[i], record._offsets[i], record.size
+        data = self._buffer[: self._len * size]
+        # Standard and native sizes differ for codes like `l`, so the cast
+        # is only taken when the record layout uses the native size.
+        itemsize = _struct.calcsize(record._byteorder + code)
+        if (
+            code in _CASTABLE
+            and record._byteorder in ("@", "=", _NATIVE_ORDER)
+            and itemsize == _struct.calcsize("@" + code)
+            and offset % itemsize == 0
+            and size % itemsize == 0
+        ):
+            return data.cast(code)[offset // itemsize :: size // itemsize]
+        pad = size - offset - itemsize
+        column_struct = _struct.Struct(f"{record._byteorder}{offset}x{code}{pad}x")
+        return [value for (value,) in column_struct.iter_unpack(data)]
+
+    def __getattr__(self, attr_name):
+        record = self._record
+        if attr_name in record._fields:
+            return self.column(attr_name)
+        plan = record._get_plan(attr_name)
+        return record._build([self.column(name) for name in plan[1]], plan)
+
+    def __repr__(self):
+        return f"StructView({self._record.__name__}, len={self._len})"
@@ -0,0 +1,147 @@
+import struct
+from array import array as _array
+from array import typecodes as TYPECODES
+
+from . import _find_hook
+
+# Type codes for annotated or observed value types; ints widen to doubles
+# when mixed with floats.
+_ANNOTATION_CODES = {int: "q", float: "d", "int": "q", "float": "d"}
+
+
+class Typed:
+    """
+    Result type packing swizzled values into an `array.array` of one type code.
+
+    Results hold raw machine values instead of references to boxed numbers and
+    support the buffer protocol, so NumPy reads them without copying, e.g. with
+    `numpy.frombuffer(v.xyz)`. Without a type code, each decorated class infers
+    it once: from its annotations if all of them are `int` or `float`,
+    otherwise from the values of its first swizzled read. Values that do not
+    fit the type code raise `TypeError` or `OverflowError`, as for
+    `array.array`.
+
+    Args:
+        typecode (str, optional): An `array.array` type code such as `"d"`. Defaults to None.
+    """
+
+    def __init__(self, typecode=None):
+        if typecode is not None and typecode not in TYPECODES:
+            raise ValueError(f"Unknown array type code: {typecode!r}")
+        self.typecode = typecode
+        self._retrievers = {}
+
+    def builder(self):
+        "Return a `build(obj, names, values)` function for one decorated class."
+        typecode = self.typecode
+        if typecode is not None:
+            return lambda obj, names, values: _array(typecode, values)
+
+        def build(obj, names, values):
+            nonlocal typecode
+            if typecode is None:
+                # issubclass avoids isinstance's fallback lookup of a swizzled
+                # obj.__class__.
+                cls = obj if issubclass(type(obj), type) else type(obj)
+                typecode = annotated_typecode(cls) or value_typecode(values)
+            return _array(typecode, values)
+
+        return build
+
+    def read(self, obj, name, out=None, offset=0):
+        """
+        Reads the swizzle `name` of `obj` as typed values.
+
+        With `out`, the values are packed into that writable buffer (an
+        `array.array`, a NumPy array, a `memoryview`, ...) in its own element
+        format, starting at element `offset`, so no result object is built.
+        `obj` can be of any swizzled class, whatever its result type.
+
+        Returns:
+            array.array or buffer: The values, or `out`.
+        """
+        retrieve = self._retrievers.get(type(obj))
+        if retrieve is None:
+            retrieve = _find_hook(type(obj), "_swizzle_retrieve")
+            if retrieve is None:
+                raise TypeError(
+                    f"{type(obj).__qualname__} is not decorated with swizzle"
+                )
+            self._retrievers[type(obj)] = retrieve
+        values = retrieve(obj, name)[1]
+        if out is None:
+            cls = obj if issubclass(type(obj), type) else type(obj)
+            typecode = (
+                self.typecode or annotated_typecode(cls) or value_typecode(values)
+            )
+            return _array(typecode, values)
+        view = memoryview(out)
+        if offset < 0 or offset + len(values) > view.nbytes // view.itemsize:
+            raise IndexError(
+                f"{len(values)} values do not fit at offset {offset} of the buffer"
+            )
+        order, code = view.format[:-1], view.format[-1]
+        struct.pack_into(
+            f"{order}{len(values)}{code}", view, offset * view.itemsize, *values
+        )
+        return out
+
+    def __repr__(self):
+        return f"typed({self.typecode!r})"
+
+
+def annotated_typecode(cls):
+    "Return the type code for the annotations of `cls`, or None if they are not all numbers."
+    codes = set()
+    for klass in cls.__mro__:
+        for annotation in klass.__dict__.get("__annotations__", {}).values():
+            code = _ANNOTATION_CODES.get(annotation)
+            if code is None:
+                return None
+            codes.add(code)
+    if not codes:
+        return None
+    return "q" if codes == {"q"} else "d"
+
+
+def value_typecode(values):
+    "Return the type code that holds all `values`."
+    kinds = set(map(type, values))
+    if kinds <= {int, bool}:
+        return "q"
+    if kinds <= {int, bool, float}:
+        return "d"
+    raise TypeError(
+        f"Cannot infer an array type code for values of types "
+        f"{sorted(kind.__name__ for kind in kinds)}; pass one to swizzle.typed"
+    )
+
+
+def typed(typecode=None):
+    """
+    Returns a result type for `swizzle(type=...)` that packs swizzled values into
+    an `array.array`.
+
+    Args:
+        typecode (str, optional): An `array.array` type code, e.g. `"d"` for doubles or
+            `"q"` for 64 bit ints. Defaults to None, which infers it once per decorated
+            class from its annotations or its first swizzled read.
+    Returns:
+        Typed: The result type.
+
+    Example:
+        ```python
+        f64 = swizzle.typed("d")
+
+        @swizzle(type=f64)
+        class Vector:
+            def __init__(self, x, y, z):
+                self.x, self.y, self.z = x, y, z
+
+        v = Vector(1.0, 2.0, 3.0)
+        print(v.zyx)  # array('d', [3.0, 2.0, 1.0])
+        out = array.array("d", bytes(8 * 6))
+        f64.read(v, "zyx", out, offset=3)  # fills out[3:6] without a result object
+        ```
+    """
+    return Typed(typecode)
@@ -1,5 +1,12 @@
 import unicodedata
 
+from .regex import RegexSplitter
+from .trie import Trie
+
+# Vocabulary size up to which the compiled-regex splitter outperforms the trie,
+# see benchmarks/tokenizer_engines.py.
+REGEX_MAX_WORDS = 256
+
 
 def split_attr_name(s, split, sep=""):
     if split == "by_sep":
@@ -18,6 +25,12 @@ def split_attr_name(s, split, sep=""):
     return parts
 
 
+def make_splitter(words, sep=""):
+    if len(words) <= REGEX_MAX_WORDS:
+        return RegexSplitter(words, sep)
+    return Trie(words, sep)
+
+
 def get_getattr_methods(cls):
     funcs = []
     if hasattr(cls, "__getattribute__"):
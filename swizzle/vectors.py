@@ -0,0 +1,433 @@
+import operator as _operator
+from array import array as _array
+from copy import copy as _copy
+from itertools import product as _product
+from itertools import repeat as _repeat
+from numbers import Number as _Number
+from operator import itemgetter as _itemgetter
+
+try:
+    from _collections import _tuplegetter
+except ImportError:
+    _tuplegetter = lambda index, doc: property(_itemgetter(index), doc=doc)
+
+_type = type
+_tuple = tuple
+_tuple_new = tuple.__new__
+
+# Component name sets, as in GLSL. A swizzle uses names of one set only.
+COMPONENTS = ("xyzw", "rgba", "stpq")
+BACKENDS = ("numpy", "array")
+
+_np = None
+
+
+def _numpy():
+    # NumPy is optional and only imported once a batch is created with it.
+    global _np
+    if _np is None:
+        import numpy
+
+        _np = numpy
+    return _np
+
+
+def _default_backend():
+    try:
+        _numpy()
+    except ImportError:
+        return "array"
+    return "numpy"
+
+
+class Vector(tuple):
+    """
+    Base class of the fixed-size vectors `vec2`, `vec3` and `vec4`.
+
+    Vectors are immutable tuples. Components are read as `x y z w`, `r g b a`
+    or `s t p q`, and every swizzle of 2 to 4 components of one set is a
+    precomputed property returning a vector of that size, so `v.zyx` costs
+    one attribute lookup and one tuple construction. Arithmetic operators work
+    component-wise with vectors of the same size and with scalars.
+
+    Constructors follow GLSL: `vec3(1)` fills all components, and vectors
+    among the arguments are flattened, e.g. `vec4(v.xy, 0, 1)`.
+    """
+
+    __slots__ = ()
+    _size = 0
+    _swizzles = {}
+
+    def __new__(cls, *args):
+        size = cls._size
+        if len(args) == size:
+            for arg in args:
+                if not isinstance(arg, _Number):
+                    break
+            else:
+                return _tuple_new(cls, args)
+        if len(args) == 1 and isinstance(args[0], _Number):
+            return _tuple_new(cls, _repeat(args[0], size))
+        values = []
+        for arg in args:
+            if isinstance(arg, _Number):
+                values.append(arg)
+            else:
+                values.extend(arg)
+        if len(values) != size:
+            raise TypeError(
+                f"{cls.__name__} expects {size} components, got {len(values)}"
+            )
+        return _tuple_new(cls, values)
+
+    @classmethod
+    def array(cls, data=0, *, backend=None):
+        """
+        Creates a batch of vectors stored as one column per component.
+
+        Args:
+            data (int or iterable, optional): Number of zero vectors, or an iterable of
+                vectors (or a NumPy array of shape `(n, size)`). Defaults to 0.
+            backend (str, optional): `"numpy"` for float64 `ndarray` columns or `"array"`
+                for `array.array("d")` columns. Defaults to `"numpy"` if NumPy is
+                installed and `"array"` otherwise.
+        Returns:
+            VectorArray: The batch.
+        """
+        if backend is None:
+            backend = _default_backend()
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown vector array backend: {backend!r}")
+        size = cls._size
+        if backend == "numpy":
+            np = _numpy()
+            if isinstance(data, int):
+                block = np.zeros((size, data))
+            else:
+                block = np.array(data, dtype=float).reshape(-1, size).T.copy()
+            return VectorArray(cls, _tuple(block))
+        if isinstance(data, int):
+            return VectorArray(
+                cls, _tuple(_array("d", bytes(8 * data)) for _ in range(size))
+            )
+        rows = list(data)
+        for row in rows:
+            if len(row) != size:
+                raise ValueError(f"Expected rows of {size} components, got {len(row)}")
+        columns = zip(*rows) if rows else _repeat((), size)
+        return VectorArray(cls, _tuple(_array("d", column) for column in columns))
+
+    def dot(self, other):
+        "Return the dot product with a vector of the same size."
+        return sum(map(_operator.mul, self, _operands(self, other)))
+
+    def length(self):
+        "Return the Euclidean length."
+        return sum(map(_operator.mul, self, self)) ** 0.5
+
+    def __neg__(self):
+        return _tuple_new(_type(self), map(_operator.neg, self))
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return _tuple_new(_type(self), map(abs, self))
+
+    def __repr__(self):
+        return f"{_type(self).__name__}({', '.join(map(repr, self))})"
+
+
+def _operands(vector, other):
+    if isinstance(other, _tuple):
+        if len(other) != len(vector):
+            raise ValueError(
+                f"Cannot combine {_type(vector).__name__} with a sequence of {len(other)} components"
+            )
+        return other
+    return _repeat(other)
+
+
+def _vector_operator(op, reflected=False):
+    def method(self, other):
+        if not isinstance(other, (_tuple, _Number)):
+            return NotImplemented
+        operands = _operands(self, other)
+        if reflected:
+            return _tuple_new(_type(self), map(op, operands, self))
+        return _tuple_new(_type(self), map(op, self, operands))
+
+    return method
+
+
+_OPERATORS = {
+    "add": (_operator.add, "+"),
+    "sub": (_operator.sub, "-"),
+    "mul": (_operator.mul, "*"),
+    "truediv": (_operator.truediv, "/"),
+    "floordiv": (_operator.floordiv, "//"),
+    "mod": (_operator.mod, "%"),
+    "pow": (_operator.pow, "**"),
+}
+
+for _name, (_op, _) in _OPERATORS.items():
+    setattr(Vector, f"__{_name}__", _vector_operator(_op))
+    setattr(Vector, f"__r{_name}__", _vector_operator(_op, reflected=True))
+
+_SCALARS = frozenset((int, float))
+
+
+def _unrolled_operators(cls):
+    # Operators of one vector size with the components unpacked, as the
+    # common int/float and same-size cases need no loop at all. Other
+    # operands fall back to the generic methods of `Vector`.
+    size = cls._size
+    own = [f"_{i}" for i in range(size)]
+    others = [f"o{i}" for i in range(size)]
+    lines = []
+    for name, (_, symbol) in _OPERATORS.items():
+        for method, template in (
+            (f"__{name}__", "{a} {op} {b}"),
+            (f"__r{name}__", "{b} {op} {a}"),
+        ):
+            scalar = ", ".join(template.format(a=a, b="other", op=symbol) for a in own)
+            pairwise = ", ".join(
+                template.format(a=a, b=b, op=symbol) for a, b in zip(own, others)
+            )
+            lines += [
+                f"def {method}(self, other):",
+                f"    {', '.join(own)} = self",
+                "    if _type(other) in _SCALARS:",
+                f"        return _tuple_new(_cls, ({scalar}))",
+                "    if _type(other) is _cls:",
+                f"        {', '.join(others)} = other",
+                f"        return _tuple_new(_cls, ({pairwise}))",
+                f"    return _Vector.{method}(self, other)",
+            ]
+    namespace = {
+        "_cls": cls,
+        "_type": _type,
+        "_tuple_new": _tuple_new,
+        "_SCALARS": _SCALARS,
+        "_Vector": Vector,
+        "__builtins__": {},
+        "__name__": __name__,
+    }
+    exec("\n".join(lines), namespace)
+    for name in _OPERATORS:
+        for method in (f"__{name}__", f"__r{name}__"):
+            func = namespace[method]
+            func.__qualname__ = f"{cls.__name__}.{method}"
+            setattr(cls, method, func)
+
+
+def _swizzle_property(indices, result):
+    getter = _itemgetter(*indices)
+
+    def fget(self):
+        return _tuple_new(result, getter(self))
+
+    return property(fget, doc=f"Swizzle of components {indices} as a {result.__name__}")
+
+
+def _vector_classes():
+    classes = {
+        size: _type(
+            f"vec{size}",
+            (Vector,),
+            {"__slots__": (), "_size": size, "__module__": __name__},
+        )
+        for size in (2, 3, 4)
+    }
+    for size, cls in classes.items():
+        swizzles = {}
+        sets = [components[:size] for components in COMPONENTS]
+        for letters in sets:
+            for i, letter in enumerate(letters):
+                setattr(cls, letter, _tuplegetter(i, f"Component {letter!r}"))
+                swizzles[letter] = (i,)
+        for length, result in classes.items():
+            for indices in _product(range(size), repeat=length):
+                # One property serves the same swizzle in every component set.
+                swizzle = _swizzle_property(indices, result)
+                for letters in sets:
+                    name = "".join(map(letters.__getitem__, indices))
+                    swizzles[name] = indices
+                    setattr(cls, name, swizzle)
+        cls._swizzles = swizzles
+        _unrolled_operators(cls)
+    return classes[2], classes[3], classes[4]
+
+
+vec2, vec3, vec4 = _vector_classes()
+
+
+def _apply(op, left, right, n):
+    # Column-wise op; scalars are broadcast. NumPy columns broadcast natively,
+    # array.array columns go through one C-level map.
+    if _type(left) is not _array and _type(right) is not _array:
+        return op(left, right)
+    if _type(left) is not _array:
+        left = _repeat(left, n)
+    if _type(right) is not _array:
+        right = _repeat(right, n)
+    return _array("d", map(op, left, right))
+
+
+def _fill(column, values):
+    n = len(column)
+    if _type(column) is _array:
+        if isinstance(values, _Number):
+            values = _array("d", [values]) * n
+        elif _type(values) is not _array:
+            values = _array("d", values)
+        if len(values) != n:
+            raise ValueError(f"Expected a column of {n} values, got {len(values)}")
+    column[:] = values
+
+
+class VectorArray:
+    """
+    Batch of vectors of one size stored as one column per component.
+
+    Created with `vec3.array(n)` or `vec3.array(rows)`. Components and swizzles
+    are read like on a single vector but return columns, so `positions.x` is a
+    column and `positions.zyx` is a `VectorArray` of `vec3`. Swizzled batches
+    share their columns with the batch they were read from. Arithmetic
+    operators work column-wise with batches of the same size, single vectors
+    and scalars, vectorized by NumPy or by C-level maps over `array.array`.
+    Assigning components or swizzles writes the columns in place.
+    """
+
+    __slots__ = ("_vector", "_columns")
+
+    def __init__(self, vector, columns):
+        object.__setattr__(self, "_vector", vector)
+        object.__setattr__(self, "_columns", _tuple(columns))
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        indices = self._vector._swizzles.get(name)
+        if indices is None:
+            raise AttributeError(f"'VectorArray' object has no attribute {name!r}")
+        columns = self._columns
+        if len(indices) == 1:
+            return columns[indices[0]]
+        return VectorArray(_VECTORS[len(indices)], [columns[i] for i in indices])
+
+    def __setattr__(self, name, value):
+        indices = self._vector._swizzles.get(name)
+        if indices is None:
+            raise AttributeError(f"'VectorArray' object has no attribute {name!r}")
+        if len(set(indices)) != len(indices):
+            raise ValueError(f"Cannot assign to {name!r}, it repeats a component")
+        columns = self._columns
+        if len(indices) == 1:
+            return _fill(columns[indices[0]], value)
+        if isinstance(value, VectorArray):
+            values = value._columns
+        elif isinstance(value, _Number):
+            values = _repeat(value, len(indices))
+        else:
+            values = value
+        values = _tuple(values)
+        if len(values) != len(indices):
+            raise ValueError(
+                f"Expected {len(indices)} components for {name!r}, got {len(values)}"
+            )
+        # Snapshot columns being overwritten, as in `positions.zx = positions.xz`.
+        values = [
+            _copy(value) if any(value is column for column in columns) else value
+            for value in values
+        ]
+        for i, column in zip(indices, values):
+            _fill(columns[i], column)
+
+    def __len__(self):
+        return len(self._columns[0])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return VectorArray(
+                self._vector, [column[index] for column in self._columns]
+            )
+        return _tuple_new(
+            self._vector, [float(column[index]) for column in self._columns]
+        )
+
+    def __setitem__(self, index, value):
+        columns = self._columns
+        if len(value) != len(columns):
+            raise ValueError(f"Expected {len(columns)} components, got {len(value)}")
+        for column, component in zip(columns, value):
+            column[index] = component
+
+    def __iter__(self):
+        vector = self._vector
+        for row in zip(*[column.tolist() for column in self._columns]):
+            yield _tuple_new(vector, row)
+
+    def tolist(self):
+        "Return the vectors as a list."
+        return list(self)
+
+    def _operate(self, op, other, reflected=False):
+        columns = self._columns
+        if isinstance(other, VectorArray):
+            if other._vector is not self._vector:
+                return NotImplemented
+            operands = other._columns
+        elif isinstance(other, _tuple):
+            if len(other) != len(columns):
+                raise ValueError(
+                    f"Cannot combine a {self._vector.__name__} batch with {len(other)} components"
+                )
+            operands = other
+        elif isinstance(other, _Number):
+            operands = _repeat(other)
+        else:
+            return NotImplemented
+        n = len(self)
+        if reflected:
+            result = [_apply(op, b, a, n) for a, b in zip(columns, operands)]
+        else:
+            result = [_apply(op, a, b, n) for a, b in zip(columns, operands)]
+        return VectorArray(self._vector, result)
+
+    def dot(self, other):
+        "Return the column of dot products with a batch or a vector of the same size."
+        products = self._operate(_operator.mul, other)
+        if products is NotImplemented:
+            raise TypeError(f"Cannot take the dot product with {_type(other).__name__}")
+        total, *rest = products._columns
+        for column in rest:
+            total = _apply(_operator.add, total, column, len(self))
+        return total
+
+    def length(self):
+        "Return the column of Euclidean lengths."
+        return _apply(_operator.pow, self.dot(self), 0.5, len(self))
+
+    def __neg__(self):
+        return self._operate(_operator.mul, -1)
+
+    def __pos__(self):
+        return self
+
+    def __repr__(self):
+        return f"VectorArray({self._vector.__name__}, len={len(self)})"
+
+
+def _batch_operator(op, reflected=False):
+    def method(self, other):
+        return self._operate(op, other, reflected)
+
+    return method
+
+
+for _name, (_op, _) in _OPERATORS.items():
+    setattr(VectorArray, f"__{_name}__", _batch_operator(_op))
+    setattr(VectorArray, f"__r{_name}__", _batch_operator(_op, reflected=True))
+
+_VECTORS = {2: vec2, 3: vec3, 4: vec4}
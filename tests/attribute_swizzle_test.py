@@ -530,3 +530,321 @@ class OnlyXYFields2(NamedTuple):
 def test_only_attrs_fields_2_valid_swizzle():
     obj = OnlyXYFields2(10, 20)
     assert obj.yx == (20, 10)
+
+
+@swizzle(only_attrs=swizzle.AttrSource.SLOTS)
+class OnlyXYZSlots:
+    __slots__ = ("x", "y", "z")
+
+    def __getattr__(self, name):
+        if name == "z":
+            return 0
+        raise AttributeError(name)
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda: OnlyXYFields(10, 20),
+        lambda: OnlyXYFields2(10, 20),
+    ],
+)
+def test_field_sources_read_directly(make):
+    obj = make()
+    for _ in range(3):
+        assert obj.yx == (20, 10)
+        assert obj.yxy == (20, 10, 20)
+    cls = obj.__class__
+    assert swizzle.get_field_plan(cls, {"x", "y"}).owner is cls
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="Requires Python >= 3.10")
+def test_slotted_dataclass_fields_read_directly():
+    @swizzle(only_attrs=swizzle.AttrSource.FIELDS)
+    @dataclass(slots=True)
+    class OnlyXYZSlotFields:
+        x: int
+        y: int
+        z: int
+
+    obj = OnlyXYZSlotFields(10, 20, 30)
+    for _ in range(3):
+        assert obj.yx == (20, 10)
+        assert obj.zyx == (30, 20, 10)
+    cls = obj.__class__
+    assert swizzle.get_field_plan(cls, {"x", "y", "z"}).owner is cls
+
+
+def test_field_plans_fall_back_to_generic_lookup():
+    obj = OnlyXYZSlots()
+    obj.x, obj.y = 1, 2
+    assert obj.yx == (2, 1)
+    assert obj.zx == (0, 1)
+    obj.z = 3
+    for _ in range(2):
+        assert obj.zx == (3, 1)
+    del obj.z
+    assert obj.zx == (0, 1)
+
+    class Child(OnlyXYFields):
+        @property
+        def x(self):
+            return -self._x
+
+        @x.setter
+        def x(self, value):
+            self._x = value
+
+    assert Child(10, 20).yx == (20, -10)
+    assert OnlyXYFields(10, 20).yx == (20, 10)
+
+
+def test_field_plans_need_generic_attribute_lookup():
+    class Custom:
+        __slots__ = ("x", "y")
+
+        def __getattribute__(self, name):
+            return object.__getattribute__(self, name)
+
+    assert swizzle.get_field_plan(Custom, {"x", "y"}) is None
+    plan = swizzle.get_field_plan(OnlyXYFields2, {"x", "y"})
+    assert plan(["y", "x"])(OnlyXYFields2(1, 2)) == [2, 1]
+    assert plan(["y", "w"]) is None
+
+
+# --- Tests for result builders ---
+class Vec3(tuple):
+    @classmethod
+    def __swizzle_build__(cls, names, values):
+        return cls(v * 10 for v in values)
+
+
+@swizzle(type=Vec3)
+class VectorBuildProtocol:
+    def __init__(self):
+        self.x = 1
+        self.y = 2
+
+
+def test_swizzle_build_protocol():
+    v = VectorBuildProtocol()
+    assert v.yx == (20, 10)
+    assert isinstance(v.yx, Vec3)
+    assert v.x == 1
+
+
+class Registered:
+    def __init__(self, names, values):
+        self.pairs = list(zip(names, values))
+
+
+swizzle.register_builder(Registered, Registered)
+
+
+@swizzle(type=Registered)
+class VectorRegisteredBuilder:
+    def __init__(self):
+        self.x = 1
+        self.y = 2
+
+
+def test_registered_builder():
+    assert VectorRegisteredBuilder().yxx.pairs == [("y", 2), ("x", 1), ("x", 1)]
+
+
+@swizzle(type=list)
+class VectorList:
+    def __init__(self):
+        self.x = 1
+        self.y = 2
+
+
+def test_list_builder():
+    assert VectorList().yx == [2, 1]
+
+
+def test_swizzledtuple_result_class_is_reused():
+    v = Vector(1, 2, 3)
+    assert type(v.zyx) is type(Vector(4, 5, 6).zyx)
+    assert type(v.zyx) is not type(v.xyz)
+    assert repr(v.zyxz) == "Vector(z=3, y=2, x=1, z=3)"
+
+
+@swizzle(setter=True)
+class Observable:
+    def __init__(self):
+        object.__setattr__(self, "x", 1)
+        object.__setattr__(self, "y", 2)
+        object.__setattr__(self, "calls", [])
+
+    def __setattr__(self, name, value):
+        self.calls.append({name: value})
+        object.__setattr__(self, name, value)
+
+    def __swizzle_set__(self, values):
+        self.calls.append(dict(values))
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+
+def test_swizzle_set_hook():
+    v = Observable()
+    v.yxy = 5, 4, 5
+    assert (v.x, v.y) == (4, 5)
+    assert v.calls == [{"y": 5, "x": 4}]
+    v.x = 7  # plain names still go through __setattr__
+    assert v.calls[-1] == {"x": 7}
+    with pytest.raises(ValueError):
+        v.xx = 1, 2
+    assert len(v.calls) == 2
+
+
+def test_swizzle_set_hook_per_subclass():
+    class Override(Observable):
+        def __swizzle_set__(self, values):
+            self.calls.append(("override", dict(values)))
+            for name, value in values.items():
+                object.__setattr__(self, name, value)
+
+    class OptIn(SlotsSetter):
+        __slots__ = ("calls",)
+
+        def __swizzle_set__(self, values):
+            self.calls.append(dict(values))
+
+    v = Override()
+    v.yx = 2, 1
+    assert v.calls == [("override", {"y": 2, "x": 1})]
+    s = OptIn()
+    s.calls = []
+    s.zx = 9, 8
+    assert s.calls == [{"z": 9, "x": 8}]
+    assert (s.x, s.z) == (1, 3)
+
+
+@swizzle(setter=True)
+class SlotsSetter:
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self):
+        self.x, self.y, self.z = 1, 2, 3
+
+
+@swizzle(setter=True)
+@dataclass
+class DataclassSetter:
+    x: int
+    y: int
+
+    @property
+    def z(self):
+        return self.x + self.y
+
+    @z.setter
+    def z(self, value):
+        self.x = value - self.y
+
+
+def test_builtin_bulk_setters():
+    s = SlotsSetter()
+    s.zyx = 6, 5, 4
+    assert (s.x, s.y, s.z) == (4, 5, 6)
+    with pytest.raises(AttributeError):
+        s.xw = 1, 2
+    d = DataclassSetter(1, 2)
+    d.yx = 20, 10
+    assert d == DataclassSetter(10, 20)
+    d.yz = 1, 5
+    assert d == DataclassSetter(4, 1)
+
+
+@swizzle(setter=True)
+class StackedBase:
+    def __init__(self):
+        self.x = 1
+        self.y = 2
+
+
+@swizzle(setter=True, only_attrs=["x", "y", "zw"])
+class StackedChild(StackedBase):
+    def __init__(self):
+        super().__init__()
+        self.zw = 3
+
+
+@swizzle(sep="_")
+class StackedGrandchild(StackedChild):
+    pass
+
+
+def test_stacked_decorators_are_flattened():
+    for cls in (StackedChild, StackedGrandchild):
+        assert cls.__getattribute__._swizzle_wrapped == (object.__getattribute__,)
+    assert StackedChild.__setattr__._swizzle_wrapped == (object.__setattr__,)
+    c = StackedChild()
+    assert c.zwyx == (3, 2, 1)
+    c.yzw = 5, 6
+    assert (c.y, c.zw) == (5, 6)
+    # the most-derived settings apply
+    g = StackedGrandchild()
+    assert g.zw_x == (3, 1)
+    with pytest.raises(AttributeError):
+        _ = g.zwx
+
+
+@swizzle(meta=True)
+class MetaBase:
+    X = 1
+    Y = 2
+
+
+@swizzle(meta=True)
+class MetaChild(MetaBase):
+    Z = 3
+
+
+@swizzle(meta=True, sep="_")
+class MetaChildSep(MetaBase):
+    Z = 3
+
+
+def test_meta_layers_are_reused():
+    assert type(MetaChild) is type(MetaBase)
+    assert MetaChild.ZYX == (3, 2, 1)
+    assert type(MetaChildSep) is not type(MetaBase)
+    assert MetaChildSep.Z_X == (3, 1)
+    assert type(MetaChildSep).__getattribute__._swizzle_wrapped == (
+        type.__getattribute__,
+    )
+
+
+def test_splitter_is_built_lazily(monkeypatch):
+    built = []
+    namespace = swizzle.swizzle_attributes_retriever.__globals__
+    trie = namespace["Trie"]
+
+    def counting_trie(*args):
+        built.append(args)
+        return trie(*args)
+
+    monkeypatch.setitem(namespace, "Trie", counting_trie)
+
+    def define():
+        @swizzle(only_attrs=["x", "y", "zw"], engine="trie")
+        class Lazy:
+            def __init__(self):
+                self.x, self.y, self.zw = 1, 2, 3
+
+        return Lazy
+
+    first, second = define(), define()
+    assert built == []
+    assert first().zwx == (3, 1)
+    assert len(built) == 1
+    assert swizzle.prepare(second) is second
+    assert len(built) == 2
+    assert second().xzw == (1, 3)
+    assert len(built) == 2
+
+    with pytest.raises(TypeError):
+        swizzle.prepare(int)
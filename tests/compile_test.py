@@ -0,0 +1,146 @@
+import importlib
+import os
+import pickle
+import sys
+
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+import pytest
+
+import swizzle
+from swizzle import Profile
+from swizzle.compile import export, main
+
+
+@swizzle(only_attrs=["x", "y", "zz"])
+class Vector:
+    def __init__(self, x, y, zz):
+        self.x = x
+        self.y = y
+        self.zz = zz
+
+
+@swizzle(type=tuple, sep="_")
+class Pair:
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+
+
+def load(tmp_path, monkeypatch, name, source):
+    (tmp_path / f"{name}.py").write_text(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    sys.modules.pop(name, None)
+    return importlib.import_module(name)
+
+
+def make_class(precompiled, **options):
+    @swizzle(only_attrs=["x", "y", "zz"], precompiled=precompiled, **options)
+    class Vector:
+        def __init__(self, x, y, zz):
+            self.x = x
+            self.y = y
+            self.zz = zz
+
+    return Vector
+
+
+def test_export_matches_dynamic(tmp_path, monkeypatch):
+    module = load(
+        tmp_path, monkeypatch, "_vec_aot", export(Vector, ["zzyx", "xxy"])
+    )
+    assert module.TARGET == f"{__name__}:Vector"
+    assert set(module.ACCESSORS) == {"zzyx", "xxy"}
+    Precompiled = make_class(module)
+    assert "zzyx" in Precompiled.__dict__
+    v, p = Vector(1, 2, 3), Precompiled(1, 2, 3)
+    for name in ("zzyx", "xxy"):
+        dynamic, static = getattr(v, name), getattr(p, name)
+        assert static == dynamic
+        assert repr(static) == repr(dynamic)
+        assert static._fields == dynamic._fields
+        assert static._asdict() == dynamic._asdict()
+    assert type(p.zzyx).__module__ == "_vec_aot"
+    assert p.xxy.y == 2
+    assert p.zzyx.xzz == (1, 3)
+    assert p.zzyx[1:] == (2, 1)
+    assert p.zzyx._replace(x=7) == (3, 2, 7)
+    assert pickle.loads(pickle.dumps(p.xxy)) == (1, 1, 2)
+    # names that were not exported still swizzle dynamically
+    assert p.yx == (2, 1)
+
+
+def test_exported_results_share_runtime_methods(tmp_path, monkeypatch):
+    module = load(tmp_path, monkeypatch, "_vec_methods", export(Vector, ["zzyx"]))
+    static = make_class(module)(1, 2, 3).zzyx
+    dynamic = Vector(1, 2, 3).zzyx
+    for name in swizzle._SWIZZLEDTUPLE_METHODS:
+        static_method = getattr(type(static), name)
+        dynamic_method = getattr(type(dynamic), name)
+        assert getattr(static_method, "__func__", static_method) is getattr(
+            dynamic_method, "__func__", dynamic_method
+        ), name
+    assert static._make_many([(4, 5, 6)]) == dynamic._make_many([(4, 5, 6)])
+    assert static._replace(zz=9) == dynamic._replace(zz=9)
+    assert repr(static[1:]) == repr(dynamic[1:])
+    assert static.__getnewargs__() == dynamic.__getnewargs__() == (3, 2, 1)
+
+
+def test_export_tuple_results(tmp_path, monkeypatch):
+    module = load(
+        tmp_path, monkeypatch, "_pair_aot", export(Pair, ["b_a"], attrs=["a", "b"])
+    )
+    assert module.TYPE == "tuple"
+    assert module.ACCESSORS["b_a"].fget(Pair(1, 2)) == (2, 1)
+
+
+def test_export_errors():
+    with pytest.raises(ValueError, match="pass attrs"):
+        export(Pair, ["b_a"])
+    with pytest.raises(ValueError, match="several attributes"):
+        export(Vector, ["zz"])
+    with pytest.raises(AttributeError):
+        export(Vector, ["xw"])
+    with pytest.raises(TypeError):
+        export(int, ["xy"])
+    with pytest.raises(ValueError, match="Only tuple"):
+        export(make_class(None, type=swizzle.typed("d")), ["xy"])
+
+
+def test_precompiled_option_checks(tmp_path, monkeypatch):
+    module = load(tmp_path, monkeypatch, "_vec_opts", export(Vector, ["xy"]))
+    with pytest.raises(ValueError, match="different swizzle options"):
+        make_class(module, sep="_")
+    with pytest.raises(ValueError, match="different swizzle options"):
+        make_class(module, type=swizzle.typed("d"))
+    with pytest.raises(ValueError, match="setter"):
+        make_class(module, setter=True)
+    with pytest.warns(ImportWarning):
+        Fallback = make_class("_vec_missing_module")
+    assert Fallback(1, 2, 3).yx == (2, 1)
+
+
+def test_main(tmp_path, monkeypatch, capsys):
+    profile = Profile(
+        [
+            {
+                "module": __name__,
+                "qualname": "Vector",
+                "meta": False,
+                "name": "yzz",
+                "parts": ["y", "zz"],
+                "count": 5,
+            }
+        ]
+    )
+    profile.dump(tmp_path / "profile.json")
+    output = tmp_path / "_vec_cli.py"
+    target = f"{__name__}:Vector"
+    argv = [target, "--names", "xy,yx", "--profile", str(tmp_path / "profile.json")]
+    assert main(argv + ["-o", str(output)]) == 0
+    module = load(tmp_path, monkeypatch, "_vec_cli", output.read_text())
+    assert list(module.ACCESSORS) == ["xy", "yx", "yzz"]
+    with pytest.raises(SystemExit):
+        main([target])
+    with pytest.raises(SystemExit):
+        main(["no_colon"])
+    capsys.readouterr()
@@ -0,0 +1,66 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle
+
+
+def make(only_attrs=None, sep=None, **options):
+    @swizzle(only_attrs=only_attrs, sep=sep, **options)
+    class Vector:
+        def __init__(self):
+            self.x = 1
+            self.y = 2
+            self.zw = 3
+
+    return Vector()
+
+
+@pytest.mark.parametrize(
+    "engine, only_attrs, sep, name",
+    [
+        ("reference", None, None, "zwxy"),
+        ("reference", ["x", "y", "zw"], None, "zwxy"),
+        ("trie", ["x", "y", "zw"], None, "zwxy"),
+        ("regex", ["x", "y", "zw"], None, "zwxy"),
+        ("sep", None, "_", "zw_x_y"),
+        ("sep", ["x", "y", "zw"], "__", "zw__x__y"),
+        ("fixed", 1, None, "yxy"),
+        ("fixed", ["x", "y"], None, "yxy"),
+    ],
+)
+def test_engines_agree(engine, only_attrs, sep, name):
+    auto = make(only_attrs, sep)
+    pinned = make(only_attrs, sep, engine=engine, verify=True)
+    assert getattr(pinned, name) == getattr(auto, name)
+    with pytest.raises(AttributeError):
+        getattr(pinned, name + "q")
+
+
+def test_reference_respects_only_attrs():
+    v = make(["x", "y"], engine="reference")
+    assert v.yx == (2, 1)
+    with pytest.raises(AttributeError):
+        _ = v.xzw
+    assert make(1, engine="reference").xy == (1, 2)
+
+
+def test_unsupported_engines():
+    with pytest.raises(ValueError, match="Unknown"):
+        make(engine="fast")
+    with pytest.raises(ValueError, match="'sep' engine"):
+        make(["x", "y"], engine="sep")
+    with pytest.raises(ValueError, match="'fixed' engine"):
+        make(["x", "zw"], engine="fixed")
+    with pytest.raises(ValueError, match="'trie' engine"):
+        make(engine="trie")
+
+
+def test_verify_reports_divergence():
+    # "xy" is allowed but missing: the trie commits to it, the scan skips it.
+    v = make(["x", "y", "xy"], engine="trie", verify=True)
+    with pytest.raises(AssertionError, match="reference engine"):
+        _ = v.xyx
+    assert v.x == 1
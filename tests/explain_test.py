@@ -0,0 +1,86 @@
+import os
+import sys
+from dataclasses import dataclass
+
+import pytest
+
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle
+from swizzle import AttrSource
+
+
+@swizzle(only_attrs=["x", "y", "zz"])
+class Vector:
+    def __init__(self):
+        self.x = 1
+        self.y = 2
+        self.zz = 3
+
+
+@swizzle
+class Point:
+    def __init__(self):
+        self.x = 1
+        self.y = 2
+
+
+@swizzle(meta=True)
+class Axis:
+    X = 1
+    Y = 2
+
+
+@swizzle(only_attrs=AttrSource.FIELDS)
+@dataclass
+class Fields:
+    x: int
+    y: int
+
+
+def test_explain_first_and_cached_lookups():
+    first = swizzle.explain(Vector(), "zzx")
+    assert first.strategy in ("trie", "regex")
+    assert first.parts == ["zz", "x"]
+    assert (first.probes, first.misses) == (3, 1)
+    assert first.cached["parse"] is False
+    assert first.result_type.__name__ == "Vector"
+    assert first.seconds > 0 and first.error is None
+
+    again = swizzle.explain(Vector(), "zzx")
+    assert again.cached["parse"] is True and again.cached["splitter"] is True
+    assert again.new_result_class is False
+
+    exact = swizzle.explain(Vector(), "x")
+    assert (exact.strategy, exact.parts, exact.probes) == ("exact", ["x"], 1)
+    assert exact.result_type is int
+
+
+def test_explain_strategies():
+    assert swizzle.explain(Point(), "yx").strategy == "reference"
+    assert swizzle.explain(Axis, "YX").parts == ["Y", "X"]
+
+    assert swizzle.explain(Fields(1, 2), "yx").strategy == "fixed"
+    planned = swizzle.explain(Fields(1, 2), "yx")
+    assert planned.strategy == "field_plan" and planned.cached["field_plan"]
+    assert planned.probes == 1
+
+    Vec = swizzle.t("Vec", "x y z")
+    assert swizzle.explain(Vec(1, 2, 3), "zy").cached["plan"] is False
+    planned = swizzle.explain(Vec(1, 2, 3), "zy")
+    assert (planned.strategy, planned.parts, planned.probes) == ("plan", ["z", "y"], 1)
+
+
+def test_explain_without_instance_and_errors():
+    static = swizzle.explain(Vector, "yzz")
+    assert static.parts == ["y", "zz"] and static.seconds is None
+    assert swizzle.explain(Point, "yx").parts is None
+
+    missing = swizzle.explain(Vector(), "xq")
+    assert missing.parts is None and isinstance(missing.error, AttributeError)
+    assert missing.result_type is None
+    assert missing.as_dict()["error"] == str(missing.error)
+
+    with pytest.raises(TypeError):
+        swizzle.explain(object(), "x")
+    with pytest.raises(TypeError):
+        swizzle.explain(int, "x")
@@ -0,0 +1,92 @@
+import os
+import sys
+from enum import IntEnum
+
+import pytest
+
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle
+from swizzle import swizzledtuple
+
+
+@swizzle
+class Vector:
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+@swizzle(sep="_", only_attrs=["x", "y", "zz"])
+class Named:
+    def __init__(self):
+        self.x = 1
+        self.y = 2
+        self.zz = 3
+
+
+@swizzle(meta=True)
+class Axis:
+    X = 1
+    Y = 2
+    Z = 3
+
+
+@swizzle(type=list, only_attrs=1)
+class ListVector:
+    def __init__(self):
+        self.x = 1
+        self.y = 2
+
+
+def test_matches_chained_access():
+    v = Vector(1, 2, 3)
+    chain = swizzle.expr("yzx").then("xxzyzz")
+    assert chain(v) == v.yzx.xxzyzz
+    assert repr(chain(v)) == repr(v.yzx.xxzyzz)
+    assert type(chain(v)) is type(v.yzx.xxzyzz)
+    three = chain.then("zyx")
+    assert three(v) == v.yzx.xxzyzz.zyx == (3, 2, 1)
+    assert swizzle.expr("yzx").then("x")(v) == 1
+
+
+def test_swizzledtuples_and_sep():
+    T = swizzledtuple("T", "a b c", sep="_")
+    t = T(1, 2, 3)
+    assert swizzle.expr("c_b_a", "a_a")(t) == t.c_b_a.a_a == (1, 1)
+    c = swizzledtuple("C", "x y", arrange_names="x x y", compact=True)(1, 2)
+    assert swizzle.expr("yxx", "yx")(c) == c.yxx.yx == (2, 1)
+    n = Named()
+    assert swizzle.expr("zz_x", "x_zz_x")(n) == n.zz_x.x_zz_x == (1, 3, 1)
+
+
+def test_meta_and_builders():
+    assert swizzle.expr("YXZ").then("ZZ")(Axis) == Axis.YXZ.ZZ == (3, 3)
+    assert swizzle.expr("yx", "xyx")(ListVector()) == [1, 2, 1]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="Requires Python >= 3.11")
+def test_enum_meta():
+    @swizzle(meta=True)
+    class EnumAxis(IntEnum):
+        X = 1
+        Y = 2
+        Z = 3
+
+    expr = swizzle.expr("YXZ").then("ZZ")
+    assert expr(EnumAxis) == EnumAxis.YXZ.ZZ == (EnumAxis.Z, EnumAxis.Z)
+
+
+def test_cached_by_chain():
+    assert swizzle.expr("yzx").then("zx") is swizzle.expr("yzx", "zx")
+    assert repr(swizzle.expr("yzx", "zx")) == "swizzle.expr('yzx').then('zx')"
+
+
+def test_errors():
+    v = Vector(1, 2, 3)
+    with pytest.raises(AttributeError):
+        swizzle.expr("yz").then("xy")(v)
+    with pytest.raises(ValueError):
+        swizzle.expr("yzx", "x", "xx")(v)
+    with pytest.raises(TypeError):
+        swizzle.expr()
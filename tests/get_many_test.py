@@ -0,0 +1,108 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle
+
+
+class FakeBackend:
+    """In-process stand-in for a remote store that counts round trips."""
+
+    def __init__(self, **data):
+        self.data = data
+        self.round_trips = 0
+
+    def get(self, name):
+        self.round_trips += 1
+        return self.data[name]
+
+    def get_many(self, names):
+        self.round_trips += 1
+        return [self.data[name] for name in names]
+
+
+class Proxy:
+    def __init__(self, backend):
+        object.__setattr__(self, "_backend", backend)
+
+    def __getattr__(self, name):
+        try:
+            return self._backend.get(name)
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+@swizzle(only_attrs=["x", "y", "zw"])
+class BatchedProxy(Proxy):
+    def __swizzle_get_many__(self, names):
+        try:
+            return self._backend.get_many(names)
+        except KeyError as e:
+            raise AttributeError(e.args[0]) from None
+
+
+@swizzle(only_attrs=["x", "y", "zw"])
+class PerPartProxy(Proxy):
+    pass
+
+
+def test_batched_fetch_round_trips():
+    backend = FakeBackend(x=1, y=2, zw=3)
+    p = BatchedProxy(backend)
+    assert p.zwxy == (3, 1, 2)
+    # one failed exact lookup, then one batched fetch
+    assert backend.round_trips == 2
+    backend.round_trips = 0
+    assert p.xxyx == (1, 1, 2, 1)
+    assert backend.round_trips == 2
+    backend.round_trips = 0
+    assert p.x == 1
+    assert backend.round_trips == 1
+
+
+def test_per_part_fallback():
+    backend = FakeBackend(x=1, y=2, zw=3)
+    p = PerPartProxy(backend)
+    assert p.zwxy == (3, 1, 2)
+    assert backend.round_trips == 4
+
+
+def test_batched_fetch_per_subclass():
+    class Override(BatchedProxy):
+        def __swizzle_get_many__(self, names):
+            return [name.upper() for name in names]
+
+    class OptIn(PerPartProxy):
+        __swizzle_get_many__ = BatchedProxy.__swizzle_get_many__
+
+    assert Override(FakeBackend(x=1, y=2)).yx == ("Y", "X")
+    backend = FakeBackend(x=1, y=2, zw=3)
+    assert OptIn(backend).zwxy == (3, 1, 2)
+    assert backend.round_trips == 2
+    backend = FakeBackend(x=1, y=2, zw=3)
+    assert PerPartProxy(backend).zwxy == (3, 1, 2)
+    assert backend.round_trips == 4
+
+
+def test_batched_fetch_errors():
+    p = BatchedProxy(FakeBackend(x=1, y=2))
+    with pytest.raises(AttributeError):
+        _ = p.xzw
+    with pytest.raises(AttributeError):
+        _ = p.xq
+
+
+@swizzle(sep="_", engine="sep")
+class ShortBatch:
+    def __swizzle_get_many__(self, names):
+        return [1]
+
+    def __getattr__(self, name):
+        raise AttributeError(name)
+
+
+def test_batched_fetch_must_match_names():
+    with pytest.raises(ValueError, match="returned 1 values for 2 names"):
+        _ = ShortBatch().a_b
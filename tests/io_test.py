@@ -0,0 +1,168 @@
+import io
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle
+from swizzle import swizzledtuple
+from swizzle.io import (
+    ColumnFile,
+    read_columns,
+    read_csv,
+    read_jsonl,
+    write_columns,
+    write_csv,
+    write_jsonl,
+)
+
+CSV = "x,y,z,label\n1,2,3,a\n4,5,6,b\n"
+
+
+def test_read_csv_all_columns():
+    rows = list(read_csv(io.StringIO(CSV), "Point"))
+    assert rows[0] == ("1", "2", "3", "a")
+    assert rows[1].label == "b"
+    assert rows[1].zyx == ("6", "5", "4")
+    assert type(rows[0]) is type(rows[1])
+
+
+def test_read_csv_projection_and_converters():
+    rows = read_csv(
+        io.StringIO(CSV), "Point", fields="z_y_x", sep="_", converters={"x": int}
+    )
+    first = next(rows)
+    assert first == ("3", "2", 1)
+    assert repr(first) == "Point(z='3', y='2', x=1)"
+    assert first.x_z == (1, "3")
+
+
+def test_read_csv_single_column_projection():
+    rows = list(read_csv(io.StringIO(CSV), fields=["label"]))
+    assert rows == [("a",), ("b",)]
+
+
+def test_read_csv_unknown_projection():
+    with pytest.raises(ValueError):
+        next(read_csv(io.StringIO(CSV), fields=["w"]))
+
+
+def test_read_csv_renames_invalid_headers():
+    row = next(read_csv(io.StringIO("first name,class\nJane,3\n")))
+    assert row._fields == ("_0", "_1")
+
+
+def test_read_csv_empty():
+    assert list(read_csv(io.StringIO(""))) == []
+
+
+def test_read_csv_skips_blank_lines():
+    rows = list(read_csv(io.StringIO("x,y\n\n1,2\n\n3,4\n\n")))
+    assert rows == [("1", "2"), ("3", "4")]
+
+
+def test_read_csv_ragged_rows():
+    with pytest.raises(ValueError, match="line 3 has 1 fields, expected 2"):
+        list(read_csv(io.StringIO("x,y\n1,2\n3\n")))
+    with pytest.raises(ValueError, match="line 2 has 3 fields, expected 2"):
+        list(read_csv(io.StringIO("x,y\n1,2,3\n"), fields="y"))
+
+
+def test_read_jsonl(tmp_path):
+    path = tmp_path / "rows.jsonl"
+    path.write_text('{"x": 1, "y": 2}\n\n{"x": 3, "y": 4}\n')
+    rows = list(read_jsonl(path, "P", fields="yx"))
+    assert rows == [(2, 1), (4, 3)]
+    assert rows[1].x == 3
+
+
+def test_read_jsonl_renames_invalid_keys():
+    lines = '{"first name": "Jane", "age": 30, "class": "a"}\n'
+    row = next(read_jsonl(io.StringIO(lines)))
+    assert row._fields == ("_0", "age", "_2")
+    assert row == ("Jane", 30, "a")
+    assert next(read_jsonl(io.StringIO(lines), fields=["_0"]))._0 == "Jane"
+
+
+def test_write_csv_roundtrip(tmp_path):
+    Point = swizzledtuple("Point", "x y z", arrange_names="z x y")
+    path = tmp_path / "out.csv"
+    rows = (Point(i, i + 1, i + 2) for i in range(3))
+    assert write_csv(path, rows) == 3
+    assert path.read_text().splitlines()[:2] == ["z,x,y", "2,0,1"]
+    back = list(read_csv(path, "Point", converters=dict.fromkeys("xyz", int)))
+    assert back[2].xyz == (2, 3, 4)
+
+
+def test_write_jsonl_roundtrip(tmp_path):
+    Point = swizzledtuple("Point", "x y")
+    path = tmp_path / "out.jsonl"
+    assert write_jsonl(path, [Point(1, 2), Point(3, 4)]) == 2
+    assert json.loads(path.read_text().splitlines()[1]) == {"x": 3, "y": 4}
+    assert list(read_jsonl(path)) == [(1, 2), (3, 4)]
+
+
+def test_columns_roundtrip(tmp_path):
+    Point = swizzledtuple("Point", "x y z label", arrange_names="z x y label", sep="_")
+    path = tmp_path / "points.swzc"
+    rows = (Point(i, i / 2, -i, f"p{i}") for i in range(5))
+    assert write_columns(path, rows, chunk_rows=2) == 5
+    with read_columns(path) as ds:
+        assert len(ds) == 5 and ds._fields == ("x", "y", "z", "label")
+        assert ds.x.tolist() == [0, 1, 2, 3, 4]
+        assert ds.y[3] == 1.5
+        assert ds.label[-1] == "p4" and list(ds.label)[:2] == ["p0", "p1"]
+        columns = ds.z_x
+        assert columns._fields == ("z", "x") and columns.x[2] == 2
+        assert next(iter(ds)) == (0, 0, 0.0, "p0")
+        assert list(ds.rows("label_x"))[1] == ("p1", 1)
+        assert next(ds.rows(["y"])).y == 0.0
+        with pytest.raises(AttributeError):
+            _ = ds.x_w
+
+
+def test_columns_types(tmp_path):
+    Pixel = swizzledtuple("Pixel", "r g b")
+    path = tmp_path / "pixels.swzc"
+    write_columns(path, [Pixel(1, 2, 3), Pixel(4, 5, 6)], types={"r": "B", "g": "d"})
+    with read_columns(path) as ds:
+        assert ds._types == {"r": "B", "g": "d", "b": "q"}
+        assert ds.bgr.g.tolist() == [2.0, 5.0]
+    with pytest.raises(TypeError):
+        write_columns(path, [swizzledtuple("T", "a")(None)])
+    with pytest.raises(ValueError):
+        write_columns(path, [])
+    path.write_bytes(b"nope" * 4)
+    with pytest.raises(ValueError):
+        read_columns(path)
+
+
+def test_columns_named_like_methods(tmp_path):
+    Row = swizzledtuple("Row", "rows types close x", sep="_")
+    path = tmp_path / "meta.swzc"
+    write_columns(path, [Row(1, 2, 3, 4), Row(5, 6, 7, 8)])
+    with read_columns(path) as ds:
+        assert ds.rows.tolist() == [1, 5]
+        assert ds.types.tolist() == [2, 6]
+        assert ds["close"].tolist() == [3, 7]
+        assert ds.x_rows.rows.tolist() == [1, 5]
+        assert list(ColumnFile.rows(ds, "x_types")) == [(4, 2), (8, 6)]
+        assert ds.column("x").tolist() == [4, 8]
+
+
+def test_columns_promote_ints_to_floats(tmp_path):
+    Point = swizzledtuple("Point", "x y")
+    path = tmp_path / "mixed.swzc"
+    rows = [Point(1, 2), Point(3, 4), Point(5.5, 6)]
+    write_columns(path, rows, chunk_rows=1)
+    with read_columns(path) as ds:
+        assert ds._types == {"x": "d", "y": "q"}
+        assert ds.x.tolist() == [1.0, 3.0, 5.5]
+    with pytest.raises(TypeError):
+        write_columns(path, rows, types={"x": "q"})
+
+
+def test_io_module_attribute():
+    assert swizzle.io.read_csv is read_csv
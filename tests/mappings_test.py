@@ -0,0 +1,85 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle
+from swizzle.mappings import MappingSwizzler
+
+
+def person():
+    return {"name": "Jane", "age": 30, "city": "Berlin"}
+
+
+def test_unrestricted_keys():
+    row = swizzle.mapping(person())
+    assert row.name == "Jane"
+    assert row.cityname == ("Berlin", "Jane")
+    assert repr(row.agecity) == "Mapping(age=30, city='Berlin')"
+    with pytest.raises(AttributeError):
+        _ = row.namezip
+
+
+def test_separator_and_only_keys():
+    row = swizzle.mapping(person(), sep="_", only_keys=["name", "age", "city"])
+    assert row.city_age_name == ("Berlin", 30, "Jane")
+    assert row.name_name == ("Jane", "Jane")
+    with pytest.raises(AttributeError):
+        _ = row.name_zip
+
+
+def test_only_keys_restricts_parts():
+    row = swizzle.mapping({"x": 1, "y": 2, "z": 3}, only_keys="xy")
+    assert row.yx == (2, 1)
+    with pytest.raises(AttributeError):
+        _ = row.xz
+
+
+def test_missing_key_in_cached_plan():
+    swizzler = MappingSwizzler(only_keys=["a", "bb"])
+    assert swizzler.get({"a": 1, "bb": 2}, "bba") == (2, 1)
+    with pytest.raises(AttributeError):
+        swizzler.get({"a": 1}, "bba")
+
+
+def test_setter_writes_back():
+    data = person()
+    row = swizzle.mapping(data, sep="_")
+    row.age_city = (31, "Paris")
+    assert data == {"name": "Jane", "age": 31, "city": "Paris"}
+    row.country = "France"
+    assert data["country"] == "France"
+    with pytest.raises(ValueError):
+        row.age_city = (1, 2, 3)
+    with pytest.raises(ValueError):
+        row.age_age = (1, 2)
+
+
+def test_setter_adds_allowed_key():
+    data = {"name": "Jane"}
+    row = swizzle.mapping(data, sep="_", only_keys=["name", "age"])
+    row.age = 31
+    assert data == {"name": "Jane", "age": 31}
+    assert row.name_age == ("Jane", 31)
+
+
+def test_keys_that_are_not_field_names():
+    row = swizzle.mapping({"count": 1, "index": 2, "from": 3, "to": 4}, sep="_")
+    assert row.count_index == (1, 2)
+    assert row.from_to_from == (3, 4, 3)
+    assert row.from_to_from._fields == ("_0", "to")
+    with pytest.raises(AttributeError):
+        _ = row.from_zip
+
+
+def test_result_type():
+    row = swizzle.mapping({"x": 1, "y": 2}, type=list)
+    assert row.yx == [2, 1]
+
+
+def test_wrappers_share_swizzler():
+    a = swizzle.mapping({"x": 1}, only_keys="x")
+    b = swizzle.mapping({"x": 2}, only_keys="x")
+    assert a._swizzler is b._swizzler
+    assert len(a) == 1 and "x" in a and list(a) == ["x"]
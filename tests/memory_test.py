@@ -0,0 +1,134 @@
+"""
+Memory and allocation budgets for swizzle.
+
+Each measurement is compared against `memory_budgets.json`. Run this file
+directly to print the current numbers next to their budgets.
+"""
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+import pytest
+
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle
+from swizzle import swizzledtuple
+from swizzle.trie import Trie
+
+with open(os.path.join(os.path.dirname(__file__), "memory_budgets.json")) as f:
+    BUDGETS = json.load(f)
+
+
+@swizzle
+class Vector:
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+def measure_access(n=10_000):
+    """Bytes and memory blocks retained per `v.zyx` result."""
+    v = Vector(1, 2, 3)
+    _ = v.zyx
+    gc.collect()
+    results = []
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        for _ in range(n):
+            results.append(v.zyx)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks
+    return size / n, blocks / n
+
+
+def measure_access_leak(n=20_000):
+    """Bytes left behind by a long loop of discarded `v.zyx` results."""
+    v = Vector(1, 2, 3)
+    _ = v.zyx
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for _ in range(n):
+            _ = v.zyx
+        del _
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size
+
+
+def measure_access_gc_collections(n=50_000):
+    """Garbage collections triggered by a long loop of `v.zyx`."""
+    v = Vector(1, 2, 3)
+    gc.collect()
+    before = sum(stat["collections"] for stat in gc.get_stats())
+    for _ in range(n):
+        _ = v.zyx
+    return sum(stat["collections"] for stat in gc.get_stats()) - before
+
+
+def measure_swizzledtuple_class(n=200):
+    """Bytes per `swizzledtuple` class."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        classes = [swizzledtuple("T", "x y z") for _ in range(n)]
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del classes
+    return size / n
+
+
+def measure_trie_node(n=1_000):
+    """Bytes per `TrieNode` of a trie built from `n` words."""
+    words = [f"w{i}" for i in range(n)]
+    tracemalloc.start()
+    try:
+        trie = Trie(words)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    def count(node):
+        return 1 + sum(count(child) for child in node.children.values())
+
+    return size / count(trie.root)
+
+
+def measurements():
+    access_bytes, access_blocks = measure_access()
+    return {
+        "access_bytes": access_bytes,
+        "access_blocks": access_blocks,
+        "access_leak_bytes": measure_access_leak(),
+        "swizzledtuple_class_bytes": measure_swizzledtuple_class(),
+        "trie_node_bytes": measure_trie_node(),
+        "access_gc_collections": measure_access_gc_collections(),
+    }
+
+
+@pytest.fixture(scope="module")
+def measured():
+    return measurements()
+
+
+@pytest.mark.parametrize("name", sorted(BUDGETS))
+def test_within_budget(measured, name):
+    assert measured[name] <= BUDGETS[name], (
+        f"{name} = {measured[name]:.1f} exceeds budget {BUDGETS[name]}"
+    )
+
+
+if __name__ == "__main__":
+    for name, value in measurements().items():
+        print(f"{name:<28} {value:12.1f}   budget {BUDGETS[name]}")
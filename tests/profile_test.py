@@ -0,0 +1,97 @@
+import os
+import sys
+
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle
+from swizzle import Profile
+
+
+@swizzle(only_attrs=["x", "y", "zz"])
+class Vector:
+    def __init__(self):
+        self.x = 1
+        self.y = 2
+        self.zz = 3
+
+
+@swizzle(meta=True)
+class Axis:
+    X = 1
+    Y = 2
+
+
+def test_record_and_roundtrip(tmp_path):
+    swizzle.start_profiling()
+    try:
+        v = Vector()
+        for _ in range(3):
+            _ = v.zzx
+        _ = v.x
+        _ = Axis.YX
+    finally:
+        profile = swizzle.stop_profiling()
+    entries = profile.entries()
+    assert entries[0]["name"] == "zzx"
+    assert entries[0]["parts"] == ["zz", "x"]
+    assert entries[0]["count"] == 3
+    assert entries[0]["qualname"] == "Vector"
+    assert [e["name"] for e in entries if e["meta"]] == ["YX"]
+    assert swizzle.stop_profiling() is None
+
+    path = tmp_path / "profile.json"
+    profile.dump(path)
+    assert Profile.load(path).entries() == entries
+
+
+def test_warmup_prebuilds_result_classes():
+    profile = Profile(
+        [
+            {
+                "module": __name__,
+                "qualname": "Vector",
+                "meta": False,
+                "name": "yzzx",
+                "parts": ["y", "zz", "x"],
+                "count": 5,
+            },
+            {
+                "module": __name__,
+                "qualname": "Vector",
+                "meta": False,
+                "name": "xq",
+                "parts": ["x", "q"],
+                "count": 1,
+            },
+        ]
+    )
+    swizzle._swizzledtuple_class.cache_clear()
+    assert swizzle.warmup(profile) == 1
+    assert swizzle._swizzledtuple_class.cache_info().currsize == 1
+    assert Vector().yzzx == (2, 3, 1)
+    assert swizzle._swizzledtuple_class.cache_info().hits == 1
+
+
+def test_warmup_applies_when_class_is_decorated_later():
+    qualname = "test_warmup_applies_when_class_is_decorated_later.<locals>.Later"
+    profile = Profile(
+        [
+            {
+                "module": __name__,
+                "qualname": qualname,
+                "meta": False,
+                "name": "ba",
+                "parts": ["b", "a"],
+                "count": 1,
+            }
+        ]
+    )
+    assert swizzle.warmup(profile) == 0
+    swizzle._swizzledtuple_class.cache_clear()
+
+    @swizzle
+    class Later:
+        a = 1
+        b = 2
+
+    assert swizzle._swizzledtuple_class.cache_info().currsize == 1
+    assert Later().ba == (2, 1)
@@ -0,0 +1,108 @@
+import datetime
+import os
+import sys
+from fractions import Fraction
+
+import pytest
+
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle
+from swizzle import SwizzleProxy, TypeSwizzler
+
+
+def test_wrap_c_types():
+    dt = datetime.datetime(2024, 5, 6, 7, 8, 9)
+    wrapped = swizzle.wrap(dt)
+    assert isinstance(wrapped, SwizzleProxy)
+    assert wrapped.yearmonthday == (2024, 5, 6)
+    assert wrapped.yearmonthday.month == 5
+    assert wrapped.hour == 7
+    assert wrapped.isoformat() == dt.isoformat()  # other attributes are forwarded
+    assert swizzle.wrap(3 + 4j).imagreal == (4.0, 3.0)
+    assert swizzle.wrap(Fraction(1, 3)).denominatornumerator == (3, 1)
+    with pytest.raises(AttributeError):
+        _ = wrapped.yearq
+
+
+def test_register_and_accessor():
+    class Reading:
+        def __init__(self):
+            self.lat = 1.0
+            self.lon = 2.0
+
+    swizzler = swizzle.register(Reading, only_attrs=["lat", "lon"], sep="_")
+    assert isinstance(swizzler, TypeSwizzler)
+    assert swizzle.wrap(Reading()).lon_lat == (2.0, 1.0)
+    lon_lat = swizzler.accessor("lon_lat")
+    assert swizzler.accessor("lon_lat") is lon_lat  # compiled once per type
+    assert lon_lat(Reading()) == (2.0, 1.0)
+    assert swizzler.get(Reading(), "lat") == 1.0
+
+    class Subclass(Reading):
+        pass
+
+    assert swizzle.wrap(Subclass()).lat_lon == (1.0, 2.0)
+    swizzle.register(Reading, only_attrs=["lat", "lon"], type=list)
+    assert swizzle.wrap(Subclass()).latlon == [1.0, 2.0]
+
+
+def test_register_errors():
+    class Empty:
+        pass
+
+    with pytest.raises(ValueError):
+        swizzle.register(Empty)
+    with pytest.raises(ValueError):
+        swizzle.register(complex, sep="a b")
+
+
+def test_wrap_infers_instance_attributes():
+    class Reading:
+        def __init__(self):
+            self.lat = 1.0
+            self.lon = 2.0
+
+    class Slotted:
+        __slots__ = ("a", "b")
+
+        def __init__(self):
+            self.a, self.b = 1, 2
+
+    @swizzle
+    class Swizzled:
+        def __init__(self):
+            self.u, self.v = 3, 4
+
+    assert swizzle.wrap(Reading()).lonlat == (2.0, 1.0)
+    assert swizzle.wrap(Slotted()).ba == (2, 1)
+    assert swizzle.wrap(Swizzled()).vu == (4, 3)
+
+
+def test_wrap_uninferable_type():
+    class Empty:
+        pass
+
+    with pytest.raises(TypeError, match=r"swizzle.register\(.*Empty, only_attrs"):
+        swizzle.wrap(Empty())
+    swizzle.register(Empty, only_attrs=["a", "b"])
+    empty = Empty()
+    empty.a, empty.b = 1, 2
+    assert swizzle.wrap(empty).ba == (2, 1)
+
+
+def test_proxy_assignment():
+    class Point:
+        def __init__(self):
+            self.x, self.y = 1, 2
+
+    point = Point()
+    wrapped = swizzle.wrap(point)
+    wrapped.x = 5
+    wrapped.yx = 7, 6
+    assert (point.x, point.y) == (6, 7)
+    wrapped.label = "p"
+    assert point.label == "p"
+    with pytest.raises(ValueError):
+        wrapped.xx = 1, 2
+    with pytest.raises(AttributeError, match="not writable"):
+        swizzle.wrap(datetime.date(2024, 5, 6)).year = 2025
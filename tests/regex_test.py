@@ -0,0 +1,50 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+from swizzle.regex import RegexSplitter
+from swizzle.trie import Trie
+
+
+def split(splitter, query):
+    try:
+        return list(splitter.split_longest_prefix(query))
+    except AttributeError as e:
+        return str(e)
+
+
+@pytest.mark.parametrize(
+    "words, sep, query",
+    [
+        (["a", "aa", "aaa"], "", "aaaaa"),
+        (["a", "ab", "abc", "abcd"], "", "abcdabcaaaaa"),
+        (["x", "y", "x_y"], "_", "x_y_x_x_y_y"),
+        (["x", "y"], "", "xyq"),
+        (["x", "y"], "_", "x_y_"),
+        (["x", "y"], "_", "xy"),
+        (["x", "y"], "__", "x__y_x"),
+        (["a+b", "c"], "", "a+bc"),
+        (["x"], "", ""),
+    ],
+)
+def test_parity_with_trie(words, sep, query):
+    assert split(RegexSplitter(words, sep), query) == split(Trie(words, sep), query)
+
+
+def test_longest_first_without_backtracking():
+    # Greedy "aa" leaves "b" unmatched; a backtracking regex would accept a + ab.
+    splitter = RegexSplitter(["a", "aa", "ab"])
+    with pytest.raises(AttributeError, match="pos 2"):
+        splitter.split_longest_prefix("aab")
+
+
+def test_error_positions():
+    splitter = RegexSplitter(["x", "y"], "_")
+    with pytest.raises(AttributeError, match="at pos 1"):
+        splitter.split_longest_prefix("xy")
+    with pytest.raises(AttributeError, match="can not be at the end"):
+        splitter.split_longest_prefix("x_")
+    with pytest.raises(AttributeError, match="substring: z at pos 2"):
+        splitter.split_longest_prefix("x_z")
@@ -0,0 +1,65 @@
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle
+from swizzle.sqlite import make_row_factory, query, row_factory
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    connection.execute(
+        'CREATE TABLE places (name TEXT, lon REAL, lat REAL, "zip code" TEXT)'
+    )
+    connection.executemany(
+        "INSERT INTO places VALUES (?, ?, ?, ?)",
+        [("a", 1.0, 2.0, "10115"), ("b", 3.0, 4.0, "20095")],
+    )
+    yield connection
+    connection.close()
+
+
+def test_row_factory(connection):
+    connection.row_factory = row_factory
+    rows = connection.execute("SELECT * FROM places").fetchall()
+    assert rows[0] == ("a", 1.0, 2.0, "10115")
+    assert rows[1].latlon == (4.0, 3.0)
+    assert rows[0]._fields == ("name", "lon", "lat", "_3")
+    again = connection.execute("SELECT * FROM places WHERE lon > 2").fetchone()
+    assert type(again) is type(rows[0])  # cached per shape
+    count = connection.execute("SELECT count(*) FROM places").fetchone()
+    assert count == (2,) and count._0 == 2
+
+
+def test_row_factory_projection(connection):
+    connection.row_factory = make_row_factory("Place", fields="lat_lon_lat", sep="_")
+    row = connection.execute("SELECT * FROM places").fetchone()
+    assert row == (2.0, 1.0, 2.0)
+    assert repr(row) == "Place(lat=2.0, lon=1.0, lat=2.0)"
+    assert row.lon_lat == (1.0, 2.0)
+
+
+def test_query(connection):
+    rows = query(
+        connection, "SELECT * FROM places WHERE lon > ?", (0,), fields="latlon"
+    )
+    assert rows.fetchall() == [(2.0, 1.0), (4.0, 3.0)]
+    rows = query(connection, "SELECT * FROM places", fields=["_3", "name"])
+    assert [row._3 for row in rows] == ["10115", "20095"]
+    assert query(connection, "SELECT name FROM places").fetchone().name == "a"
+    with pytest.raises(ValueError):
+        query(connection, "SELECT * FROM places", fields=["height"])
+    assert swizzle.sqlite.row_factory is row_factory
+
+
+def test_query_reserved_word_columns():
+    connection = sqlite3.connect(":memory:")
+    connection.execute('CREATE TABLE orders ("order" INTEGER, "group" TEXT)')
+    connection.execute("INSERT INTO orders VALUES (1, 'a')")
+    row = query(connection, "SELECT * FROM orders", fields="group_order", sep="_")
+    assert row.fetchone() == ("a", 1)
+    connection.close()
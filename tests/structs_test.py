@@ -0,0 +1,126 @@
+import mmap
+import os
+import struct
+import sys
+
+import pytest
+
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+from swizzle import swizzledstruct
+
+Vec = swizzledstruct("Vec", "x:f y:f z:f w:f")
+
+
+def make_buffer(*records):
+    return bytearray(b"".join(struct.pack("=4f", *r) for r in records))
+
+
+def test_record_layout():
+    assert Vec.size == 16
+    assert Vec._fields == ("x", "y", "z", "w")
+    assert Vec._offsets == (0, 4, 8, 12)
+
+
+def test_single_field_access():
+    rec = Vec(make_buffer((1, 2, 3, 4)))
+    assert rec.x == 1.0
+    assert rec.w == 4.0
+
+
+def test_swizzled_access():
+    rec = Vec(make_buffer((0, 0, 0, 0), (1, 2, 3, 4)), offset=Vec.size)
+    assert rec.zyx == (3.0, 2.0, 1.0)
+    assert rec.zyx.x == 1.0
+    assert rec.xxw == (1.0, 1.0, 4.0)
+    assert repr(rec) == "Vec(x=1.0, y=2.0, z=3.0, w=4.0)"
+
+
+def test_invalid_swizzle():
+    rec = Vec(make_buffer((1, 2, 3, 4)))
+    with pytest.raises(AttributeError):
+        _ = rec.xq
+
+
+def test_setter_writes_in_place():
+    buf = make_buffer((1, 2, 3, 4))
+    rec = Vec(buf)
+    rec.zx = (30, 10)
+    rec.y = 20
+    assert struct.unpack("=4f", buf) == (10.0, 20.0, 30.0, 4.0)
+
+
+def test_setter_errors():
+    rec = Vec(make_buffer((1, 2, 3, 4)))
+    with pytest.raises(ValueError):
+        rec.xy = (1, 2, 3)
+    with pytest.raises(ValueError):
+        rec.xx = (1, 2)
+    with pytest.raises(AttributeError):
+        rec.xq = (1, 2)
+
+
+def test_view_indexing_and_iteration():
+    view = Vec.view(make_buffer((1, 2, 3, 4), (5, 6, 7, 8), (9, 10, 11, 12)))
+    assert len(view) == 3
+    assert view[-1].w == 12.0
+    assert [rec.x for rec in view] == [1.0, 5.0, 9.0]
+    assert len(view[1:]) == 2
+    assert list(view.iter_unpack())[1] == (5.0, 6.0, 7.0, 8.0)
+    with pytest.raises(IndexError):
+        view[3]
+
+
+def test_view_columns_are_zero_copy():
+    buf = make_buffer((1, 2, 3, 4), (5, 6, 7, 8))
+    view = Vec.view(buf)
+    column = view.y
+    assert isinstance(column, memoryview)
+    assert column.tolist() == [2.0, 6.0]
+    Vec(buf, Vec.size).y = 60
+    assert column.tolist() == [2.0, 60.0]
+    zx = view.zx
+    assert [c.tolist() for c in zx] == [[3.0, 7.0], [1.0, 5.0]]
+
+
+def test_unaligned_columns_fall_back_to_lists():
+    Rec = swizzledstruct("Rec", "a:b b:i", byteorder=">", sep="_")
+    buf = bytearray(Rec.size * 2)
+    Rec.view(buf)[1].a_b = (3, 7)
+    assert Rec.view(buf).b_a == ([0, 7], [0, 3])
+
+
+def test_standard_size_columns():
+    Rec = swizzledstruct("Rec", "x:l y:L z:q", sep="_")
+    assert Rec.size == 16
+    buf = bytearray(struct.pack("=lLq", 1, 2, 3) + struct.pack("=lLq", -4, 5, 6))
+    view = Rec.view(buf)
+    assert list(view.x) == [1, -4]
+    assert list(view.y) == [2, 5]
+    assert list(view.z) == [3, 6]
+    assert [list(column) for column in view.z_x] == [[3, 6], [1, -4]]
+    Single = swizzledstruct("Single", "x:l")
+    assert list(Single.view(bytearray(struct.pack("=2l", 7, -8))).x) == [7, -8]
+
+
+def test_native_alignment():
+    Rec = swizzledstruct("Rec", "a:b b:d c:4s", byteorder="@", sep="_")
+    assert Rec._offsets == (0, 8, 16)
+    rec = Rec(bytearray(Rec.size))
+    rec.c_a = (b"abcd", 1)
+    assert rec.a_c == (1, b"abcd")
+
+
+def test_mmap_backing():
+    m = mmap.mmap(-1, Vec.size * 2)
+    Vec.view(m)[1].xyzw = (1, 2, 3, 4)
+    assert Vec(m, Vec.size).wzyx == (4.0, 3.0, 2.0, 1.0)
+    m.close()
+
+
+def test_invalid_layout():
+    with pytest.raises(ValueError):
+        swizzledstruct("Bad", "x:f x:f")
+    with pytest.raises(ValueError):
+        swizzledstruct("Bad", "x:2f")
+    with pytest.raises(ValueError):
+        swizzledstruct("Bad", "x")
@@ -195,3 +195,146 @@ def test_getitem():
     assert t[-2:] == (2, 3)
     assert t[:-1] == (1, 2)
     assert t[3:] == ()
+
+
+def test_make_many():
+    Point = swizzledtuple("Point", "x y z", arrange_names="z x y z")
+    points = Point._make_many([(1, 2, 3), [4, 5, 6]])
+    assert points == [(3, 1, 2, 3), (6, 4, 5, 6)]
+    assert all(type(p) is Point for p in points)
+    assert points[1].zy == (6, 5)
+    lazy = Point._make_many(iter([(1, 2, 3)]), lazy=True)
+    assert not isinstance(lazy, list)
+    assert list(lazy) == [Point(1, 2, 3)]
+    with pytest.raises(ValueError, match="Expected 3 arguments, got 2"):
+        Point._make_many([(1, 2)])
+
+
+def test_make_many_iterator_rows_and_widths():
+    Point = swizzledtuple("Point", "x y z", arrange_names="z x y z")
+    rows = [iter((1, 2, 3)), (v for v in (4, 5, 6)), range(7, 10)]
+    assert Point._make_many(rows) == [(3, 1, 2, 3), (6, 4, 5, 6), (9, 7, 8, 9)]
+    lazy = Point._make_many(((i, i, i) for i in range(2)), lazy=True)
+    assert list(lazy) == [Point(0, 0, 0), Point(1, 1, 1)]
+    with pytest.raises(ValueError, match="Expected 3 arguments, got 4"):
+        Point._make_many([(1, 2, 3), (1, 2, 3, 4)])
+    with pytest.raises(ValueError, match="Expected 3 arguments, got 4"):
+        list(Point._make_many([(1, 2, 3, 4)], lazy=True))
+    Compact = swizzledtuple("Compact", "x y", arrange_names="x x y", compact=True)
+    assert Compact._make_many([iter((1, 2))]) == [(1, 1, 2)]
+    with pytest.raises(ValueError):
+        Compact._make_many([(1, 2, 3)])
+
+
+def test_make_many_single_field():
+    One = swizzledtuple("One", "x")
+    assert One._make_many([(1,), (2,)]) == [(1,), (2,)]
+
+
+def test_from_columns():
+    Point = swizzledtuple("Point", "x y z", arrange_names="z y x", defaults=(0,))
+    points = Point._from_columns(y=[2, 5], x=[1, 4])
+    assert points == [(0, 2, 1), (0, 5, 4)]
+    assert points[1].xz == (4, 0)
+    with pytest.raises(TypeError):
+        Point._from_columns(x=[1], w=[2])
+    with pytest.raises(TypeError):
+        Point._from_columns(x=[1])
+    with pytest.raises(ValueError):
+        Point._from_columns(x=[1, 2], y=[1])
+
+
+def test_from_columns_defaults():
+    Point = swizzledtuple("Point", "x y z", defaults=(0, 9))
+    assert Point._from_columns(x=[1, 2]) == [(1, 0, 9), (2, 0, 9)]
+    assert list(Point._from_columns(x=iter([1]), lazy=True)) == [(1, 0, 9)]
+
+
+CompactPoint = swizzledtuple(
+    "CompactPoint", "x y", arrange_names="x x x y y y", compact=True
+)
+
+
+def test_compact_behaves_like_arranged_tuple():
+    t = CompactPoint(1, 2)
+    arranged = (1, 1, 1, 2, 2, 2)
+    assert len(t) == 6
+    assert list(t) == list(arranged)
+    assert t == arranged and arranged == t and not t != arranged
+    assert hash(t) == hash(arranged)
+    assert t[0] == 1 and t[-1] == 2 and t[2:4] == (1, 2)
+    assert t < (1, 1, 1, 2, 2, 3)
+    assert (0,) + t == (0,) + arranged and t + (0,) == arranged + (0,)
+    assert t * 2 == arranged * 2
+    assert t.count(1) == 3 and t.index(2) == 3 and 2 in t
+    assert "%s%s%s%s%s%s" % tuple(t) == "111222"
+    assert repr(t) == "CompactPoint(x=1, x=1, x=1, y=2, y=2, y=2)"
+
+
+def test_compact_storage_and_fields():
+    t = CompactPoint(1, 2)
+    assert tuple.__len__(t) == 2
+    assert t.x == 1 and t.y == 2
+    assert t.yx == (2, 1)
+    assert t._asdict() == {"x": 1, "y": 2}
+    assert t._replace(y=5) == (1, 1, 1, 5, 5, 5)
+    assert CompactPoint._make([3, 4]) == (3, 3, 3, 4, 4, 4)
+    assert CompactPoint._make_many([(5, 6)]) == [(5, 5, 5, 6, 6, 6)]
+    with pytest.raises(ValueError):
+        CompactPoint._make([1, 2, 3])
+
+
+def test_compact_c_level_storage():
+    t = CompactPoint(1, 2)
+    # C-level tuple protocols read the storage, not the arrangement.
+    assert "%s %s" % t == "1 2"
+    with pytest.raises(TypeError):
+        "%s %s %s %s %s %s" % t
+    assert "%s%s%s%s%s%s" % tuple(t) == "111222"
+
+
+def test_rearranged_getnewargs():
+    Point = swizzledtuple("Point", "x y z", arrange_names="z x y z")
+    p = Point(1, 2, 3)
+    assert p.__getnewargs__() == (1, 2, 3)
+    assert Point(*p.__getnewargs__()) == p
+
+
+def test_compact_pickle():
+    import pickle
+
+    t = CompactPoint(1, 2)
+    assert pickle.loads(pickle.dumps(t)) == t
+
+
+def test_compact_swizzle_results():
+    V = swizzledtuple("V", "x y z", compact=True)
+    v = V(1, 2, 3)
+    r = v.xxzyzz
+    assert r == (1, 1, 3, 2, 3, 3)
+    assert tuple.__len__(r) == 3
+    assert tuple.__len__(v.zyx) == 3
+
+
+def test_wide_swizzledtuple():
+    names = [f"c{i}" for i in range(1000)]
+    Wide = swizzledtuple(
+        "Wide", names, arrange_names=names[::-1], sep="_", defaults=[0, 0]
+    )
+    values = list(range(1000))
+    w = Wide(*values)
+    assert w == tuple(reversed(values))
+    assert w.c0 == 0 and w.c999 == 999
+    assert w.c5_c3 == (5, 3)
+    assert Wide(*values[:998]) == w._replace(c998=0, c999=0)
+    assert Wide(*values[:-1], c999=999) == w
+    assert Wide._make(values) == w
+    assert Wide._make_many([values]) == [w]
+    with pytest.raises(TypeError, match="missing required argument: 'c997'"):
+        Wide(*values[:997])
+    with pytest.raises(TypeError, match="multiple values"):
+        Wide(*values, c0=1)
+    with pytest.raises(TypeError, match="unexpected keyword"):
+        Wide(*values, c1000=1)
+    with pytest.raises(TypeError, match="positional arguments"):
+        Wide(*values, 1000)
@@ -0,0 +1,74 @@
+import os
+import sys
+from array import array
+from dataclasses import dataclass
+
+import pytest
+
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle
+
+f64 = swizzle.typed("d")
+
+
+@swizzle(type=f64)
+class Vector:
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+@swizzle(type=swizzle.typed())
+@dataclass
+class Cell:
+    row: int
+    col: int
+
+
+@swizzle(type=swizzle.typed(), only_attrs=["a", "b"])
+class Mixed:
+    def __init__(self):
+        self.a = 1
+        self.b = 2.5
+
+
+def test_typed_results():
+    v = Vector(1.0, 2.0, 3)
+    assert v.zyx == array("d", [3.0, 2.0, 1.0])
+    assert v.x == 1.0  # single attributes stay unpacked
+    view = memoryview(v.xyz)
+    assert (view.format, view.nbytes) == ("d", 24)
+    assert repr(f64) == "typed('d')"
+
+
+def test_typecode_inference():
+    assert Cell(1, 2).colrow == array("q", [2, 1])
+    assert Mixed().ab == array("d", [1.0, 2.5])
+    assert Mixed().ba.typecode == "d"  # inferred once per class
+    with pytest.raises(ValueError):
+        swizzle.typed("Z")
+
+
+def test_read_into_buffer():
+    v = Vector(1.0, 2.0, 3.0)
+    out = array("d", bytes(8 * 6))
+    assert f64.read(v, "zyx", out, offset=3) is out
+    assert list(out) == [0, 0, 0, 3.0, 2.0, 1.0]
+    ints = array("q", bytes(16))
+    swizzle.typed().read(swizzle.t("T", "x y")(1, 2), "yx", ints)
+    assert list(ints) == [2, 1]
+    assert swizzle.typed().read(Cell(4, 5), "rowcol") == array("q", [4, 5])
+    with pytest.raises(IndexError):
+        f64.read(v, "xyz", out, offset=4)
+    with pytest.raises(TypeError):
+        f64.read(object(), "xy", out)
+
+
+def test_numpy_reads_without_copy():
+    np = pytest.importorskip("numpy")
+    result = Vector(1.0, 2.0, 3.0).zyx
+    values = np.frombuffer(result)
+    assert values.tolist() == [3.0, 2.0, 1.0]
+    result[0] = 7.0
+    assert values[0] == 7.0
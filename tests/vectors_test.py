@@ -0,0 +1,114 @@
+import copy
+import os
+import pickle
+import sys
+
+import pytest
+
+sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
+import swizzle
+from swizzle import vec2, vec3, vec4
+
+
+def test_components_and_aliases():
+    v = vec4(1, 2, 3, 4)
+    assert (v.x, v.y, v.z, v.w) == (1, 2, 3, 4)
+    assert (v.r, v.g, v.b, v.a) == (1, 2, 3, 4)
+    assert (v.s, v.t, v.p, v.q) == (1, 2, 3, 4)
+    assert v == (1, 2, 3, 4)
+    assert repr(v) == "vec4(1, 2, 3, 4)"
+
+
+def test_swizzles_return_vectors_of_their_length():
+    v = vec3(1, 2, 3)
+    assert v.zyx == (3, 2, 1) and type(v.zyx) is vec3
+    assert v.xy == (1, 2) and type(v.xy) is vec2
+    assert v.rgbr == (1, 2, 3, 1) and type(v.rgbr) is vec4
+    assert v.ts == (2, 1)
+    assert vec2(1, 2).yyyy == (2, 2, 2, 2)
+    with pytest.raises(AttributeError):
+        _ = v.xg  # components of different sets
+    with pytest.raises(AttributeError):
+        _ = v.w
+    with pytest.raises(AttributeError):
+        _ = v.xyzxy
+
+
+def test_constructors():
+    v = vec3(1, 2, 3)
+    assert vec3(7) == (7, 7, 7)
+    assert vec4(v.xy, 0, 1) == (1, 2, 0, 1)
+    assert vec4(v, 1.0) == (1, 2, 3, 1.0)
+    assert vec3([4, 5, 6]) == (4, 5, 6)
+    with pytest.raises(TypeError):
+        vec3(1, 2)
+    with pytest.raises(TypeError):
+        vec2(v)
+    assert pickle.loads(pickle.dumps(v)) == v
+    assert type(copy.copy(v)) is vec3
+
+
+def test_arithmetic():
+    v = vec3(1, 2, 3)
+    assert v + 1 == (2, 3, 4) and type(v + 1) is vec3
+    assert 1 + v == (2, 3, 4)
+    assert v + v == (2, 4, 6)
+    assert v * (2, 3, 4) == (2, 6, 12)
+    assert 10 - v == (9, 8, 7)
+    assert v / 2 == (0.5, 1.0, 1.5)
+    assert 6 // v == (6, 3, 2)
+    assert v**2 == (1, 4, 9)
+    assert -v == (-1, -2, -3)
+    assert abs(-v) == v
+    assert v.dot(v) == 14
+    assert vec2(3, 4).length() == 5.0
+    assert (v.zyx * 2).xy == (6, 4)
+    with pytest.raises(ValueError):
+        v + vec2(1, 2)
+    with pytest.raises(TypeError):
+        v + "a"
+
+
+BACKENDS = ["array"]
+try:
+    import numpy  # noqa: F401
+
+    BACKENDS.append("numpy")
+except ImportError:
+    pass
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_batches(backend):
+    positions = vec3.array([(1, 2, 3), (4, 5, 6)], backend=backend)
+    assert len(positions) == 2
+    assert list(positions.x) == [1.0, 4.0]
+    assert positions.zyx.tolist() == [(3, 2, 1), (6, 5, 4)]
+    assert (positions.zyx * 2).tolist() == [(6, 4, 2), (12, 10, 8)]
+    assert (1 + positions.xy).tolist() == [(2, 3), (5, 6)]
+    assert (positions - vec3(1, 1, 1))[1] == (3, 4, 5)
+    assert (positions + positions)[0] == (2, 4, 6)
+    assert list(positions.dot(positions)) == [14.0, 77.0]
+    assert list(vec2.array([(3, 4)], backend=backend).length()) == [5.0]
+    assert type(positions[0]) is vec3
+    assert positions[1:].tolist() == [(4, 5, 6)]
+
+    positions.zx = positions.xz
+    assert positions.tolist() == [(3, 2, 1), (6, 5, 4)]
+    positions.y = 0
+    positions[0] = vec3(7, 8, 9)
+    assert positions.tolist() == [(7, 8, 9), (6, 0, 4)]
+    with pytest.raises(ValueError):
+        positions.xx = positions.xy
+    with pytest.raises(AttributeError):
+        _ = positions.xw
+
+    zeros = vec4.array(3, backend=backend)
+    assert zeros.tolist() == [(0, 0, 0, 0)] * 3
+    assert repr(zeros) == "VectorArray(vec4, len=3)"
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        vec3.array(2, backend="gpu")
+    assert "vec3" in swizzle.__all__